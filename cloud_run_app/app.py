@@ -15,9 +15,14 @@ if REPO_ROOT not in sys.path:
 from gospel_tts_app.feeds import FEED_URLS
 from gospel_tts_app.rss_client import RSSClient
 from gospel.audio_generator import AudioGenerator
+from gospel.audio_reuse import create_saint_episode
+from gospel.deadline import Deadline, DeadlineExceeded
 from gospel.gospel_podcast_publisher import GospelPodcastPublisher
-from gospel.html_scraper import VaticanHTMLScraper
-from gospel.saint_scraper import fetch_saints, _LANG_CFG as SAINT_LANGS
+from gospel import circuit_breaker, content_store, deadline, feed_cache, host_limiter, http_client, lookahead
+from gospel.html_scraper import VaticanHTMLScraper, fingerprint_stats
+from gospel.prefetch import Prefetched, prefetch_liturgy, prefetch_saints
+from gospel.text_normalizer import collect_stages
+from gospel.saint_scraper import _LANG_CFG as SAINT_LANGS
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_DIR = os.path.join(BASE_DIR, 'gospel', 'configs')
@@ -41,35 +46,82 @@ def _load_voice(lang: str) -> str:
         return lang  # falls back to _VOICES[lang] inside AudioGenerator
 
 
+def _audio_generator(voice: str, dl: Deadline) -> AudioGenerator:
+    """AudioGenerator for *voice*; Edge TTS when too little time is left for Cloud TTS."""
+    audio_gen = AudioGenerator(voice=voice, speed='normal')
+    if audio_gen.provider == "google" and not dl.has(deadline.GOOGLE_MIN_S):
+        logger.warning("%.0f s left: synthesising with Edge TTS instead of Cloud TTS", dl.remaining())
+        audio_gen = AudioGenerator(voice=voice, speed='normal', provider="edge")
+    return audio_gen
+
+
 # ── core publish logic ────────────────────────────────────────────────────────
 
-def _do_publish(lang: str, force: bool = False) -> Tuple[Dict, int]:
+def _do_publish(lang: str, force: bool = False,
+                prefetched: Optional[Prefetched] = None,
+                dl: Optional[Deadline] = None) -> Tuple[Dict, int]:
+    """Run :func:`_publish_language` within *dl* and log where text normalisation spent its time.
+
+    *dl* defaults to a fresh ``GOSPEL_REQUEST_DEADLINE_S`` budget; running
+    out of it returns a 504 naming the stage that could not start.
+    """
+    dl = dl or Deadline(deadline.REQUEST_BUDGET_S)
+    with collect_stages() as stages, deadline.scope(dl):
+        try:
+            result, status = _publish_language(lang, force, prefetched)
+        except DeadlineExceeded as e:
+            logger.error("[%s] %s", lang, e)
+            result, status = {"lang": lang, "error": str(e), "stage": e.stage}, 504
+    if stages.paths or stages.seconds:
+        logger.info("[%s] normalizer stages: %s", lang, stages.format())
+    return result, status
+
+
+def _publish_language(lang: str, force: bool = False,
+                      prefetched: Optional[Prefetched] = None) -> Tuple[Dict, int]:
     """Generate audio + update Firebase RSS for one language.
 
     Tries the Vatican News HTML scraper first (clean section structure), then
     falls back to the RSS feed description when the scraper fails.
+    *prefetched* is this language's result from :func:`prefetch_liturgy`;
+    when given, the page is not fetched again.
 
     When *force* is True the idempotency check is skipped, allowing today's
-    episode to be regenerated even if it was already published.
+    episode to be regenerated even if it was already published, and the
+    page is scraped again rather than read from the content store.
+
+    Runs within the current deadline: with little time left an already
+    scraped day or the RSS feed replaces the HTML scrape, and Edge TTS
+    replaces Cloud TTS.
 
     Returns (result_dict, http_status_code).
     """
     if lang not in FEED_URLS:
         return {"error": f"unsupported lang: {lang}"}, 400
 
+    dl = deadline.current()
     cfg_path = os.path.join(CONFIG_DIR, f"{lang}.json")
     publisher = GospelPodcastPublisher(cfg_path)
     publisher.load_existing_feed()
 
-    audio_gen = AudioGenerator(voice=_load_voice(lang), speed='normal')
-
     title = description = pub_date = guid = ""
     segments: Optional[list] = None
 
     # --- Attempt 1: Vatican News HTML scraper (best structural quality) ---
     try:
         scraper = VaticanHTMLScraper(lang)
-        title, segments = scraper.fetch_segments()
+        if prefetched is None:
+            if dl.has(deadline.HTML_MIN_S):
+                title, segments = lookahead.liturgy_segments(lang, fresh=force)
+            else:
+                stored = lookahead.load(lookahead.KIND_LITURGY, lang)
+                if stored is None:
+                    raise DeadlineExceeded("the HTML scraper")
+                title, segments = stored
+        elif prefetched.ok:
+            title, segments = prefetched.value
+        else:
+            raise prefetched.error
         guid = scraper.day_url()
         pub_date = datetime.date.today().strftime("%a, %d %b %Y 00:00:00 +0000")
         description = title
@@ -104,6 +156,7 @@ def _do_publish(lang: str, force: bool = False) -> Tuple[Dict, int]:
             return {"lang": lang, "title": title, "skipped": True, "rss": publisher.rss_blob_path}, 200
 
     # Generate audio (use structured segments from scraper when available)
+    audio_gen = _audio_generator(_load_voice(lang), dl)
     if segments is not None:
         episode = audio_gen.create_episode_from_segments(title, segments)
     else:
@@ -128,7 +181,8 @@ def _do_publish(lang: str, force: bool = False) -> Tuple[Dict, int]:
         return {"error": "rss upload failed"}, 500
 
     logger.info("[%s] published: %s", lang, title)
-    return {"lang": lang, "title": title, "audio_url": audio_url, "rss": publisher.rss_blob_path}, 200
+    return {"lang": lang, "title": title, "audio_url": audio_url, "tts_provider": audio_gen.provider,
+            "rss": publisher.rss_blob_path}, 200
 
 
 def _do_publish_history(lang: str) -> Tuple[Dict, int]:
@@ -192,6 +246,19 @@ def healthz():
     return jsonify({"status": "ok"})
 
 
+@app.get('/stats')
+def stats():
+    """Request, limiter, page-structure, feed cache, content store and circuit breaker state."""
+    return jsonify({
+        "http": http_client.http_stats(),
+        "limiter": host_limiter.limiter_stats(),
+        "page_fingerprint": fingerprint_stats(),
+        "feed_cache": feed_cache.feed_cache_stats(),
+        "content_store": content_store.store_stats(),
+        "circuit_breakers": circuit_breaker.breaker_states(),
+    }), 200
+
+
 @app.post('/publish')
 def publish():
     """Publish one language episode. Query params: ?lang=<code>[&force=1]"""
@@ -203,22 +270,50 @@ def publish():
 
 @app.post('/publish-all')
 def publish_all():
-    """Publish all supported languages sequentially and return a per-language summary.
+    """Publish all supported languages and return a per-language summary.
 
+    All languages' pages are scraped concurrently first; synthesis and upload
+    then run language by language, each within an equal share of the time
+    left in the request's deadline.
     A 207 Multi-Status is returned if any language fails so Cloud Scheduler
     treats the job as failed and can alert/retry.
     Query param: ?force=1 to regenerate even if already published today.
     """
     force = request.args.get('force', '').lower() in ('1', 'true', 'yes')
+    batch = Deadline(deadline.REQUEST_BUDGET_S)
+    with deadline.scope(batch):
+        scraped = prefetch_liturgy(FEED_URLS, use_lookahead=not force)
     results = {}
-    for lang in FEED_URLS:
-        result, status = _do_publish(lang, force=force)
+    langs = list(FEED_URLS)
+    for i, lang in enumerate(langs):
+        result, status = _do_publish(lang, force=force, prefetched=scraped.get(lang),
+                                     dl=batch.share(len(langs) - i))
         results[lang] = {"status": status, "detail": result}
 
     overall = 200 if all(v["status"] == 200 for v in results.values()) else 207
     return jsonify(results), overall
 
 
+@app.post('/prefetch')
+def prefetch():
+    """Scrape and normalise upcoming days ahead of publishing.
+
+    Query params: ?days=N (default GOSPEL_LOOKAHEAD_DAYS, today included)
+    &lang=<code> (omit for all) &kind=liturgy|saints (omit for both).
+    Days whose pages are not published yet are reported, not failed.
+    """
+    try:
+        days = int(request.args.get('days', lookahead.DEFAULT_DAYS))
+        kinds = lookahead.parse_kinds(request.args.get('kind', 'all'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    lang = request.args.get('lang')
+    if lang and lang not in FEED_URLS:
+        return jsonify({"error": f"unsupported lang: {lang}"}), 400
+    langs = [lang] if lang else list(FEED_URLS)
+    return jsonify(lookahead.run(langs, max(1, min(days, 14)), kinds)), 200
+
+
 @app.post('/publish-history')
 def publish_history():
     """Backfill all available RSS entries for one or all languages.
@@ -239,9 +334,23 @@ def publish_history():
 
 # ── saint publish logic ───────────────────────────────────────────────────────
 
-def _do_publish_saint(lang: str) -> Tuple[Dict, int]:
+def _do_publish_saint(lang: str, prefetched: Optional[Prefetched] = None,
+                      dl: Optional[Deadline] = None) -> Tuple[Dict, int]:
+    """Run :func:`_publish_saint_language` within *dl* (as :func:`_do_publish`)."""
+    with deadline.scope(dl or Deadline(deadline.REQUEST_BUDGET_S)):
+        try:
+            return _publish_saint_language(lang, prefetched)
+        except DeadlineExceeded as e:
+            logger.error("[saint/%s] %s", lang, e)
+            return {"lang": lang, "error": str(e), "stage": e.stage}, 504
+
+
+def _publish_saint_language(lang: str, prefetched: Optional[Prefetched] = None) -> Tuple[Dict, int]:
     """Scrape Vatican News Saint of the Day, generate audio and publish for *lang*.
 
+    *prefetched* is this language's result from :func:`prefetch_saints`;
+    when given, the pages are not fetched again.
+
     Returns (result_dict, http_status_code).
     """
     if lang not in SAINT_LANGS:
@@ -256,11 +365,15 @@ def _do_publish_saint(lang: str) -> Tuple[Dict, int]:
         return {"error": f"saint config not found: {cfg_path}"}, 500
 
     voice_key = config.get("voice_key", f"{lang}-IT-Neural2-C")
-    audio_gen = AudioGenerator(voice=voice_key, speed="normal")
 
     # Scrape Vatican News
     try:
-        title, segments = fetch_saints(lang)
+        if prefetched is None:
+            title, segments = lookahead.saint_segments(lang)
+        elif prefetched.ok:
+            title, segments = prefetched.value
+        else:
+            raise prefetched.error
         logger.info("[saint/%s] scraped %d saint(s): %s", lang, len(segments), title)
     except Exception as e:
         logger.error("[saint/%s] scrape error: %s", lang, e)
@@ -279,9 +392,12 @@ def _do_publish_saint(lang: str) -> Tuple[Dict, int]:
         logger.info("[saint/%s] already published: %s", lang, title)
         return {"lang": lang, "title": title, "skipped": True, "rss": publisher.rss_blob_path}, 200
 
-    # Generate audio
+    # Generate audio; last year's body is reused when the saints' text is unchanged
+    audio_gen = _audio_generator(voice_key, deadline.current())
     try:
-        episode = audio_gen.create_episode_from_segments(title, segments)
+        episode = create_saint_episode(audio_gen, title, segments, lang, today, publisher)
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error("[saint/%s] audio generation error: %s", lang, e)
         return {"error": f"audio generation failed: {e}"}, 500
@@ -320,7 +436,7 @@ def _do_publish_saint(lang: str) -> Tuple[Dict, int]:
         return {"error": "rss upload failed"}, 500
 
     logger.info("[saint/%s] published: %s", lang, title)
-    return {"lang": lang, "title": title, "audio_url": audio_url, "rss": publisher.rss_blob_path}, 200
+    return {"lang": lang, "title": title, "audio_url": audio_url, "audio_reused": episode.get("reused", False), "rss": publisher.rss_blob_path}, 200
 
 
 @app.post('/publish-saint')
@@ -333,10 +449,18 @@ def publish_saint():
 
 @app.post('/publish-saint-all')
 def publish_saint_all():
-    """Publish Saint of the Day for all supported languages sequentially."""
+    """Publish Saint of the Day for all supported languages.
+
+    Listing and detail pages for every language are scraped concurrently
+    before synthesis starts.
+    """
+    batch = Deadline(deadline.REQUEST_BUDGET_S)
+    with deadline.scope(batch):
+        scraped = prefetch_saints(SAINT_LANGS)
     results = {}
-    for lang in SAINT_LANGS:
-        result, status = _do_publish_saint(lang)
+    for i, lang in enumerate(SAINT_LANGS):
+        result, status = _do_publish_saint(lang, prefetched=scraped.get(lang),
+                                           dl=batch.share(len(SAINT_LANGS) - i))
         results[lang] = {"status": status, "detail": result}
     overall = 200 if all(v["status"] == 200 for v in results.values()) else 207
     return jsonify(results), overall
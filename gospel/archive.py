@@ -0,0 +1,349 @@
+"""Historical archive of Vatican News liturgy and saint pages.
+
+A crawl walks every day of a date range for the chosen languages, using the
+scrapers' ``day_url`` helpers, and appends one record per page to an
+append-only archive: the raw HTML (plus, for saints, the detail pages) and
+the segments built from it.  The archive feeds voice regeneration
+(``republish_month --archive``) and the offline parser benchmark
+(``html_parser_bench --archive``) without touching the network.
+
+Layout under the archive directory::
+
+    {kind}/{lang}/{shard}.jsonl.zst   records of one month, one JSON line each
+    {kind}/{lang}/index.jsonl         one line per crawled day: key, shard,
+                                      offset and length of its record
+
+Liturgy days are keyed ``YYYY-MM-DD`` and sharded by ``YYYY-MM``; saint
+pages carry no year, so each calendar day is crawled once, keyed ``MM-DD``
+and sharded by ``MM``.  Every record is its own compressed frame, so a shard
+still decompresses as a whole to JSONL (``zstd -dc``), and a day is read
+through the index by seeking to its frame.  Shards are zstd-compressed when
+the ``zstandard`` package is installed, else gzip (``.jsonl.gz``); readers
+handle both.
+
+Crawls are resumable: a day already in the index is skipped.  A page that
+answered 4xx, or that was fetched but could not be parsed (its HTML is kept),
+is recorded as failed and retried only with ``--retry-failed``; transient
+errors (timeouts, 5xx) are not recorded and so are retried by the next run.
+Requests go through the per-host limiter like any other scrape, and days
+start no closer than ``--interval`` seconds apart (see gospel/date_range.py).
+
+Usage::
+
+    python -m gospel.archive --start 2023-01-01                # up to today, all languages
+    python -m gospel.archive --start 2024-01-01 --end 2024-12-31 --langs it,en --kinds liturgy
+"""
+
+import argparse
+import datetime
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import requests
+
+from gospel import html_scraper, saint_index, saint_scraper
+from gospel.date_range import dates_between, iter_days
+from gospel.html_scraper import VaticanHTMLScraper
+from gospel.lookahead import KIND_SAINTS, KINDS, SUPPORTED_LANGS
+from gospel.segments import Segment
+from gospel.text_normalizer import normalizer_version
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR = os.environ.get(
+    "GOSPEL_ARCHIVE_DIR", os.path.join(tempfile.gettempdir(), "gospel_archive")
+)
+
+CODECS = ("zst", "gz")
+DEFAULT_CODEC = "zst" if zstandard is not None else "gz"
+ZSTD_LEVEL = 10
+GZIP_LEVEL = 6
+
+
+# ---------------------------------------------------------------------------
+# Codec
+# ---------------------------------------------------------------------------
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        if zstandard is None:
+            raise RuntimeError("This archive has zstd shards: pip install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def day_key(kind: str, date: datetime.date) -> str:
+    """Index key of *date*: ``YYYY-MM-DD`` for liturgy, ``MM-DD`` for saints."""
+    return saint_index.day_key(date) if kind == KIND_SAINTS else date.isoformat()
+
+
+# ---------------------------------------------------------------------------
+# Archive
+# ---------------------------------------------------------------------------
+
+class Archive:
+    """An archive directory, read and appended to through its per-(kind, lang) indexes."""
+
+    def __init__(self, root: str = ARCHIVE_DIR, codec: Optional[str] = None):
+        codec = codec or DEFAULT_CODEC
+        if codec not in CODECS:
+            raise ValueError(f"Unknown archive codec: {codec!r} (expected one of {CODECS})")
+        if codec == "zst" and zstandard is None:
+            raise RuntimeError("zstd shards need the zstandard package (pip install zstandard)")
+        self.root = root
+        self.codec = codec
+        self._lock = threading.Lock()
+        self._indexes: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+
+    def _dir(self, kind: str, lang: str) -> str:
+        return os.path.join(self.root, kind, lang)
+
+    def index(self, kind: str, lang: str) -> Dict[str, Dict]:
+        """``{key: entry}`` of every crawled day; the latest line of a key wins."""
+        with self._lock:
+            return dict(self._index(kind, lang))
+
+    def _index(self, kind: str, lang: str) -> Dict[str, Dict]:
+        """The loaded index (call under _lock)."""
+        cached = self._indexes.get((kind, lang))
+        if cached is not None:
+            return cached
+        index: Dict[str, Dict] = {}
+        try:
+            with open(os.path.join(self._dir(kind, lang), "index.jsonl"), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue    # a line cut short by an interrupted crawl
+                    index[entry["key"]] = entry
+        except OSError:
+            pass
+        self._indexes[(kind, lang)] = index
+        return index
+
+    def _add_index(self, kind: str, lang: str, entry: Dict) -> None:
+        """Append *entry* to the index (call under _lock)."""
+        with open(os.path.join(self._dir(kind, lang), "index.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._index(kind, lang)[entry["key"]] = entry
+
+    def append(self, record: Dict) -> None:
+        """Append *record* (a crawled page) to its shard and index it."""
+        kind, lang, key = record["kind"], record["lang"], record["key"]
+        shard = f"{key.rsplit('-', 1)[0]}.jsonl.{self.codec}"
+        frame = _compress((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"), self.codec)
+        with self._lock:
+            os.makedirs(self._dir(kind, lang), exist_ok=True)
+            with open(os.path.join(self._dir(kind, lang), shard), "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(frame)
+            # The frame is complete before the index points at it.
+            self._add_index(kind, lang, {
+                "key": key, "date": record["date"], "ok": not record.get("error"),
+                "error": record.get("error", ""), "shard": shard,
+                "offset": offset, "length": len(frame),
+            })
+
+    def note_failure(self, kind: str, lang: str, date: datetime.date, error: str) -> None:
+        """Record that the page of *date* could not be fetched (no shard record)."""
+        with self._lock:
+            os.makedirs(self._dir(kind, lang), exist_ok=True)
+            self._add_index(kind, lang, {
+                "key": day_key(kind, date), "date": date.isoformat(), "ok": False, "error": error,
+            })
+
+    def read(self, kind: str, lang: str, date: datetime.date) -> Optional[Dict]:
+        """The archived record of *date*, or None when there is none."""
+        with self._lock:
+            entry = self._index(kind, lang).get(day_key(kind, date))
+        return self._read_entry(kind, lang, entry) if entry else None
+
+    def _read_entry(self, kind: str, lang: str, entry: Dict) -> Optional[Dict]:
+        if not entry.get("shard"):
+            return None
+        with open(os.path.join(self._dir(kind, lang), entry["shard"]), "rb") as f:
+            f.seek(entry["offset"])
+            frame = f.read(entry["length"])
+        codec = entry["shard"].rsplit(".", 1)[1]
+        return json.loads(_decompress(frame, codec))
+
+    def records(self, kind: str, lang: str, ok_only: bool = True) -> Iterator[Dict]:
+        """Every archived record of (*kind*, *lang*), in key order."""
+        for _, entry in sorted(self.index(kind, lang).items()):
+            if ok_only and not entry["ok"]:
+                continue
+            record = self._read_entry(kind, lang, entry)
+            if record is not None:
+                yield record
+
+    def segments(self, kind: str, lang: str, date: datetime.date
+                 ) -> Optional[Tuple[str, List[Segment]]]:
+        """``(title, segments)`` of *date* from the archive, or None when not archived.
+
+        Segments built by another normaliser version are rebuilt from the
+        archived HTML, as the scrapers would build them today.
+        """
+        record = self.read(kind, lang, date)
+        if record is None or not record.get("html"):
+            return None
+        if record.get("segments") and record.get("normalizer") == normalizer_version():
+            return record["title"], [Segment.from_dict(s) for s in record["segments"]]
+        if kind == KIND_SAINTS:
+            return saint_scraper.build_saints(lang, date, record["html"],
+                                              detail_pages=dict(record.get("detail_pages") or {}))
+        return VaticanHTMLScraper(lang).page_segments(record["html"], date, url=record["url"])
+
+    # -- crawling ------------------------------------------------------------
+
+    def crawl_day(self, kind: str, lang: str, date: datetime.date) -> Tuple[str, List[Segment]]:
+        """Fetch, build and archive the page of *date*; return ``(title, segments)``."""
+        if kind == KIND_SAINTS:
+            url = saint_scraper.day_url(lang, date)
+            fetch = saint_scraper._fetch
+        else:
+            url = html_scraper.day_url(lang, date)
+            fetch = lambda u: html_scraper._fetch(u, date=date)
+        try:
+            html = fetch(url)
+        except requests.HTTPError as e:
+            if e.response is not None and 400 <= e.response.status_code < 500:
+                self.note_failure(kind, lang, date, str(e))
+            raise
+
+        record = {
+            "kind": kind, "lang": lang, "date": date.isoformat(), "key": day_key(kind, date),
+            "url": url, "html": html, "normalizer": normalizer_version(), "fetched_at": time.time(),
+        }
+        try:
+            if kind == KIND_SAINTS:
+                record["detail_pages"] = {}
+                title, segments = saint_scraper.build_saints(
+                    lang, date, html, detail_pages=record["detail_pages"])
+            else:
+                title, segments = VaticanHTMLScraper(lang).page_segments(html, date, url=url)
+        except Exception as e:
+            # Keep the page: it is what a parser fix will be tested against.
+            record["error"] = str(e)
+            self.append(record)
+            raise
+        record["title"] = title
+        record["segments"] = [seg.to_dict() for seg in segments]
+        self.append(record)
+        return title, segments
+
+
+def crawl(archive: Archive, kinds: Iterable[str], langs: Iterable[str],
+          start: datetime.date, end: Optional[datetime.date] = None,
+          retry_failed: bool = False, max_workers: Optional[int] = None,
+          min_interval: Optional[float] = None) -> Dict:
+    """Archive every day from *start* to *end* (default today) not archived yet.
+
+    Returns ``{kind: {lang: {"archived", "failed", "skipped"}}}``.
+    """
+    end = min(end or datetime.date.today(), datetime.date.today())
+    dates = dates_between(start, end)
+    langs = list(langs)
+    report: Dict = {}
+    for kind in kinds:
+        report[kind] = {}
+        for lang in langs:
+            index = archive.index(kind, lang)
+            todo: Dict[str, datetime.date] = {}
+            skipped = 0
+            for date in dates:
+                key = day_key(kind, date)
+                if key in todo:
+                    continue
+                entry = index.get(key)
+                if entry is not None and (entry["ok"] or not retry_failed):
+                    skipped += 1
+                    continue
+                todo[key] = date
+            counts = {"archived": 0, "failed": 0, "skipped": skipped}
+            fetch = lambda date, kind=kind, lang=lang: archive.crawl_day(kind, lang, date)
+            for day in iter_days(fetch, list(todo.values()), max_workers, min_interval):
+                if day.ok:
+                    counts["archived"] += 1
+                else:
+                    counts["failed"] += 1
+                    logger.warning("archive: %s/%s/%s failed (%s)", kind, lang, day.date, day.error)
+            logger.info("archive: %s/%s: %d archived, %d failed, %d already done",
+                        kind, lang, counts["archived"], counts["failed"], skipped)
+            report[kind][lang] = counts
+    return report
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def parse_langs(value: str) -> List[str]:
+    if value.lower() == "all":
+        return SUPPORTED_LANGS
+    langs = [x.strip().lower() for x in value.split(",") if x.strip()]
+    invalid = [x for x in langs if x not in SUPPORTED_LANGS]
+    if invalid:
+        raise ValueError(f"Unsupported languages: {', '.join(invalid)}")
+    return langs
+
+
+def parse_kinds(value: str) -> List[str]:
+    kinds = [x.strip().lower() for x in value.split(",") if x.strip()]
+    invalid = [x for x in kinds if x not in KINDS]
+    if invalid:
+        raise ValueError(f"Unsupported kinds: {', '.join(invalid)} (expected {', '.join(KINDS)})")
+    return kinds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Crawl Vatican News pages into the archive.")
+    parser.add_argument("--start", type=datetime.date.fromisoformat, required=True,
+                        help="First day (YYYY-MM-DD)")
+    parser.add_argument("--end", type=datetime.date.fromisoformat, default=None,
+                        help="Last day (YYYY-MM-DD, default today)")
+    parser.add_argument("--langs", default="all", help="Comma-separated language codes or 'all'")
+    parser.add_argument("--kinds", default=",".join(KINDS), help="Comma-separated: liturgy,saints")
+    parser.add_argument("--dir", default=ARCHIVE_DIR, help="Archive directory")
+    parser.add_argument("--codec", choices=CODECS, default=None,
+                        help=f"Shard compression (default {DEFAULT_CODEC})")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="Crawl again the days recorded as failed")
+    parser.add_argument("--workers", type=int, default=None, help="Days crawled at once")
+    parser.add_argument("--interval", type=float, default=None,
+                        help="Minimum seconds between two day starts")
+    args = parser.parse_args()
+
+    try:
+        langs = parse_langs(args.langs)
+        kinds = parse_kinds(args.kinds)
+        archive = Archive(args.dir, args.codec)
+    except (ValueError, RuntimeError) as e:
+        parser.error(str(e))
+        return
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    report = crawl(archive, kinds, langs, args.start, args.end, args.retry_failed,
+                   args.workers, args.interval)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
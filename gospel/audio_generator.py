@@ -18,12 +18,15 @@ try:
 except Exception:
     edge_tts = None
 
+from gospel import deadline
+from gospel.segments import KIND_POPE, PAUSE, QEND, QSTART, Segment, SegmentLike, as_segment
 from gospel.text_normalizer import normalize_for_tts, build_liturgy_segments
 
 # Break between liturgy sections (used in SSML <break> tags).
 SECTION_SILENCE_S = 2.5
 _PAUSE_DURATION_S = 0.3   # semicolon pauses — short; Neural2 paces naturally
 _SSML_BYTE_LIMIT  = 4800  # conservative safety margin (Cloud TTS limit is 5000)
+_TTS_TIMEOUT_S    = 120.0  # per TTS call; capped further by the current deadline
 
 # Neural2 male voices per supported language.
 _VOICES: Dict[str, str] = {
@@ -97,58 +100,6 @@ def _strip_xml_illegal(text: str) -> str:
     return re.sub(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]", " ", text)
 
 
-def _balance_prosody_tags(ssml_fragment: str) -> str:
-    """Remove orphaned </prosody> closers and add missing </prosody> closers.
-
-    Quote markers can be unbalanced when language-specific quotation characters
-    are misidentified (e.g. German „text" uses U+201E to open and U+201C to
-    close, but U+201C is also mapped to __QSTART__ by the normaliser).
-    This results in orphaned </prosody> tags (closer at depth 0) or unclosed
-    <prosody> blocks — both cause Cloud TTS Neural2 to return 400 Invalid SSML.
-    """
-    _tag_re = re.compile(r'(<prosody\b[^>]*>|</prosody>)', re.IGNORECASE)
-    tokens = _tag_re.split(ssml_fragment)
-    out: list[str] = []
-    depth = 0
-    for tok in tokens:
-        if re.match(r'<prosody\b', tok, re.IGNORECASE):
-            depth += 1
-            out.append(tok)
-        elif re.match(r'</prosody>', tok, re.IGNORECASE):
-            if depth > 0:
-                depth -= 1
-                out.append(tok)
-            # else: orphaned closer — silently drop it
-        else:
-            out.append(tok)
-    # Close any still-open prosody blocks
-    while depth > 0:
-        out.append('</prosody>')
-        depth -= 1
-    return ''.join(out)
-
-
-def _escape_and_mark(text: str) -> str:
-    """HTML-escape plain text and replace audio markers with SSML tags.
-
-    Markers produced by text_normalizer:
-      __PAUSE__  -> short break (semicolon pause)
-      __QSTART__ -> open prosody for scripture guillemet quote (deeper pitch)
-      __QEND__   -> close prosody
-
-    NOTE: Do NOT use this for text that will be wrapped in <emphasis> or other
-    structural tags — use _escape_header() instead, which skips break injection.
-    """
-    safe = html.escape(_strip_xml_illegal(text))
-    safe = safe.replace("__PAUSE__",  f'<break time="{_PAUSE_DURATION_S}s"/>')
-    safe = safe.replace("__QSTART__", '<break time="200ms"/><prosody pitch="-6%" rate="97%">')
-    safe = safe.replace("__QEND__",   '</prosody><break time="150ms"/>')
-    # Neural2 voices already produce natural sentence-boundary pauses at . ! ?
-    # Adding explicit <break> tags on top creates a double-pause that sounds choppy.
-    # We rely on Neural2's built-in prosody instead.
-    return safe
-
-
 def _escape_header(text: str) -> str:
     """HTML-escape text for use inside structural SSML tags like <emphasis>.
 
@@ -162,11 +113,33 @@ def _escape_header(text: str) -> str:
     return safe
 
 
-def _section_to_ssml(segment: str) -> str:
+def _escape_header_line(seg: Segment, index: int) -> str:
+    """Escape one header line of *seg* for use inside ``<emphasis>``.
+
+    Same output as :func:`_escape_header` on the marked line: pauses become
+    breaks and quote markers are dropped.
+    """
+    out: list[str] = []
+    for text, marker in seg.iter_line(index):
+        out.append(html.escape(_strip_xml_illegal(text)))
+        if marker == PAUSE:
+            out.append(f'<break time="{_PAUSE_DURATION_S}s"/>')
+    return "".join(out)
+
+
+def _line_is_terminated(seg: Segment, index: int) -> bool:
+    """True when body line *index* already ends a sentence (or a quote)."""
+    if seg.line_ends_with_marker(index):
+        return seg.line_ends_with(index, QEND)
+    return seg.lines[index][-1:] in (".", "!", "?", ",", ":")
+
+
+def _section_to_ssml(segment: SegmentLike) -> str:
     """Convert one liturgy segment to SSML inner content.
 
-    Segments may be prefixed with ``__POPE__`` to signal they contain the
-    pope's comment — these receive a distinct lower-pitch rendering.
+    *segment* is a :class:`~gospel.segments.Segment` or its marked string
+    form.  Pope segments (``__POPE__`` prefix) receive a distinct lower-pitch
+    rendering.
 
     The *first line* is the section label (e.g. "Prima Lettura") wrapped in
     ``<emphasis>``.  If the *second line* is a short book-attribution with no
@@ -174,77 +147,84 @@ def _section_to_ssml(segment: str) -> str:
     in ``<emphasis>`` as a sub-header, followed by a longer pause before the
     reading body begins.  Otherwise only the first line is the header.
     """
-    is_pope = segment.startswith("__POPE__")
-    text = segment[len("__POPE__"):].strip() if is_pope else segment.strip()
-
-    # Normalise internal newlines
-    text = re.sub(r"[ \t]*\n[ \t]*", "\n", text)
-    lines = text.split("\n")
-
-    header_raw = lines[0].strip() if lines else ""
-
-    # Detect a sub-header: second line is short and contains no sentence punctuation
-    sub_header_raw = ""
-    body_start = 1
-    if len(lines) >= 2:
-        second = lines[1].strip()
-        if second and len(second) < 60 and not re.search(r'[.!?:,]', second):
-            sub_header_raw = second
-            body_start = 2
-
-    # Join body lines, inserting a period at line ends that have no sentence
-    # punctuation — Vatican News <p> tags often omit trailing periods, which
-    # causes TTS to read adjacent sentences as one continuous unbroken stream.
-    _body_lines = [ln.strip() for ln in "\n".join(lines[body_start:]).split("\n") if ln.strip()]
-    _joined_body: list[str] = []
-    for _i, _ln in enumerate(_body_lines):
-        if _i < len(_body_lines) - 1 and not re.search(r'[.!?,:]$|__QEND__\s*$', _ln):
-            _ln = _ln + '.'
-        _joined_body.append(_ln)
-    body_raw = " ".join(_joined_body)
+    seg = as_segment(segment)
+    is_pope = seg.kind == KIND_POPE
 
     parts: list[str] = []
 
-    if header_raw:
+    if seg.header or seg.marks[0]:
         parts.append(
-            f'<emphasis level="moderate">{_escape_header(header_raw)}</emphasis>'
+            f'<emphasis level="moderate">{_escape_header_line(seg, 0)}</emphasis>'
         )
 
-    if sub_header_raw:
+    if seg.has_sub_header:
         # Short breath between section label and book attribution
         parts.append('<break time="0.5s"/>')
         # Add a terminal period so Neural2 uses falling (complete) intonation
-        # rather than the hesitant rising tone it produces on unpunctuated phrases.
-        sub_text = sub_header_raw if re.search(r'[.!?:]$', sub_header_raw) else sub_header_raw + '.'
+        # rather than the hesitant rising tone it produces on unpunctuated
+        # phrases.  A sub-header never carries sentence punctuation itself.
         parts.append(
-            f'<emphasis level="moderate">{_escape_header(sub_text)}</emphasis>'
+            f'<emphasis level="moderate">{_escape_header_line(seg, 1)}.</emphasis>'
         )
 
-    if body_raw:
+    body = seg.body_lines()
+    if body:
         # Longer pause after header(s) to signal the reading is starting
         parts.append('<break time="1.0s"/>')
-        body_ssml = _escape_and_mark(body_raw)
+        # Body lines are joined with a space; a period is inserted at line
+        # ends that have no sentence punctuation — Vatican News <p> tags often
+        # omit trailing periods, which causes TTS to read adjacent sentences
+        # as one continuous unbroken stream.
+        #
+        # Guillemet quotes get their own deeper prosody.  Neural2 voices reject
+        # nested or unbalanced <prosody> with 400 Invalid SSML, so quotes are
+        # tracked by depth: orphaned closers (e.g. from misidentified German
+        # „text" closing marks) are dropped, unclosed openers are closed at
+        # the end, and inside the pope's outer <prosody> only the surrounding
+        # pauses are kept.
+        out: list[str] = []
+        depth = 0
+        last = body[-1]
+        for i in body:
+            for text, marker in seg.iter_line(i):
+                out.append(html.escape(_strip_xml_illegal(text)))
+                if marker == PAUSE:
+                    out.append(f'<break time="{_PAUSE_DURATION_S}s"/>')
+                elif marker == QSTART:
+                    out.append('<break time="200ms"/>')
+                    if not is_pope:
+                        out.append('<prosody pitch="-6%" rate="97%">')
+                        depth += 1
+                elif marker == QEND:
+                    if depth:
+                        out.append("</prosody>")
+                        depth -= 1
+                    out.append('<break time="150ms"/>')
+            if i != last:
+                if not _line_is_terminated(seg, i):
+                    out.append(".")
+                out.append(" ")
+        out.append("</prosody>" * depth)
+        body_ssml = "".join(out)
         if is_pope:
             # Pope's reflection — slightly slower and deeper for distinction.
-            # Neural2 voices do NOT support nested <prosody> elements and reject
-            # them with 400 Invalid SSML.  The guillemet-quote markers produce an
-            # inner <prosody pitch="-6%"> that would be nested inside the outer
-            # pope <prosody pitch="-4%">.  Collapse the inner prosody tags to
-            # just their surrounding pauses so the outer wrapper is always flat.
-            body_ssml = re.sub(r'<prosody[^>]*>', '', body_ssml)
-            body_ssml = re.sub(r'</prosody>', '', body_ssml)
             parts.append(f'<prosody pitch="-4%" rate="95%">{body_ssml}</prosody>')
         else:
-            # Balance prosody tags: orphaned closers (e.g. from misidentified
-            # German „text" closing marks) or unclosed openers both cause
-            # Neural2 to reject the SSML with 400 Invalid SSML.
-            body_ssml = _balance_prosody_tags(body_ssml)
             parts.append(body_ssml)
 
     return "".join(parts)
 
 
-def _build_episode_ssml(title: str, segments: list[str], lang: str = "it") -> str:
+def _sections_ssml(segments: list[SegmentLike]) -> str:
+    """SSML inner content of every segment, each preceded by a section break."""
+    parts = []
+    for seg in segments:
+        parts.append(f'<break time="{SECTION_SILENCE_S}s"/>')
+        parts.append(_section_to_ssml(seg))
+    return "".join(parts)
+
+
+def _build_episode_ssml(title: str, segments: list[SegmentLike], lang: str = "it") -> str:
     """Build a complete SSML document for the whole episode."""
     # Title with stronger emphasis
     title_ssml = (
@@ -252,14 +232,15 @@ def _build_episode_ssml(title: str, segments: list[str], lang: str = "it") -> st
         f'{_escape_header(re.sub(r"[ \t]*\n[ \t]*", " ", title).strip())}'
         f'</emphasis>'
     )
-    parts = [title_ssml]
-    for seg in segments:
-        parts.append(f'<break time="{SECTION_SILENCE_S}s"/>')
-        parts.append(_section_to_ssml(seg))
-    ssml = "<speak>" + "".join(parts) + "</speak>"
+    ssml = "<speak>" + title_ssml + _sections_ssml(segments) + "</speak>"
     return _apply_phonemes(ssml, lang)
 
 
+def _build_body_ssml(segments: list[SegmentLike], lang: str = "it") -> str:
+    """Build the SSML document of an episode without its title (see ``synthesize_body``)."""
+    return _apply_phonemes("<speak>" + _sections_ssml(segments) + "</speak>", lang)
+
+
 # -- Cloud TTS synthesis -------------------------------------------------------
 
 def _synthesize(ssml: str, voice_name: str, language_code: str,
@@ -281,6 +262,7 @@ def _synthesize(ssml: str, voice_name: str, language_code: str,
             audio_encoding=texttospeech.AudioEncoding.MP3,
             speaking_rate=speaking_rate,
         ),
+        timeout=deadline.current().timeout(_TTS_TIMEOUT_S, stage="speech synthesis"),
     )
     return response.audio_content
 
@@ -313,23 +295,34 @@ def _edge_synthesize_to_file(text: str, voice_name: str, speaking_rate: float, o
     if not clean_text:
         clean_text = " "
 
+    timeout = deadline.current().timeout(_TTS_TIMEOUT_S, stage="speech synthesis")
+
     async def _run() -> None:
         communicate = edge_tts.Communicate(
             text=clean_text,
             voice=voice_name,
             rate=_edge_rate(speaking_rate),
         )
-        await communicate.save(out_path)
+        await asyncio.wait_for(communicate.save(out_path), timeout)
 
     asyncio.run(_run())
 
 
-def _section_to_plain_text(segment: str) -> str:
-    """Flatten one segment to plain text while preserving headings."""
-    is_pope = segment.startswith("__POPE__")
-    text = segment[len("__POPE__"):].strip() if is_pope else segment.strip()
-    text = re.sub(r"[ \t]*\n[ \t]*", "\n", text)
-    lines = [ln.strip() for ln in text.split("\n") if ln.strip()]
+def _section_to_plain_text(segment: SegmentLike) -> str:
+    """Flatten one segment to plain text while preserving headings.
+
+    Lines are joined with ". "; semicolon pauses become ", " and quote
+    markers are dropped.  The marked-string version left the markers in
+    place for :func:`_strip_ssml_tags` to resolve, so its output differs
+    from this one; only the text after ``_strip_ssml_tags`` (what Edge TTS
+    receives) is the same.
+    """
+    seg = as_segment(segment)
+    lines = [
+        seg.render_line(i, ", ", "", "")
+        for i in range(len(seg.lines))
+        if seg.lines[i] or seg.marks[i]
+    ]
     if not lines:
         return ""
     plain = ". ".join(lines)
@@ -532,7 +525,7 @@ class AudioGenerator:
             raise RuntimeError("_synth is only available for provider=google")
         return _synthesize(ssml, self.voice_name, self.language_code, self.speaking_rate)
 
-    def _create_episode_edge(self, title_text: str, segments: list[str], final_mp3: str) -> None:
+    def _create_episode_edge(self, title_text: str, segments: list[SegmentLike], final_mp3: str) -> None:
         """Synthesize title + sections with Edge TTS and preserve section silence."""
         ffmpeg = _ffmpeg_bin()
 
@@ -544,35 +537,39 @@ class AudioGenerator:
 
         tmp_dir = tempfile.mkdtemp()
         try:
-            part_paths: list[str] = []
+            title_path = self._synth_title(title_text, ffmpeg, tmp_dir)
+            _concat_mp3s([title_path] + self._render_sections(segments, ffmpeg, tmp_dir),
+                         final_mp3, ffmpeg)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
-            title_path = os.path.join(tmp_dir, "part_title.mp3")
-            _edge_synthesize_to_file(title_text, self.voice_name, self.speaking_rate, title_path)
-            part_paths.append(title_path)
+    def _render_sections(self, segments: list[Segment], ffmpeg: str, tmp_dir: str) -> List[str]:
+        """Synthesise each segment to its own MP3 in *tmp_dir*.
 
-            for idx, seg in enumerate(segments):
+        Returns the parts to concatenate after the title: a section silence,
+        then the segment, for every segment that produced audio (Edge skips
+        segments with no text).
+        """
+        parts: List[str] = []
+        silence_path = os.path.join(tmp_dir, "silence.mp3")
+        for idx, seg in enumerate(segments):
+            if self.provider == "edge":
                 plain = _section_to_plain_text(seg)
                 if not plain:
                     continue
                 p = os.path.join(tmp_dir, f"part_{idx}.mp3")
                 _edge_synthesize_to_file(plain, self.voice_name, self.speaking_rate, p)
-                part_paths.append(p)
-
-            if len(part_paths) == 1:
-                shutil.copy2(part_paths[0], final_mp3)
-                return
-
-            silence_path = os.path.join(tmp_dir, "silence.mp3")
-            _generate_silence(silence_path, ffmpeg, SECTION_SILENCE_S)
-
-            interleaved: list[str] = [part_paths[0]]
-            for p in part_paths[1:]:
-                interleaved.append(silence_path)
-                interleaved.append(p)
-
-            _concat_mp3s(interleaved, final_mp3, ffmpeg)
-        finally:
-            shutil.rmtree(tmp_dir, ignore_errors=True)
+            else:
+                ssml = _apply_phonemes(f"<speak>{_section_to_ssml(seg)}</speak>", self.lang)
+                p = _synth_segment_safe(
+                    ssml, self.voice_name, self.language_code,
+                    self.speaking_rate, ffmpeg, tmp_dir, f"part_{idx}",
+                )
+            if not parts:
+                _generate_silence(silence_path, ffmpeg, SECTION_SILENCE_S)
+            parts.append(silence_path)
+            parts.append(p)
+        return parts
 
     def create_podcast_episode(self, title: str, description: str) -> Dict:
         """Create an MP3 episode from title + liturgy description.
@@ -589,12 +586,25 @@ class AudioGenerator:
 
         Returns a dict with 'audio_path', 'duration', 'filename'.
         """
+        return self.create_episode_from_segments(
+            title, build_liturgy_segments(description, lang=self.lang)
+        )
+
+    def create_episode_from_segments(self, title: str, segments: list[SegmentLike]) -> Dict:
+        """Create an MP3 episode from a title and pre-built liturgy segments.
+
+        Same synthesis pipeline as :py:meth:`create_podcast_episode` but skips
+        the ``build_liturgy_segments`` step — useful when segments are produced
+        by an alternative source such as
+        :py:class:`~gospel.html_scraper.VaticanHTMLScraper`.  Segments may be
+        :class:`~gospel.segments.Segment` objects or marked strings.
+        """
         dt = datetime.now().strftime("%Y%m%d_%H%M%S")
         base = f"{dt}_{_slugify(title) or 'gospel'}"
         final_mp3 = os.path.join(self.out_dir, f"{base}.mp3")
 
         title_text = normalize_for_tts(title, lang=self.lang)
-        segments   = build_liturgy_segments(description, lang=self.lang)
+        segments   = [as_segment(s) for s in segments]
 
         if self.provider == "edge":
             self._create_episode_edge(title_text, segments, final_mp3)
@@ -619,34 +629,9 @@ class AudioGenerator:
             else:
                 tmp_dir = tempfile.mkdtemp()
                 try:
-                    silence_path = os.path.join(tmp_dir, "silence.mp3")
-                    _generate_silence(silence_path, ffmpeg, SECTION_SILENCE_S)
-
-                    # title as first part, then each segment
-                    title_ssml = _apply_phonemes(
-                        f'<speak><emphasis level="strong">'
-                        f'{_escape_header(title_text)}'
-                        f'</emphasis></speak>',
-                        self.lang,
-                    )
-                    interleaved: List[str] = []
-                    title_path = _synth_segment_safe(
-                        title_ssml, self.voice_name, self.language_code,
-                        self.speaking_rate, ffmpeg, tmp_dir, "part_title",
-                    )
-                    interleaved.append(title_path)
-                    for idx, seg in enumerate(segments):
-                        ssml = _apply_phonemes(
-                            f"<speak>{_section_to_ssml(seg)}</speak>", self.lang
-                        )
-                        p = _synth_segment_safe(
-                            ssml, self.voice_name, self.language_code,
-                            self.speaking_rate, ffmpeg, tmp_dir, f"part_{idx}",
-                        )
-                        interleaved.append(silence_path)
-                        interleaved.append(p)
-
-                    _concat_mp3s(interleaved, final_mp3, ffmpeg)
+                    title_path = self._synth_title(title_text, ffmpeg, tmp_dir)
+                    _concat_mp3s([title_path] + self._render_sections(segments, ffmpeg, tmp_dir),
+                                 final_mp3, ffmpeg)
                 finally:
                     shutil.rmtree(tmp_dir, ignore_errors=True)
 
@@ -658,77 +643,79 @@ class AudioGenerator:
             "filename":   os.path.basename(final_mp3),
         }
 
-    def create_episode_from_segments(self, title: str, segments: list[str]) -> Dict:
-        """Create an MP3 episode from a title and pre-built liturgy segments.
+    # -- title / body split (saint audio reuse) ------------------------------------
 
-        Same synthesis pipeline as :py:meth:`create_podcast_episode` but skips
-        the ``build_liturgy_segments`` step — useful when segments are produced
-        by an alternative source such as
-        :py:class:`~gospel.html_scraper.VaticanHTMLScraper`.
+    def voice_fingerprint(self) -> str:
+        """Provider, voice and rate: everything besides the text that shapes the audio."""
+        return f"{self.provider}:{self.voice_name}:{self.speaking_rate}"
+
+    def _synth_title(self, title_text: str, ffmpeg: str, tmp_dir: str) -> str:
+        if self.provider == "edge":
+            path = os.path.join(tmp_dir, "part_title.mp3")
+            _edge_synthesize_to_file(title_text, self.voice_name, self.speaking_rate, path)
+            return path
+        title_ssml = _apply_phonemes(
+            f'<speak><emphasis level="strong">'
+            f'{_escape_header(title_text)}'
+            f'</emphasis></speak>',
+            self.lang,
+        )
+        return _synth_segment_safe(
+            title_ssml, self.voice_name, self.language_code,
+            self.speaking_rate, ffmpeg, tmp_dir, "part_title",
+        )
+
+    def synthesize_body(self, segments: list[SegmentLike], out_path: str) -> None:
+        """Synthesise an episode without its title: a section break, then each segment.
+
+        The result does not depend on the date, so it can be stored and
+        joined to a freshly synthesised title with :meth:`create_episode_with_body`.
+        Rendered as in :meth:`create_episode_from_segments`: with Cloud TTS a
+        body that fits the SSML byte limit is one request, otherwise each
+        segment is synthesised apart.  Requires ffmpeg.
+        """
+        ffmpeg = _ffmpeg_bin()
+        if not ffmpeg:
+            raise RuntimeError("ffmpeg is required to synthesise an episode body")
+        segments = [as_segment(s) for s in segments]
+        if self.provider == "google":
+            body_ssml = _build_body_ssml(segments, lang=self.lang)
+            if len(body_ssml.encode("utf-8")) <= _SSML_BYTE_LIMIT:
+                with open(out_path, "wb") as f:
+                    f.write(self._synth(body_ssml))
+                return
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            parts = self._render_sections(segments, ffmpeg, tmp_dir)
+            if not parts:
+                raise RuntimeError("no segment produced any audio")
+            _concat_mp3s(parts, out_path, ffmpeg)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def create_episode_with_body(self, title: str, body_mp3: str) -> Dict:
+        """Create an MP3 episode from a newly synthesised *title* and a stored body.
+
+        *body_mp3* comes from :meth:`synthesize_body`, possibly in an earlier
+        year; only the dated title is sent to TTS.  Requires ffmpeg.
         """
+        ffmpeg = _ffmpeg_bin()
+        if not ffmpeg:
+            raise RuntimeError("ffmpeg is required to join a title to a stored body")
         dt = datetime.now().strftime("%Y%m%d_%H%M%S")
         base = f"{dt}_{_slugify(title) or 'gospel'}"
         final_mp3 = os.path.join(self.out_dir, f"{base}.mp3")
 
         title_text = normalize_for_tts(title, lang=self.lang)
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            title_path = self._synth_title(title_text, ffmpeg, tmp_dir)
+            _concat_mp3s([title_path, body_mp3], final_mp3, ffmpeg)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
 
-        if self.provider == "edge":
-            self._create_episode_edge(title_text, segments, final_mp3)
-            ffmpeg = _ffmpeg_bin()
-            duration = _probe_duration(final_mp3, ffmpeg) if ffmpeg else 0
-            return {
-                "audio_path": final_mp3,
-                "duration":   duration,
-                "filename":   os.path.basename(final_mp3),
-            }
-
-        full_ssml  = _build_episode_ssml(title_text, segments, lang=self.lang)
-
-        if len(full_ssml.encode("utf-8")) <= _SSML_BYTE_LIMIT:
-            with open(final_mp3, "wb") as f:
-                f.write(self._synth(full_ssml))
-        else:
-            ffmpeg = _ffmpeg_bin()
-            if not ffmpeg:
-                with open(final_mp3, "wb") as f:
-                    f.write(self._synth(full_ssml))
-            else:
-                tmp_dir = tempfile.mkdtemp()
-                try:
-                    silence_path = os.path.join(tmp_dir, "silence.mp3")
-                    _generate_silence(silence_path, ffmpeg, SECTION_SILENCE_S)
-
-                    title_ssml = _apply_phonemes(
-                        f'<speak><emphasis level="strong">'
-                        f'{_escape_header(title_text)}'
-                        f'</emphasis></speak>',
-                        self.lang,
-                    )
-                    interleaved: List[str] = []
-                    title_path = _synth_segment_safe(
-                        title_ssml, self.voice_name, self.language_code,
-                        self.speaking_rate, ffmpeg, tmp_dir, "part_title",
-                    )
-                    interleaved.append(title_path)
-                    for idx, seg in enumerate(segments):
-                        ssml = _apply_phonemes(
-                            f"<speak>{_section_to_ssml(seg)}</speak>", self.lang
-                        )
-                        p = _synth_segment_safe(
-                            ssml, self.voice_name, self.language_code,
-                            self.speaking_rate, ffmpeg, tmp_dir, f"part_{idx}",
-                        )
-                        interleaved.append(silence_path)
-                        interleaved.append(p)
-
-                    _concat_mp3s(interleaved, final_mp3, ffmpeg)
-                finally:
-                    shutil.rmtree(tmp_dir, ignore_errors=True)
-
-        ffmpeg = _ffmpeg_bin()
-        duration = _probe_duration(final_mp3, ffmpeg) if ffmpeg else 0
         return {
             "audio_path": final_mp3,
-            "duration":   duration,
+            "duration":   _probe_duration(final_mp3, ffmpeg),
             "filename":   os.path.basename(final_mp3),
         }
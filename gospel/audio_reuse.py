@@ -0,0 +1,125 @@
+"""Year-over-year reuse of saint episode audio.
+
+The saint calendar repeats every year and the biographies rarely change, so
+most saint episodes would be synthesised from the same text as last year.
+Only the title ("Santo del Giorno - 17 marzo 2026") carries the date.
+
+:func:`create_saint_episode` therefore synthesises the episode in two parts:
+
+  body   section break + every saint segment.  Stored under a key made of
+         (lang, MM-DD, hash of the normalised segments, provider, voice,
+         rate); a later run with the same key downloads it instead of
+         calling TTS.
+  title  always synthesised, then joined in front of the body with ffmpeg.
+
+Bodies are kept in the publisher's bucket under
+``{storage_prefix}/audio_cache/`` and, when ``GOSPEL_AUDIO_REUSE_DIR`` is
+set, in that local directory as well.  Storing a new body for a day deletes
+the bodies it supersedes (same language and MM-DD, older text or voice), so
+both hold at most one body per language and calendar day.  ``GOSPEL_AUDIO_REUSE=0`` (or a
+missing ffmpeg) falls back to synthesising the whole episode.
+"""
+
+import datetime
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional
+
+from gospel.audio_generator import AudioGenerator, _ffmpeg_bin
+from gospel.segments import SegmentLike, as_segment
+
+logger = logging.getLogger(__name__)
+
+REUSE_ENABLED = os.environ.get("GOSPEL_AUDIO_REUSE", "1").strip().lower() not in ("0", "false", "no")
+LOCAL_DIR = os.environ.get("GOSPEL_AUDIO_REUSE_DIR", "")
+
+
+def _day_prefix(lang: str, date: datetime.date) -> str:
+    return f"saint-{lang}-{date.month:02d}-{date.day:02d}-"
+
+
+def body_key(audio_gen: AudioGenerator, lang: str, date: datetime.date,
+             segments: List[SegmentLike]) -> str:
+    """File name of the stored body for these segments, voice and day."""
+    h = hashlib.sha1(audio_gen.voice_fingerprint().encode("utf-8"))
+    for seg in segments:
+        h.update(b"\0")
+        h.update(as_segment(seg).to_marked().encode("utf-8"))
+    return f"{_day_prefix(lang, date)}{h.hexdigest()[:16]}.mp3"
+
+
+def _fetch_body(key: str, dest: str, publisher) -> bool:
+    if LOCAL_DIR:
+        local = os.path.join(LOCAL_DIR, key)
+        if os.path.exists(local):
+            shutil.copy2(local, dest)
+            return True
+    if publisher is not None and publisher.download_cached_audio(key, dest):
+        _keep_local(key, dest)
+        return True
+    return False
+
+
+def _keep_local(key: str, path: str) -> None:
+    if not LOCAL_DIR:
+        return
+    try:
+        os.makedirs(LOCAL_DIR, exist_ok=True)
+        shutil.copy2(path, os.path.join(LOCAL_DIR, key))
+    except OSError as e:
+        logger.warning("audio reuse: cannot keep %s locally (%s)", key, e)
+
+
+def _prune_superseded(prefix: str, key: str, publisher) -> None:
+    """Delete stored bodies for the same day as *key* (sharing *prefix*) other than *key*."""
+    if publisher is not None:
+        publisher.prune_cached_audio(prefix, key)
+    if not LOCAL_DIR:
+        return
+    try:
+        names = os.listdir(LOCAL_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith(prefix) and name != key:
+            try:
+                os.remove(os.path.join(LOCAL_DIR, name))
+            except OSError as e:
+                logger.warning("audio reuse: cannot delete %s (%s)", name, e)
+
+
+def create_saint_episode(audio_gen: AudioGenerator, title: str, segments: List[SegmentLike],
+                         lang: str, date: Optional[datetime.date] = None,
+                         publisher=None) -> Dict:
+    """Create a saint episode, reusing a stored body when one matches.
+
+    Returns the :meth:`AudioGenerator.create_episode_from_segments` dict plus
+    ``reused`` (True when no segment was sent to TTS).
+    """
+    if not REUSE_ENABLED or not _ffmpeg_bin():
+        episode = audio_gen.create_episode_from_segments(title, segments)
+        episode["reused"] = False
+        return episode
+
+    date = date or datetime.date.today()
+    key = body_key(audio_gen, lang, date, segments)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        body = os.path.join(tmp_dir, key)
+        reused = _fetch_body(key, body, publisher)
+        if reused:
+            logger.info("[saint/%s] reusing stored audio %s", lang, key)
+        else:
+            audio_gen.synthesize_body(segments, body)
+            stored = publisher is not None and publisher.upload_cached_audio(body, key)
+            _keep_local(key, body)
+            # Only once the new body is safely stored (or there is no bucket).
+            _prune_superseded(_day_prefix(lang, date), key, publisher if stored else None)
+        episode = audio_gen.create_episode_with_body(title, body)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    episode["reused"] = reused
+    return episode
@@ -0,0 +1,305 @@
+"""HTML parser backend parity check and benchmark on stored Vatican News pages.
+
+Usage:
+    python -m gospel.benchmarks.html_parser_bench                  # parity check + benchmark
+    python -m gospel.benchmarks.html_parser_bench --check          # parity check only
+    python -m gospel.benchmarks.html_parser_bench --backends lxml --repeat 50
+    python -m gospel.benchmarks.html_parser_bench --update-golden  # after an intended change
+    python -m gospel.benchmarks.html_parser_bench --archive DIR --limit 50
+
+The corpus lives in ``gospel/benchmarks/corpus/html/{lang}/``:
+
+  liturgy-YYYY-MM-DD.html   daily liturgy page (html_scraper)
+  saints-MM-DD.html         Saint of the Day listing page (saint_scraper)
+  saint-detail-MM-DD.html   individual saint page (saint_scraper)
+
+For every installed backend (see gospel/html_parser.py), with partial
+parsing on and off, the pages are turned into the values the scrapers return — liturgy title and segments, listed
+saints, saint biography — and compared with the golden file
+``gospel/benchmarks/golden/html/{lang}.json``.  The golden files are written
+with html.parser, the reference backend, so a faster backend is only
+acceptable when its output is identical, and so is a partial parse.
+
+The benchmark reports, per backend and parse mode, the parse time alone,
+parse plus extraction, and the peak memory of one parse as seen by tracemalloc (which
+tracks the Python tree objects, not libxml2's own short-lived buffers).
+
+With ``--archive``, the pages come from a crawled archive (gospel/archive.py)
+instead: the latest ``--limit`` liturgy and saint pages of each language,
+named as above.  They have no golden file, so every backend and mode is
+compared with a full html.parser parse of the same pages.
+"""
+
+import argparse
+import datetime
+import difflib
+import json
+import os
+import re
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from gospel import archive, html_parser
+from gospel import html_scraper
+from gospel import saint_scraper
+from gospel.html_scraper import VaticanHTMLScraper
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BENCH_DIR, "corpus", "html")
+GOLDEN_DIR = os.path.join(BENCH_DIR, "golden", "html")
+SUPPORTED_LANGS = ["de", "en", "es", "fr", "it", "pt"]
+REFERENCE_BACKEND = "html.parser"
+MODES = ("full", "partial")
+
+_LITURGY_RE = re.compile(r"^liturgy-(\d{4})-(\d{2})-(\d{2})\.html$")
+
+
+# ---------------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------------
+
+def parse_langs(value: str) -> List[str]:
+    if value.lower() == "all":
+        return SUPPORTED_LANGS
+    langs = [x.strip().lower() for x in value.split(",") if x.strip()]
+    invalid = [x for x in langs if x not in SUPPORTED_LANGS]
+    if invalid:
+        raise ValueError(f"Unsupported languages: {', '.join(invalid)}")
+    return langs
+
+
+def load_pages(lang: str) -> Dict[str, str]:
+    """Return ``{file name: html}`` for every page stored for *lang*."""
+    folder = os.path.join(CORPUS_DIR, lang)
+    pages = {}
+    for name in sorted(os.listdir(folder)):
+        if name.endswith(".html"):
+            with open(os.path.join(folder, name), "r", encoding="utf-8") as f:
+                pages[name] = f.read()
+    return pages
+
+
+def load_archive_pages(archive_dir: str, lang: str, limit: int) -> Dict[str, str]:
+    """Return the latest *limit* liturgy and saint pages of *lang* in the archive, named as in the corpus."""
+    arch = archive.Archive(archive_dir)
+    pages = {}
+    for record in list(arch.records(archive.KIND_LITURGY, lang))[-limit:]:
+        pages[f"liturgy-{record['date']}.html"] = record["html"]
+    for record in list(arch.records(archive.KIND_SAINTS, lang))[-limit:]:
+        pages[f"saints-{record['key']}.html"] = record["html"]
+        detail = next((html for html in (record.get("detail_pages") or {}).values() if html), None)
+        if detail:
+            pages[f"saint-detail-{record['key']}.html"] = detail
+    return pages
+
+
+def extractor(lang: str, name: str) -> Callable[[str], object]:
+    """Return the function turning page *name* into what the scraper returns."""
+    m = _LITURGY_RE.match(name)
+    if m:
+        date = datetime.date(*map(int, m.groups()))
+
+        def liturgy(html: str) -> Dict:
+            title, segments = VaticanHTMLScraper(lang).parse_page(html, date)
+            return {"title": title, "segments": [seg.to_dict() for seg in segments]}
+        return liturgy
+    if name.startswith("saints-"):
+        # No date: the scraper would HEAD-probe missing detail links.
+        return lambda html: saint_scraper._parse_listing(html, lang)
+    if name.startswith("saint-detail-"):
+        return saint_scraper._parse_detail_text
+    raise ValueError(f"Unknown corpus page: {lang}/{name}")
+
+
+def page_filter(lang: str, name: str) -> html_parser.SubtreeFilter:
+    """The SubtreeFilter the scraper uses for page *name*."""
+    if name.startswith("liturgy-"):
+        return html_scraper._LITURGY_SUBTREES
+    if name.startswith("saints-"):
+        return saint_scraper._listing_subtrees(lang)
+    return saint_scraper._SECTION_SUBTREES
+
+
+def compute_outputs(lang: str, pages: Dict[str, str], backend: str,
+                    mode: str = "full") -> Dict[str, object]:
+    with html_parser.using_backend(backend), html_parser.partial_parsing(mode == "partial"):
+        return {name: extractor(lang, name)(html) for name, html in pages.items()}
+
+
+# ---------------------------------------------------------------------------
+# Golden / parity check
+# ---------------------------------------------------------------------------
+
+def _golden_path(lang: str) -> str:
+    return os.path.join(GOLDEN_DIR, f"{lang}.json")
+
+
+def write_golden(lang: str, outputs: Dict[str, object]) -> str:
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    path = _golden_path(lang)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(outputs, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def check_golden(lang: str, label: str, outputs: Dict[str, object]) -> List[str]:
+    """Compare *outputs* against the stored golden file; return mismatch reports."""
+    path = _golden_path(lang)
+    if not os.path.exists(path):
+        return [f"[{lang}] golden file missing: {path} (run with --update-golden)"]
+    with open(path, "r", encoding="utf-8") as f:
+        golden = json.load(f)
+    return compare_outputs(lang, label, golden, outputs)
+
+
+def compare_outputs(lang: str, label: str, expected: Dict[str, object],
+                    outputs: Dict[str, object], expected_label: str = "golden") -> List[str]:
+    """Compare *outputs* page by page with *expected*; return mismatch reports."""
+    expected = json.loads(json.dumps(expected, ensure_ascii=False))
+    problems: List[str] = []
+    for name in sorted(set(expected) | set(outputs)):
+        want = expected.get(name)
+        got = json.loads(json.dumps(outputs.get(name), ensure_ascii=False))
+        if want == got:
+            continue
+        want_txt = json.dumps(want, ensure_ascii=False, indent=1).splitlines()
+        got_txt = json.dumps(got, ensure_ascii=False, indent=1).splitlines()
+        diff = "\n".join(difflib.unified_diff(
+            want_txt, got_txt, expected_label, label, lineterm="", n=1,
+        ))
+        problems.append(f"[{lang}] {name} :: {label}\n{diff}")
+    return problems
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    fn()   # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def _peak_kib(fn: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def run_benchmark(corpora: Dict[str, Dict[str, str]], backends: List[str],
+                  repeat: int) -> List[Tuple[str, float, float, float]]:
+    """Return ``(backend/mode, parse ms, parse+extract ms, peak KiB)`` rows.
+
+    Times are per page, averaged over the whole corpus; the peak is the
+    largest single-page parse.
+    """
+    items = [
+        (html, extractor(lang, name), page_filter(lang, name))
+        for lang, pages in corpora.items()
+        for name, html in pages.items()
+    ]
+    rows = []
+    for backend in backends:
+        for mode in MODES:
+            with html_parser.using_backend(backend), \
+                    html_parser.partial_parsing(mode == "partial"):
+                parse = [lambda h=html, flt=flt: html_parser.make_soup(h, parse_only=flt)
+                         for html, _, flt in items]
+                parse_s = sum(_time(fn, repeat) for fn in parse)
+                full_s = sum(_time(lambda h=html, f=fn: f(h), repeat) for html, fn, _ in items)
+                peak = max(_peak_kib(fn) for fn in parse)
+            rows.append((f"{backend}/{mode}", parse_s / len(items) * 1000,
+                         full_s / len(items) * 1000, peak))
+    return rows
+
+
+def print_benchmark(rows: List[Tuple[str, float, float, float]], pages: int) -> None:
+    print(f"\n{pages} page(s)")
+    print(f"{'backend/mode':<20} {'parse ms':>10} {'+extract ms':>12} {'peak KiB':>10}")
+    print("-" * 55)
+    for label, parse_ms, full_ms, peak in rows:
+        print(f"{label:<20} {parse_ms:>10.2f} {full_ms:>12.2f} {peak:>10.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Check HTML parser backends against the stored pages and benchmark them."
+    )
+    parser.add_argument("--langs", default="all", help="Comma-separated language codes or 'all'")
+    parser.add_argument("--backends", default="",
+                        help="Comma-separated backends (default: all installed)")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed passes per page")
+    parser.add_argument("--check", action="store_true", help="Parity check only (no timing)")
+    parser.add_argument("--update-golden", action="store_true",
+                        help=f"Rewrite the golden files with a full {REFERENCE_BACKEND} parse")
+    parser.add_argument("--archive", default=None,
+                        help="Read the pages from this archive directory (gospel/archive.py)")
+    parser.add_argument("--limit", type=int, default=20,
+                        help="With --archive: latest pages per kind and language")
+    args = parser.parse_args()
+
+    try:
+        langs = parse_langs(args.langs)
+    except ValueError as e:
+        parser.error(str(e))
+        return
+    installed = html_parser.available_backends()
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()] or installed
+    missing = [b for b in backends if b not in installed]
+    if missing:
+        parser.error(f"Backend(s) not installed: {', '.join(missing)} (installed: {', '.join(installed)})")
+
+    if args.archive and args.update_golden:
+        parser.error("--update-golden writes the corpus golden files; it cannot be used with --archive")
+    if args.archive:
+        corpora = {lang: load_archive_pages(args.archive, lang, max(1, args.limit)) for lang in langs}
+        corpora = {lang: pages for lang, pages in corpora.items() if pages}
+        if not corpora:
+            parser.error(f"No archived pages for {', '.join(langs)} in {args.archive}")
+        reference = {lang: compute_outputs(lang, pages, REFERENCE_BACKEND, "full")
+                     for lang, pages in corpora.items()}
+    else:
+        corpora = {lang: load_pages(lang) for lang in langs}
+
+    if args.update_golden:
+        for lang, pages in corpora.items():
+            outputs = compute_outputs(lang, pages, REFERENCE_BACKEND, "full")
+            print(f"  [{lang}] golden written: {write_golden(lang, outputs)}")
+        return
+
+    problems: List[str] = []
+    for backend in backends:
+        for mode in MODES:
+            for lang, pages in corpora.items():
+                outputs = compute_outputs(lang, pages, backend, mode)
+                if args.archive:
+                    problems.extend(compare_outputs(lang, f"{backend}/{mode}", reference[lang],
+                                                    outputs, REFERENCE_BACKEND))
+                else:
+                    problems.extend(check_golden(lang, f"{backend}/{mode}", outputs))
+    if problems:
+        print(f"\nParity check FAILED ({len(problems)} mismatch(es)):")
+        for p in problems:
+            print(p)
+    else:
+        print(f"Parity check OK ({', '.join(backends)}; full + partial; {', '.join(corpora)})")
+
+    if not args.check:
+        pages = sum(len(p) for p in corpora.values())
+        print_benchmark(run_benchmark(corpora, backends, max(1, args.repeat)), pages)
+
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
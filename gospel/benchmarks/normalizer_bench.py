@@ -0,0 +1,276 @@
+"""Frozen-corpus benchmark and golden-output check for text_normalizer.
+
+Usage:
+    python -m gospel.benchmarks.normalizer_bench                  # benchmark + golden check
+    python -m gospel.benchmarks.normalizer_bench --check          # golden check only
+    python -m gospel.benchmarks.normalizer_bench --langs it,en --repeat 50
+    python -m gospel.benchmarks.normalizer_bench --stages         # per-stage breakdown
+    python -m gospel.benchmarks.normalizer_bench --update-golden  # after an intended change
+
+The corpus lives in ``gospel/benchmarks/corpus/normalizer/{lang}.json`` and
+holds, per language:
+
+  rss       Vatican News RSS descriptions — a weekday feed (one reading),
+            a Sunday feed (second reading + standalone pope attribution) and
+            a flat single-paragraph feed that exercises the positional path.
+  sections  Plain-text sections as produced by ``html_scraper._section_plain``.
+
+The golden file ``gospel/benchmarks/golden/normalizer/{lang}.json`` freezes the
+spoken text produced for every corpus entry.  Any optimisation that changes
+what TTS would read fails the check; regenerate the golden files only when the
+change in spoken output is intended.
+"""
+
+import argparse
+import difflib
+import json
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from gospel import text_normalizer as tn
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BENCH_DIR, "corpus", "normalizer")
+GOLDEN_DIR = os.path.join(BENCH_DIR, "golden", "normalizer")
+SUPPORTED_LANGS = ["de", "en", "es", "fr", "it", "pt"]
+
+# Benchmarked functions, in report order.
+FUNCTIONS = [
+    "normalize_for_tts",
+    "build_liturgy_segments",
+    "build_liturgy_segments[structure]",
+    "_strip_section_verse_refs",
+    "_build_segments_positional",
+]
+
+
+# ---------------------------------------------------------------------------
+# Corpus loading
+# ---------------------------------------------------------------------------
+
+def parse_langs(value: str) -> List[str]:
+    if value.lower() == "all":
+        return SUPPORTED_LANGS
+    langs = [x.strip().lower() for x in value.split(",") if x.strip()]
+    invalid = [x for x in langs if x not in SUPPORTED_LANGS]
+    if invalid:
+        raise ValueError(f"Unsupported languages: {', '.join(invalid)}")
+    return langs
+
+
+def load_corpus(lang: str) -> Dict:
+    path = os.path.join(CORPUS_DIR, f"{lang}.json")
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _positional_inputs(description: str, lang: str) -> Tuple[str, Optional[str]]:
+    """Return the ``(flat_text, pre_comment_meta)`` pair that
+    ``build_liturgy_segments`` would hand to the positional fallback."""
+    plain_lines = [
+        l.strip() for l in tn.html_to_plain_text(description).splitlines() if l.strip()
+    ]
+    _, meta = tn._extract_pope_meta(plain_lines[-1] if plain_lines else "")
+    if meta is None:
+        meta, _ = tn._find_pope_attribution_in_lines(plain_lines)
+    text = tn.normalize_for_tts(description, lang=lang, flatten_lines=False)
+    flat_text = " ".join(line.strip() for line in text.splitlines() if line.strip())
+    return flat_text, meta
+
+
+def build_cases(lang: str, corpus: Dict) -> Dict[str, List[Tuple[str, int, Callable[[], object]]]]:
+    """Return ``{function: [(case_id, input_chars, thunk), ...]}`` for *lang*.
+
+    Inputs for the helper functions are prepared here, outside the timed
+    region, exactly as the production call sites prepare them.
+    """
+    cases: Dict[str, List[Tuple[str, int, Callable[[], object]]]] = {f: [] for f in FUNCTIONS}
+    patterns = tn.LITURGY_PATTERNS[lang]
+
+    for entry in corpus.get("rss", []):
+        cid, desc = entry["id"], entry["description"]
+        cases["normalize_for_tts"].append(
+            (cid, len(desc), lambda d=desc: tn.normalize_for_tts(d, lang=lang))
+        )
+        cases["build_liturgy_segments"].append(
+            (cid, len(desc), lambda d=desc: tn.build_liturgy_segments(d, lang=lang))
+        )
+        cases["build_liturgy_segments[structure]"].append(
+            (cid, len(desc),
+             lambda d=desc: tn.build_liturgy_segments(d, lang=lang, mode="structure"))
+        )
+        flat_text, meta = _positional_inputs(desc, lang)
+        cases["_build_segments_positional"].append(
+            (cid, len(flat_text),
+             lambda t=flat_text, m=meta: tn._build_segments_positional(t, lang, patterns, m))
+        )
+
+    for entry in corpus.get("sections", []):
+        cid, text = entry["id"], entry["text"]
+        cases["normalize_for_tts"].append(
+            (cid, len(text),
+             lambda t=text: tn.normalize_for_tts(t, lang=lang, flatten_lines=False))
+        )
+        section_norm = tn.normalize_for_tts(text, lang=lang, flatten_lines=False)
+        cases["_strip_section_verse_refs"].append(
+            (cid, len(section_norm),
+             lambda s=section_norm: tn._strip_section_verse_refs(s, lang))
+        )
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# Golden-output check
+# ---------------------------------------------------------------------------
+
+def compute_outputs(cases: Dict[str, list]) -> Dict[str, Dict[str, object]]:
+    outputs: Dict[str, Dict[str, object]] = {}
+    for func, items in cases.items():
+        for cid, _, thunk in items:
+            outputs.setdefault(cid, {})[func] = thunk()
+    return outputs
+
+
+def _golden_path(lang: str) -> str:
+    return os.path.join(GOLDEN_DIR, f"{lang}.json")
+
+
+def write_golden(lang: str, outputs: Dict[str, Dict[str, object]]) -> str:
+    os.makedirs(GOLDEN_DIR, exist_ok=True)
+    path = _golden_path(lang)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(outputs, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def check_golden(lang: str, outputs: Dict[str, Dict[str, object]]) -> List[str]:
+    """Compare *outputs* against the stored golden file; return mismatch reports."""
+    path = _golden_path(lang)
+    if not os.path.exists(path):
+        return [f"[{lang}] golden file missing: {path} (run with --update-golden)"]
+    with open(path, "r", encoding="utf-8") as f:
+        golden = json.load(f)
+
+    problems: List[str] = []
+    for cid in sorted(set(golden) | set(outputs)):
+        want_funcs = golden.get(cid, {})
+        got_funcs = outputs.get(cid, {})
+        for func in sorted(set(want_funcs) | set(got_funcs)):
+            want = want_funcs.get(func)
+            got = got_funcs.get(func)
+            if want == got:
+                continue
+            want_txt = json.dumps(want, ensure_ascii=False, indent=1).splitlines()
+            got_txt = json.dumps(got, ensure_ascii=False, indent=1).splitlines()
+            diff = "\n".join(difflib.unified_diff(
+                want_txt, got_txt, "golden", "current", lineterm="", n=1,
+            ))
+            problems.append(f"[{lang}] {cid} :: {func}\n{diff}")
+    return problems
+
+
+# ---------------------------------------------------------------------------
+# Throughput benchmark
+# ---------------------------------------------------------------------------
+
+def run_benchmark(all_cases: Dict[str, Dict[str, list]], repeat: int) -> List[Dict]:
+    """Time every function over the whole corpus; return one row per function."""
+    rows = []
+    for func in FUNCTIONS:
+        thunks = [
+            (chars, thunk)
+            for cases in all_cases.values()
+            for _, chars, thunk in cases[func]
+        ]
+        if not thunks:
+            continue
+        for _, thunk in thunks:   # warm-up: fill the re module's pattern cache
+            thunk()
+        total_chars = sum(chars for chars, _ in thunks) * repeat
+        calls = len(thunks) * repeat
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for _, thunk in thunks:
+                thunk()
+        elapsed = time.perf_counter() - start
+        rows.append({
+            "function": func,
+            "calls": calls,
+            "seconds": elapsed,
+            "calls_per_s": calls / elapsed if elapsed else float("inf"),
+            "kchars_per_s": total_chars / 1000 / elapsed if elapsed else float("inf"),
+            "us_per_call": elapsed / calls * 1e6,
+        })
+    return rows
+
+
+def print_benchmark(rows: List[Dict]) -> None:
+    print(f"\n{'function':<30} {'calls':>7} {'calls/s':>10} {'kchar/s':>10} {'us/call':>10}")
+    print("-" * 71)
+    for r in rows:
+        print(f"{r['function']:<30} {r['calls']:>7} {r['calls_per_s']:>10.1f} "
+              f"{r['kchars_per_s']:>10.1f} {r['us_per_call']:>10.1f}")
+
+
+def print_stages(corpora: Dict[str, Dict]) -> None:
+    """Print the per-stage breakdown of one build_liturgy_segments pass per language."""
+    print(f"\n{'lang':<6} stages (slowest first)")
+    print("-" * 71)
+    for lang, corpus in corpora.items():
+        with tn.collect_stages() as stages:
+            for entry in corpus.get("rss", []):
+                tn.build_liturgy_segments(entry["description"], lang=lang)
+        print(f"{lang:<6} {stages.format()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark text_normalizer on the frozen corpus and check golden outputs."
+    )
+    parser.add_argument("--langs", default="all", help="Comma-separated language codes or 'all'")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes over the corpus")
+    parser.add_argument("--check", action="store_true", help="Golden check only (no timing)")
+    parser.add_argument("--update-golden", action="store_true",
+                        help="Rewrite the golden files from the current outputs")
+    parser.add_argument("--stages", action="store_true",
+                        help="Print the per-stage breakdown of build_liturgy_segments")
+    args = parser.parse_args()
+
+    try:
+        langs = parse_langs(args.langs)
+    except ValueError as e:
+        parser.error(str(e))
+        return
+
+    corpora = {lang: load_corpus(lang) for lang in langs}
+    all_cases = {lang: build_cases(lang, corpus) for lang, corpus in corpora.items()}
+
+    problems: List[str] = []
+    for lang, cases in all_cases.items():
+        outputs = compute_outputs(cases)
+        if args.update_golden:
+            print(f"  [{lang}] golden written: {write_golden(lang, outputs)}")
+        else:
+            problems.extend(check_golden(lang, outputs))
+
+    if not args.update_golden:
+        if problems:
+            print(f"\nGolden check FAILED ({len(problems)} mismatch(es)):")
+            for p in problems:
+                print(p)
+        else:
+            print(f"Golden check OK ({', '.join(langs)})")
+
+    if not args.check and not args.update_golden:
+        print_benchmark(run_benchmark(all_cases, max(1, args.repeat)))
+    if args.stages:
+        print_stages(corpora)
+
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Adversarial-input benchmark for the regexes that run over untrusted page text.
+
+Usage:
+    python -m gospel.benchmarks.regex_worst_case
+    python -m gospel.benchmarks.regex_worst_case --sizes 1000,4000,16000,64000 --raw-max 16000
+
+For every case the input is grown through ``--sizes`` and timed twice:
+
+  raw      the original regex (guard disabled)
+  guarded  the call as production makes it (gospel/regex_guard.py)
+
+Raw timings stop at ``--raw-max`` characters because the quadratic sites take
+tens of seconds beyond that.  Where both run, the outputs must be identical.
+The run fails when a guarded call exceeds ``--max-ms`` at any size.
+"""
+
+import argparse
+import datetime
+import re
+import time
+from typing import Callable, List, Tuple
+
+from gospel import regex_guard
+from gospel import text_normalizer as tn
+
+DATE = datetime.date(2024, 3, 17)
+DATE_STR = DATE.strftime("%d/%m/%Y")
+
+
+def _title_date_search(text: str):
+    # The _extract_title strategy-2 regex, applied to a full-page text dump.
+    m = re.search(re.escape(DATE_STR) + r"\s+([^\s].{5,80}?)(?:\s{2,}|\Z)", text)
+    return m.group(1) if m else None
+
+
+# (name, description, input generator, call)
+CASES: List[Tuple[str, str, Callable[[int], str], Callable[[str], object]]] = [
+    ("html_tags", "'<li' repeated, no closing '>'",
+     lambda n: "<li" * (n // 3),
+     tn.html_to_plain_text),
+    ("newline_runs", "one long run of spaces without a newline",
+     lambda n: "a" + " " * n + "b",
+     tn.html_to_plain_text),
+    ("header_verse_refs", "header followed by a long run of number groups",
+     lambda n: "Dal libro" + " 1" * (n // 2) + " x",
+     lambda t: tn._strip_verse_refs_from_header(t, "it")),
+    ("paren_citation", "'(' + 200 digits repeated, never closed",
+     lambda n: ("(" + "1" * 200) * max(1, n // 201),
+     lambda t: tn._smooth_for_tts(t, language="it")),
+    ("section_verse_refs", "flat section that is all verse numbers",
+     lambda n: "Gn 1 1" + " 1" * (n // 2) + " X",
+     lambda t: tn._strip_section_verse_refs(t, "it")),
+    ("title_date", "date repeated, each followed by 100 chars and no double space",
+     lambda n: (DATE_STR + " " + "a" * 100 + " ") * max(1, n // 112),
+     _title_date_search),
+    ("es_vangelo_inline", "near-misses of the ES gospel alternations",
+     lambda n: ("lectura del santo mateo marcos " + " " * 20) * max(1, n // 51),
+     lambda t: tn._find_inline_pos(t, tn.LITURGY_PATTERNS["es"]["vangelo"])),
+    ("pope_meta", "unclosed parentheses before a trailing group",
+     lambda n: ("(" + "a" * 50 + " ") * max(1, n // 52) + "(Papa Francesco)",
+     tn._extract_pope_meta),
+    ("build_liturgy_segments", "flat feed with a long run of verse numbers",
+     lambda n: "Prima lettura " + " 1" * (n // 2) + " x Dal vangelo secondo Luca fine",
+     lambda t: tn.build_liturgy_segments(t, lang="it")),
+]
+
+
+def _timed(fn: Callable[[str], object], text: str) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(text)
+    return time.perf_counter() - start, result
+
+
+def run(sizes: List[int], raw_max: int, max_ms: float, only: List[str]) -> int:
+    failures = 0
+    print(f"{'case':<24} {'chars':>8} {'raw ms':>10} {'guarded ms':>11}  same")
+    print("-" * 62)
+    for name, desc, gen, call in CASES:
+        if only and name not in only:
+            continue
+        print(f"{name:<24} ({desc})")
+        for n in sizes:
+            text = gen(n)
+            raw_ms = raw_out = None
+            if len(text) <= raw_max:
+                regex_guard.GUARD_ENABLED = False
+                try:
+                    raw_s, raw_out = _timed(call, text)
+                finally:
+                    regex_guard.GUARD_ENABLED = True
+                raw_ms = raw_s * 1000
+            regex_guard.reset_guard()
+            guarded_s, guarded_out = _timed(call, text)
+            guarded_ms = guarded_s * 1000
+            same = "-" if raw_ms is None else ("yes" if raw_out == guarded_out else "NO")
+            raw_col = "skipped" if raw_ms is None else f"{raw_ms:.1f}"
+            print(f"{'':<24} {len(text):>8} {raw_col:>10} {guarded_ms:>11.1f}  {same}")
+            if same == "NO" or guarded_ms > max_ms:
+                failures += 1
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure worst-case regex latency on adversarial page text."
+    )
+    parser.add_argument("--sizes", default="1000,4000,16000,64000",
+                        help="Comma-separated input sizes in characters")
+    parser.add_argument("--raw-max", type=int, default=16000,
+                        help="Largest input timed with the guard disabled")
+    parser.add_argument("--max-ms", type=float, default=250.0,
+                        help="Fail when a guarded call takes longer than this")
+    parser.add_argument("--cases", default="", help="Comma-separated case names (default: all)")
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(",") if x.strip()]
+    only = [x.strip() for x in args.cases.split(",") if x.strip()]
+    failures = run(sizes, args.raw_max, args.max_ms, only)
+    print(f"\nSite counters: {regex_guard.guard_stats()}")
+    if failures:
+        print(f"\n{failures} case(s) over budget or with differing output.")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""Full scrape path, offline: replay stored pages through the HTTP client.
+
+Usage:
+    python -m gospel.benchmarks.scrape_replay_bench                   # check + timing
+    python -m gospel.benchmarks.scrape_replay_bench --check           # check only (no latency)
+    python -m gospel.benchmarks.scrape_replay_bench --latency-ms 120 --langs it,en
+
+A temporary fixture store (see gospel/http_fixtures.py) is seeded from the
+stored corpus:
+
+  corpus/html/{lang}/liturgy-*.html     GET of the liturgy page for that date
+  corpus/html/{lang}/saints-MM-DD.html  GET of the saint listing page
+  corpus/html/{lang}/saint-detail-*     GET of the first detail link in the listing
+  corpus/normalizer/{lang}.json         the "rss" descriptions, as one RSS feed
+
+Then ``VaticanHTMLScraper.fetch_segments``, ``fetch_saints``, ``RSSClient`` and
+``GospelRSSClient`` run unchanged, with every request answered from the store
+after the injected latency.  Requests for anything not stored (slug probes,
+other detail pages) fail as an unreachable host would, so the run is fully
+deterministic.  The page cache and the saint index are bypassed; the feed
+cache is not, so the second RSS client reads the first one's parse.
+
+The liturgy result must match ``golden/html/{lang}.json`` and the feed
+entries must match their descriptions; the timing shows where the wall time
+of a scrape goes once network latency is part of it.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import re
+import tempfile
+import time
+from contextlib import ExitStack
+from typing import Dict, List
+from unittest import mock
+from xml.sax.saxutils import escape
+
+from gospel import http_fixtures, page_cache, saint_index, saint_scraper
+from gospel.benchmarks.html_parser_bench import (
+    CORPUS_DIR, GOLDEN_DIR, load_pages, parse_langs,
+)
+from gospel.gospel_rss_parser import GospelRSSClient
+from gospel.html_scraper import VaticanHTMLScraper
+from gospel.text_normalizer import html_to_plain_text
+from gospel_tts_app.feeds import FEED_URLS
+from gospel_tts_app.rss_client import RSSClient
+
+NORMALIZER_CORPUS_DIR = os.path.join(os.path.dirname(CORPUS_DIR), "normalizer")
+
+_LITURGY_RE = re.compile(r"^liturgy-(\d{4})-(\d{2})-(\d{2})\.html$")
+_SAINTS_RE = re.compile(r"^saints-(\d{2})-(\d{2})\.html$")
+
+
+# ---------------------------------------------------------------------------
+# Seeding
+# ---------------------------------------------------------------------------
+
+def _rss_feed(lang: str) -> bytes:
+    with open(os.path.join(NORMALIZER_CORPUS_DIR, f"{lang}.json"), "r", encoding="utf-8") as f:
+        entries = json.load(f)["rss"]
+    items = "".join(
+        f"<item><title>{escape(e['id'])}</title>"
+        f"<link>{escape(FEED_URLS[lang])}#{escape(e['id'])}</link>"
+        f"<description>{escape(e['description'])}</description></item>"
+        for e in entries
+    )
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>{lang}</title>{items}</channel></rss>").encode("utf-8")
+
+
+def seed_store(store: http_fixtures.FixtureStore, lang: str) -> Dict[str, object]:
+    """Store the corpus pages of *lang*; return what each scrape should be asked for."""
+    html_type = {"Content-Type": "text/html; charset=utf-8"}
+    plan: Dict[str, object] = {"liturgy": [], "saints": []}
+    pages = load_pages(lang)
+    for name, html in pages.items():
+        m = _LITURGY_RE.match(name)
+        if m:
+            date = datetime.date(*map(int, m.groups()))
+            store.add("GET", VaticanHTMLScraper(lang).day_url(date), 200, html.encode("utf-8"), html_type)
+            plan["liturgy"].append((name, date))
+        m = _SAINTS_RE.match(name)
+        if m:
+            # Any year: saint URLs carry only MM/DD.
+            date = datetime.date(2026, *map(int, m.groups()))
+            store.add("GET", saint_scraper.day_url(lang, date), 200, html.encode("utf-8"), html_type)
+            detail = pages.get(f"saint-detail-{m.group(1)}-{m.group(2)}.html")
+            links = [s["detail_url"] for s in saint_scraper._parse_listing(html, lang) if s.get("detail_url")]
+            if detail and links:
+                store.add("GET", links[0], 200, detail.encode("utf-8"), html_type)
+            plan["saints"].append(date)
+    if os.path.exists(os.path.join(NORMALIZER_CORPUS_DIR, f"{lang}.json")):
+        store.add("GET", FEED_URLS[lang], 200, _rss_feed(lang),
+                  {"Content-Type": "application/rss+xml; charset=utf-8"})
+        plan["rss"] = True
+    return plan
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+def run_lang(store_dir: str, lang: str, plan: Dict[str, object],
+             latency_ms: float) -> Dict[str, object]:
+    """Scrape everything in *plan* from the store; return outputs, problems and timings."""
+    problems: List[str] = []
+    timings: Dict[str, float] = {}
+    with open(os.path.join(GOLDEN_DIR, f"{lang}.json"), "r", encoding="utf-8") as f:
+        golden = json.load(f)
+
+    with http_fixtures.replaying(store_dir, latency_ms):
+        for name, date in plan["liturgy"]:
+            start = time.perf_counter()
+            title, segments = VaticanHTMLScraper(lang).fetch_segments(date)
+            timings["liturgy"] = time.perf_counter() - start
+            got = {"title": title, "segments": [seg.to_dict() for seg in segments]}
+            if got != golden.get(name):
+                problems.append(f"[{lang}] {name}: replayed scrape differs from the golden file")
+
+        for date in plan["saints"]:
+            start = time.perf_counter()
+            _, segments = saint_scraper.fetch_saints(lang, date)
+            timings["saints"] = time.perf_counter() - start
+            if not segments:
+                problems.append(f"[{lang}] saints {date:%m-%d}: no segments")
+
+        if plan.get("rss"):
+            with open(os.path.join(NORMALIZER_CORPUS_DIR, f"{lang}.json"), "r", encoding="utf-8") as f:
+                want = [html_to_plain_text(e["description"]) for e in json.load(f)["rss"]]
+            for label, client in (("rss", RSSClient), ("rss (gospel)", GospelRSSClient)):
+                start = time.perf_counter()
+                got = [e["summary"] for e in client(FEED_URLS[lang]).fetch_all()]
+                timings[label] = time.perf_counter() - start
+                if got != want:
+                    problems.append(f"[{lang}] {label}: {len(got)} entries, expected {len(want)} matching")
+    return {"problems": problems, "timings": timings}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay the stored pages through the full scrape path, offline."
+    )
+    parser.add_argument("--langs", default="all", help="Comma-separated language codes or 'all'")
+    parser.add_argument("--latency-ms", type=float, default=80.0,
+                        help="Injected latency per request (ignored with --check)")
+    parser.add_argument("--check", action="store_true", help="Output check only, no latency")
+    args = parser.parse_args()
+
+    try:
+        langs = parse_langs(args.langs)
+    except ValueError as e:
+        parser.error(str(e))
+        return
+    latency = 0.0 if args.check else max(0.0, args.latency_ms)
+
+    problems: List[str] = []
+    rows = []
+    with tempfile.TemporaryDirectory(prefix="gospel_replay_") as tmp, ExitStack() as stack:
+        # Every request must reach the fixture store: no page cache, no saint index.
+        stack.enter_context(mock.patch.object(page_cache, "CACHE_ENABLED", False))
+        stack.enter_context(mock.patch.object(saint_index, "INDEX_ENABLED", False))
+        stack.enter_context(mock.patch.object(saint_scraper, "_probe_known_missing", lambda key: False))
+        stack.enter_context(mock.patch.object(saint_scraper, "_remember_probe_miss", lambda key: None))
+        store = http_fixtures.FixtureStore(tmp, "record")
+        for lang in langs:
+            result = run_lang(tmp, lang, seed_store(store, lang), latency)
+            problems.extend(result["problems"])
+            rows.append((lang, result["timings"]))
+
+    if problems:
+        print(f"\nReplay check FAILED ({len(problems)} problem(s)):")
+        for p in problems:
+            print(f"  {p}")
+    else:
+        print(f"Replay check OK ({', '.join(langs)})")
+
+    if not args.check:
+        labels = ["liturgy", "saints", "rss", "rss (gospel)"]
+        print(f"\nwall ms per scrape, {latency:.0f} ms injected per request")
+        print(f"{'lang':<6}" + "".join(f"{label:>14}" for label in labels))
+        print("-" * (6 + 14 * len(labels)))
+        for lang, timings in rows:
+            print(f"{lang:<6}" + "".join(
+                f"{timings[label] * 1000:>14.1f}" if label in timings else f"{'-':>14}"
+                for label in labels))
+
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
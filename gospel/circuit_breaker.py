@@ -0,0 +1,231 @@
+"""Circuit breaker per (source, lang) around the Vatican News scrapers.
+
+When a language's pages keep failing (layout change, 5xx, timeouts), every
+publish would still wait for the failure before falling back to RSS.  The
+scrapes in :mod:`gospel.lookahead` therefore run through :func:`call`:
+
+  closed      requests go through; ``GOSPEL_BREAKER_THRESHOLD`` consecutive
+              failures (default 3) open the circuit.
+  open        calls fail at once with :class:`CircuitOpen` for
+              ``GOSPEL_BREAKER_COOLDOWN_S`` seconds (default 1800), so
+              callers go straight to their fallback.
+  half-open   after the cooldown one call is let through as a probe (others
+              keep failing fast for up to ``PROBE_WINDOW_S``); success closes
+              the circuit, failure opens it for another cooldown.
+
+Only failures of the source count: a ``4xx`` (e.g. the 404 of a day not yet
+published) or the caller's own deadline running out leaves the state as is.
+
+State lives in one JSON file, ``GOSPEL_BREAKER_FILE`` (default
+``<tmp>/gospel_breakers.json``), re-read whenever it changes on disk; point
+it at a mounted bucket volume to share breakers across Cloud Run instances
+(concurrent writers: last one wins).  ``GOSPEL_BREAKER=0`` disables them.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+import requests
+
+from gospel.deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+BREAKER_ENABLED = os.environ.get("GOSPEL_BREAKER", "1").strip().lower() not in ("0", "false", "no")
+STATE_FILE = os.environ.get(
+    "GOSPEL_BREAKER_FILE", os.path.join(tempfile.gettempdir(), "gospel_breakers.json")
+)
+THRESHOLD = int(os.environ.get("GOSPEL_BREAKER_THRESHOLD", "3"))
+COOLDOWN_S = float(os.environ.get("GOSPEL_BREAKER_COOLDOWN_S", "1800"))
+
+# How long a half-open probe holds off other callers before another may probe.
+PROBE_WINDOW_S = 120.0
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_state: Dict[str, Dict] = {}
+_mtime: Optional[float] = None
+
+
+class CircuitOpen(RuntimeError):
+    """The circuit of (*source*, *lang*) is open: skip to the fallback."""
+
+    def __init__(self, source: str, lang: str, retry_in: float, last_error: str = ""):
+        super().__init__(
+            f"{source}/{lang} circuit open (retry in {retry_in:.0f} s; last error: {last_error or 'unknown'})"
+        )
+        self.source = source
+        self.lang = lang
+        self.retry_in = retry_in
+
+
+def _key(source: str, lang: str) -> str:
+    return f"{source}:{lang}"
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _load() -> None:
+    """Re-read the state file when it changed on disk (call under _lock)."""
+    global _state, _mtime
+    try:
+        mtime = os.stat(STATE_FILE).st_mtime
+    except OSError:
+        return
+    if mtime == _mtime:
+        return
+    try:
+        with open(STATE_FILE, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return
+    if isinstance(state, dict):
+        _state, _mtime = state, mtime
+
+
+def _save() -> None:
+    """Write the state file atomically (call under _lock)."""
+    global _mtime
+    directory = os.path.dirname(STATE_FILE) or "."
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(_state, f, sort_keys=True)
+        os.replace(tmp, STATE_FILE)
+        _mtime = os.stat(STATE_FILE).st_mtime
+    except OSError as e:
+        logger.warning("circuit breaker: cannot write %s (%s)", STATE_FILE, e)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def _deadline_cause(error: Optional[BaseException]) -> bool:
+    """True when *error*, or an exception it was raised from, is the deadline running out."""
+    seen = 0
+    while error is not None and seen < 10:
+        if isinstance(error, DeadlineExceeded):
+            return True
+        error, seen = error.__cause__ or error.__context__, seen + 1
+    return False
+
+
+def counts_as_failure(error: BaseException) -> bool:
+    """True when *error* says the source is unhealthy, not that the request was wrong or late.
+
+    A timeout counts only when it was not cut down by the caller's deadline
+    (:class:`gospel.http_client.DeadlineTimeout` is a ``DeadlineExceeded``).
+    """
+    if _deadline_cause(error):
+        return False
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return True
+
+
+def allow(source: str, lang: str) -> None:
+    """Raise :class:`CircuitOpen` unless a call to (*source*, *lang*) may go through now."""
+    if not BREAKER_ENABLED:
+        return
+    now = time.time()
+    with _lock:
+        _load()
+        entry = _state.get(_key(source, lang))
+        if not entry or not entry.get("opened_at"):
+            return
+        retry_at = max(entry["opened_at"] + COOLDOWN_S, entry.get("probe_at", 0) + PROBE_WINDOW_S)
+        if now < retry_at:
+            raise CircuitOpen(source, lang, retry_at - now, entry.get("last_error", ""))
+        # Half-open: this call is the probe.
+        entry["probe_at"] = now
+        _save()
+    logger.info("circuit breaker: probing %s/%s", source, lang)
+
+
+def record_success(source: str, lang: str) -> None:
+    if not BREAKER_ENABLED:
+        return
+    with _lock:
+        _load()
+        entry = _state.pop(_key(source, lang), None)
+        if entry is None:
+            return
+        _save()
+    if entry.get("opened_at"):
+        logger.info("circuit breaker: %s/%s closed again", source, lang)
+
+
+def record_failure(source: str, lang: str, error: BaseException) -> None:
+    if not BREAKER_ENABLED or not counts_as_failure(error):
+        return
+    now = time.time()
+    with _lock:
+        _load()
+        entry = _state.setdefault(_key(source, lang), {"failures": 0})
+        entry["failures"] = entry.get("failures", 0) + 1
+        entry["last_error"] = str(error)[:200]
+        entry["last_failure_at"] = now
+        opened = entry["failures"] >= THRESHOLD
+        if opened:
+            entry["opened_at"] = now
+            entry.pop("probe_at", None)
+        _save()
+    if opened:
+        logger.warning("circuit breaker: %s/%s open for %.0f s after %d failure(s): %s",
+                       source, lang, COOLDOWN_S, entry["failures"], error)
+
+
+def call(source: str, lang: str, fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run ``fn(*args, **kwargs)`` through the breaker of (*source*, *lang*)."""
+    allow(source, lang)
+    try:
+        result = fn(*args, **kwargs)
+    except Exception as e:
+        record_failure(source, lang, e)
+        raise
+    record_success(source, lang)
+    return result
+
+
+def reset(source: Optional[str] = None, lang: Optional[str] = None) -> None:
+    """Close the matching circuits (all when both are None)."""
+    with _lock:
+        _load()
+        for key in list(_state):
+            s, l = key.split(":", 1)
+            if (source is None or s == source) and (lang is None or l == lang):
+                del _state[key]
+        _save()
+
+
+def breaker_states() -> Dict[str, Dict]:
+    """Return every tracked circuit: state (closed/open/half_open), failures, last error."""
+    now = time.time()
+    with _lock:
+        _load()
+        out = {}
+        for key, entry in _state.items():
+            opened_at = entry.get("opened_at")
+            if not opened_at:
+                state = "closed"
+            elif now < opened_at + COOLDOWN_S:
+                state = "open"
+            else:
+                state = "half_open"
+            out[key] = {
+                "state": state,
+                "failures": entry.get("failures", 0),
+                "last_error": entry.get("last_error", ""),
+            }
+        return out
@@ -0,0 +1,289 @@
+"""Persistent store of scraped and normalised content, keyed by (kind, lang, date).
+
+Every entry point that publishes liturgy or Saint of the Day episodes reads
+through this store (via :func:`gospel.lookahead.liturgy_segments` and
+:func:`gospel.lookahead.saint_segments`), so a rerun, a second script on
+the same day, a lookahead run or a ``republish_month`` backfill scrape and
+normalise each day once (entries scraped ahead of their day are revalidated
+on first use; ``force=1`` scrapes again).  Each entry holds:
+
+  title, segments   the episode title and its ``Segment.to_dict`` list
+  source            ``html`` (the Vatican News page; RSS fallbacks are not stored)
+  source_hash       SHA-1 of the page the segments were built from, when known
+  normalizer        :func:`~gospel.text_normalizer.normalizer_version` that built them
+  fetched_at        when the entry was stored
+
+Storage is one SQLite file, ``GOSPEL_CONTENT_DB`` (default
+``<tmp>/gospel_content.sqlite3``).  When ``GOSPEL_CONTENT_MIRROR_DIR`` is
+set, every entry is also written there as
+``{kind}/{lang}/{YYYY-MM-DD}.json`` and a local miss is answered from it; on
+Cloud Run, point it at a mounted bucket volume so entries written by one
+instance are seen by the next.
+
+Entries built by another normaliser version are never returned, and are
+deleted from the database when it is opened.  Entries older than
+``GOSPEL_CONTENT_KEEP_DAYS`` (default 90) are pruned by lookahead runs, so
+month backfills stay cached.  ``GOSPEL_CONTENT_STORE=0`` disables the store.
+The store is best effort: a database that cannot be opened or written
+(e.g. a missing or read-only mount) is logged and reads as a miss.
+"""
+
+import datetime
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from gospel.segments import Segment
+from gospel.text_normalizer import normalizer_version
+
+logger = logging.getLogger(__name__)
+
+STORE_ENABLED = os.environ.get("GOSPEL_CONTENT_STORE", "1").strip().lower() not in ("0", "false", "no")
+DB_PATH = os.environ.get(
+    "GOSPEL_CONTENT_DB", os.path.join(tempfile.gettempdir(), "gospel_content.sqlite3")
+)
+MIRROR_DIR = os.environ.get("GOSPEL_CONTENT_MIRROR_DIR", "")
+KEEP_DAYS = int(os.environ.get("GOSPEL_CONTENT_KEEP_DAYS", "90"))
+
+SOURCE_HTML = "html"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    kind        TEXT NOT NULL,
+    lang        TEXT NOT NULL,
+    day         TEXT NOT NULL,
+    title       TEXT NOT NULL,
+    segments    TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    source_hash TEXT NOT NULL DEFAULT '',
+    normalizer  TEXT NOT NULL,
+    fetched_at  REAL NOT NULL,
+    PRIMARY KEY (kind, lang, day)
+)
+"""
+
+_lock = threading.Lock()
+_conn: Optional[sqlite3.Connection] = None
+_stats: Dict[str, int] = {"hit": 0, "mirror_hit": 0, "miss": 0, "stored": 0, "invalidated": 0}
+
+
+class Stored:
+    """One stored day: ``title``, ``segments``, ``source``, ``source_hash``, ``fetched_at``."""
+
+    __slots__ = ("title", "segments", "source", "source_hash", "fetched_at")
+
+    def __init__(self, title: str, segments: List[Segment], source: str,
+                 source_hash: str = "", fetched_at: float = 0.0):
+        self.title = title
+        self.segments = segments
+        self.source = source
+        self.source_hash = source_hash
+        self.fetched_at = fetched_at
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _connect() -> sqlite3.Connection:
+    """Return the shared connection, opening it on first use (call under _lock)."""
+    global _conn
+    if _conn is None:
+        if os.path.dirname(DB_PATH):
+            os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA)
+        removed = conn.execute(
+            "DELETE FROM content WHERE normalizer != ?", (normalizer_version(),)
+        ).rowcount
+        conn.commit()
+        if removed:
+            _stats["invalidated"] += removed
+            logger.info("content store: dropped %d entr%s built by another normaliser",
+                        removed, "y" if removed == 1 else "ies")
+        _conn = conn
+    return _conn
+
+
+def close() -> None:
+    """Close the database (the next call reopens it)."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _stats[name] += 1
+
+
+def _mirror_path(kind: str, lang: str, date: datetime.date) -> str:
+    return os.path.join(MIRROR_DIR, kind, lang, f"{date.isoformat()}.json")
+
+
+def _insert(kind: str, lang: str, date: datetime.date, row: Dict) -> None:
+    with _lock:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO content VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (kind, lang, date.isoformat(), row["title"], json.dumps(row["segments"], ensure_ascii=False),
+             row["source"], row["source_hash"], row["normalizer"], row["fetched_at"]),
+        )
+        conn.commit()
+
+
+def _write_mirror(kind: str, lang: str, date: datetime.date, row: Dict) -> None:
+    path = _mirror_path(kind, lang, date)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(row, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("content store: cannot mirror %s (%s)", path, e)
+
+
+def _read_mirror(kind: str, lang: str, date: datetime.date) -> Optional[Dict]:
+    try:
+        with open(_mirror_path(kind, lang, date), "r", encoding="utf-8") as f:
+            row = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(row, dict) or row.get("normalizer") != normalizer_version():
+        return None
+    return row
+
+
+def _to_stored(row: Dict) -> Optional[Stored]:
+    try:
+        segments = [Segment.from_dict(s) for s in row["segments"]]
+        stored = Stored(row["title"], segments, row["source"],
+                        row.get("source_hash", ""), row.get("fetched_at", 0.0))
+    except (KeyError, TypeError, ValueError):
+        return None
+    return stored if segments else None
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def get(kind: str, lang: str, date: datetime.date) -> Optional[Stored]:
+    """Return the entry for (*kind*, *lang*, *date*) built by the current normaliser, or None."""
+    if not STORE_ENABLED:
+        return None
+    try:
+        with _lock:
+            found = _connect().execute(
+                "SELECT title, segments, source, source_hash, normalizer, fetched_at "
+                "FROM content WHERE kind = ? AND lang = ? AND day = ?",
+                (kind, lang, date.isoformat()),
+            ).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("content store: read failed (%s)", e)
+        found = None
+
+    if found is not None and found[4] == normalizer_version():
+        title, segments, source, src_hash, normalizer, fetched_at = found
+        stored = _to_stored({"title": title, "segments": json.loads(segments), "source": source,
+                             "source_hash": src_hash, "fetched_at": fetched_at})
+        if stored is not None:
+            _count("hit")
+            return stored
+
+    if MIRROR_DIR:
+        row = _read_mirror(kind, lang, date)
+        stored = _to_stored(row) if row else None
+        if stored is not None:
+            try:
+                _insert(kind, lang, date, row)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("content store: write failed (%s)", e)
+            _count("mirror_hit")
+            return stored
+
+    _count("miss")
+    return None
+
+
+def put(kind: str, lang: str, date: datetime.date, title: str, segments: List[Segment],
+        source: str = SOURCE_HTML, source_hash: str = "") -> None:
+    """Store *title* and *segments* for (*kind*, *lang*, *date*), replacing any entry."""
+    if not STORE_ENABLED or not segments:
+        return
+    row = {
+        "title": title,
+        "segments": [seg.to_dict() for seg in segments],
+        "source": source,
+        "source_hash": source_hash or "",
+        "normalizer": normalizer_version(),
+        "fetched_at": time.time(),
+    }
+    try:
+        _insert(kind, lang, date, row)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("content store: write failed (%s)", e)
+        return
+    if MIRROR_DIR:
+        _write_mirror(kind, lang, date, row)
+    _count("stored")
+
+
+def prune(before: Optional[datetime.date] = None, kinds: Optional[List[str]] = None) -> int:
+    """Delete entries dated before *before* (default: KEEP_DAYS ago) of *kinds* (default all).
+
+    Returns how many database rows were deleted.
+    """
+    if not STORE_ENABLED:
+        return 0
+    before = before or datetime.date.today() - datetime.timedelta(days=KEEP_DAYS)
+    cutoff = before.isoformat()
+    query = "DELETE FROM content WHERE day < ?"
+    params: list = [cutoff]
+    if kinds:
+        query += f" AND kind IN ({', '.join('?' * len(kinds))})"
+        params.extend(kinds)
+    try:
+        with _lock:
+            conn = _connect()
+            removed = conn.execute(query, params).rowcount
+            conn.commit()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("content store: prune failed (%s)", e)
+        removed = 0
+    if MIRROR_DIR:
+        for root, _, files in os.walk(MIRROR_DIR):
+            if kinds and os.path.relpath(root, MIRROR_DIR).split(os.sep)[0] not in kinds:
+                continue
+            for name in files:
+                if name.endswith(".json") and name[:-5] < cutoff:
+                    try:
+                        os.remove(os.path.join(root, name))
+                    except OSError:
+                        pass
+    return removed
+
+
+# ---------------------------------------------------------------------------
+# Stats
+# ---------------------------------------------------------------------------
+
+def store_stats() -> Dict[str, int]:
+    """Return counters: hit, mirror_hit, miss, stored, invalidated."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_store_stats() -> None:
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
@@ -0,0 +1,95 @@
+"""Concurrent date-range scraping for backfills.
+
+:meth:`VaticanHTMLScraper.fetch_segments_range` and
+:func:`saint_scraper.fetch_saints_range` run their single-day fetch for
+every date of a range through :func:`iter_days`, which
+
+  * runs at most ``GOSPEL_RANGE_WORKERS`` days at once (default 4);
+  * starts two days no closer than ``GOSPEL_RANGE_MIN_INTERVAL_S`` seconds
+    apart (default 0.25), so a long backfill does not burst requests at
+    Vatican News;
+  * yields a :class:`DayResult` as soon as each day completes, in
+    completion order; a failed day carries its ``error`` and the batch
+    goes on.
+
+Usage::
+
+    for day in VaticanHTMLScraper("it").fetch_segments_range(start, end):
+        if day.ok:
+            publish(day.date, day.title, day.segments)
+        else:
+            print(day.date, day.error)
+"""
+
+import datetime
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, List, Optional
+
+from gospel import deadline
+
+RANGE_WORKERS = int(os.environ.get("GOSPEL_RANGE_WORKERS", "4"))
+MIN_INTERVAL_S = float(os.environ.get("GOSPEL_RANGE_MIN_INTERVAL_S", "0.25"))
+
+
+class DayResult:
+    """Outcome of one day: ``title`` and ``segments`` on success, else ``error``."""
+
+    __slots__ = ("date", "title", "segments", "error", "seconds")
+
+    def __init__(self, date: datetime.date, title: str = "", segments: Optional[List[Any]] = None,
+                 error: Optional[BaseException] = None, seconds: float = 0.0):
+        self.date = date
+        self.title = title
+        self.segments = segments or []
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def dates_between(start: datetime.date, end: datetime.date) -> List[datetime.date]:
+    """Every date from *start* to *end*, both included."""
+    if end < start:
+        raise ValueError(f"Range end {end} is before its start {start}")
+    return [start + datetime.timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def iter_days(fetch: Callable[[datetime.date], tuple], dates: List[datetime.date],
+              max_workers: Optional[int] = None,
+              min_interval: Optional[float] = None) -> Iterator[DayResult]:
+    """Run ``fetch(date) -> (title, segments)`` for *dates*; yield each day as it completes."""
+    if not dates:
+        return
+    interval = MIN_INTERVAL_S if min_interval is None else min_interval
+    workers = max(1, min(len(dates), max_workers or RANGE_WORKERS))
+    slot_lock = threading.Lock()
+    next_start = [time.monotonic()]
+
+    def task(date: datetime.date) -> DayResult:
+        if interval > 0:
+            with slot_lock:
+                wait = next_start[0] - time.monotonic()
+                next_start[0] = max(next_start[0], time.monotonic()) + interval
+            if wait > 0:
+                time.sleep(wait)
+        start = time.perf_counter()
+        try:
+            title, segments = fetch(date)
+        except Exception as e:
+            return DayResult(date, error=e, seconds=time.perf_counter() - start)
+        return DayResult(date, title, segments, seconds=time.perf_counter() - start)
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="date-range")
+    try:
+        run = deadline.propagate(task)
+        futures = [pool.submit(run, d) for d in dates]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # A consumer that stops early does not wait for the remaining days.
+        pool.shutdown(wait=False, cancel_futures=True)
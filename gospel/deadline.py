@@ -0,0 +1,135 @@
+"""Per-request time budget, shared by scraping, synthesis and upload.
+
+Cloud Run cuts a request off at its timeout (300 s for this service) and
+nothing is returned.  A :class:`Deadline` is created for each ``/publish``
+request (or each language of a batch) and made current with :func:`scope`;
+every stage below sizes its own timeouts from what is left:
+
+  scraping    :func:`gospel.http_client.request` caps each request's timeout
+              at the remaining budget and fails fast once it is spent.
+  synthesis   each TTS call (Cloud TTS or Edge) gets at most the remaining
+              budget.
+  upload      the audio upload leaves ``UPLOAD_RESERVE_S`` seconds for the
+              RSS upload that follows it, and stops retrying when the
+              budget is spent.
+
+Publishing also picks cheaper paths as time runs low: below
+``GOSPEL_DEADLINE_HTML_MIN_S`` seconds (default 15) only an already scraped
+day is used, else the RSS feed; below ``GOSPEL_DEADLINE_GOOGLE_MIN_S``
+(default 30) Edge TTS replaces Cloud TTS.  The request budget is
+``GOSPEL_REQUEST_DEADLINE_S`` (default 280, under Cloud Run's 300); batch
+endpoints give each language an equal share of what is left.
+
+Usage::
+
+    dl = Deadline(REQUEST_BUDGET_S)
+    with deadline.scope(dl):
+        ...
+        resp = http_client.get(url, timeout=15)   # timeout <= dl.remaining()
+
+Worker threads do not inherit the scope by themselves; pools that run
+request work (prefetch, date ranges, saint detail pages) wrap their task
+function with :func:`propagate` in the submitting thread.  Code outside any
+scope sees an unlimited deadline.
+"""
+
+import contextlib
+import contextvars
+import functools
+import math
+import os
+import time
+from typing import Any, Callable, Iterator, Optional
+
+REQUEST_BUDGET_S = float(os.environ.get("GOSPEL_REQUEST_DEADLINE_S", "280"))
+HTML_MIN_S = float(os.environ.get("GOSPEL_DEADLINE_HTML_MIN_S", "15"))
+GOOGLE_MIN_S = float(os.environ.get("GOSPEL_DEADLINE_GOOGLE_MIN_S", "30"))
+
+# Kept back from the audio upload for the RSS upload that follows it.
+UPLOAD_RESERVE_S = 15.0
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request's time budget ran out before *stage* could run."""
+
+    def __init__(self, stage: str):
+        super().__init__(f"deadline exceeded before {stage}")
+        self.stage = stage
+
+
+class Deadline:
+    """A point in time by which the current request must be done (None: never)."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: Optional[float] = None):
+        self.expires_at = None if seconds is None else time.monotonic() + max(0.0, seconds)
+
+    def remaining(self) -> float:
+        """Seconds left (``math.inf`` when unlimited, never negative)."""
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def has(self, seconds: float) -> bool:
+        """True when at least *seconds* are left."""
+        return self.remaining() >= seconds
+
+    def check(self, stage: str) -> None:
+        """Raise :class:`DeadlineExceeded` when the budget is already spent."""
+        if self.expired:
+            raise DeadlineExceeded(stage)
+
+    def timeout(self, default: float, reserve: float = 0.0, stage: str = "request") -> float:
+        """Timeout for one call: *default*, capped at the budget left minus *reserve*."""
+        left = self.remaining() - reserve
+        if left <= 0:
+            raise DeadlineExceeded(stage)
+        return min(default, left)
+
+    def share(self, items_left: int) -> "Deadline":
+        """A deadline for the next of *items_left* items sharing what is left."""
+        if self.expires_at is None:
+            return Deadline()
+        return Deadline(self.remaining() / max(1, items_left))
+
+
+_UNLIMITED = Deadline()
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(
+    "gospel_deadline", default=None
+)
+
+
+def current() -> Deadline:
+    """The deadline in scope (unlimited outside any :func:`scope`)."""
+    return _current.get() or _UNLIMITED
+
+
+@contextlib.contextmanager
+def scope(deadline: Optional[Deadline]) -> Iterator[Deadline]:
+    """Make *deadline* current for the block (None: unlimited)."""
+    deadline = deadline or _UNLIMITED
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def propagate(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap *fn* so it runs under the caller's current deadline, on any thread."""
+    deadline = _current.get()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        token = _current.set(deadline)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    return run
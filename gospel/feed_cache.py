@@ -0,0 +1,235 @@
+"""Process-wide cache of parsed RSS feeds.
+
+``GospelRSSClient`` and ``gospel_tts_app.rss_client.RSSClient`` load their
+feed through :func:`load`, so ``fetch_latest`` followed by ``fetch_all``, or
+several clients reading the same feed in one run, share one download and
+one parse:
+
+  fresh        A feed loaded less than ``GOSPEL_FEED_CACHE_FRESH_S`` seconds
+               ago (default 60) is served with no request.
+  revalidate   Otherwise the feed is re-requested with ``If-None-Match`` /
+               ``If-Modified-Since`` from the last response; a
+               ``304 Not Modified``, or a ``200`` with a byte-identical body,
+               serves the cached parse.
+  parse        A new feed version is parsed once and replaces the entry.
+  stale        When the re-request fails, the cached parse is served
+               (and revalidated again on the next load).
+
+Concurrent loads of the same URL wait for one another rather than
+downloading twice.  A feed that cannot be fetched and was never loaded
+yields None, as before;
+running out of the current deadline raises
+:class:`~gospel.deadline.DeadlineExceeded` instead, so the caller can
+report it as such.
+``GOSPEL_FEED_CACHE=0`` disables the cache.
+
+The clients hand out :class:`FeedEntry` views of the parsed entries: the
+link and date are read straight from the feed, while the TTS-normalised
+title and the plain-text summary are computed on first access only, so a
+caller can drop already-published entries by link for free.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+import feedparser
+import requests
+
+from gospel import deadline, http_client
+from gospel.text_normalizer import html_to_plain_text, normalize_for_tts
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED = os.environ.get("GOSPEL_FEED_CACHE", "1").strip().lower() not in ("0", "false", "no")
+FRESH_S = float(os.environ.get("GOSPEL_FEED_CACHE_FRESH_S", "60"))
+
+# feedparser used to fetch the URL itself; keep its User-Agent.
+FEED_HEADERS = {"User-Agent": feedparser.USER_AGENT}
+
+_lock = threading.Lock()
+_url_locks: Dict[str, threading.Lock] = {}
+_entries: Dict[str, Dict[str, Any]] = {}
+_stats: Dict[str, int] = {
+    "fresh": 0, "not_modified": 0, "unchanged": 0, "parsed": 0, "stale": 0, "errors": 0,
+}
+
+
+def _count(key: str) -> None:
+    with _lock:
+        _stats[key] += 1
+
+
+def _url_lock(url: str) -> threading.Lock:
+    with _lock:
+        return _url_locks.setdefault(url, threading.Lock())
+
+
+def _parse(url: str, resp: requests.Response):
+    return feedparser.parse(resp.content, response_headers={
+        "content-location": url,
+        "content-type": resp.headers.get("Content-Type", ""),
+    })
+
+
+def load(url: str):
+    """Return the parsed feed at *url* (a ``feedparser`` result), or None when unreachable.
+
+    Raises :class:`~gospel.deadline.DeadlineExceeded` when the current
+    deadline runs out before or during the fetch.
+    """
+    if not CACHE_ENABLED:
+        try:
+            resp = http_client.get(url, headers=FEED_HEADERS)
+            resp.raise_for_status()
+        except deadline.DeadlineExceeded:
+            raise
+        except requests.RequestException:
+            return None
+        return _parse(url, resp)
+
+    with _url_lock(url):
+        cached = _entries.get(url)
+        if cached is not None and time.monotonic() - cached["loaded_at"] < FRESH_S:
+            _count("fresh")
+            return cached["feed"]
+
+        headers = dict(FEED_HEADERS)
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["modified"]:
+                headers["If-Modified-Since"] = cached["modified"]
+        try:
+            resp = http_client.get(url, headers=headers)
+            if resp.status_code == 304 and cached is not None:
+                cached["loaded_at"] = time.monotonic()
+                _count("not_modified")
+                return cached["feed"]
+            resp.raise_for_status()
+        except deadline.DeadlineExceeded:
+            raise
+        except requests.RequestException as e:
+            _count("errors")
+            if cached is None:
+                logger.warning("feed %s: fetch failed (%s)", url, e)
+                return None
+            # Ride out the upstream failure on the last good parse.
+            _count("stale")
+            logger.warning("feed %s: fetch failed (%s); serving the copy loaded %.0f s ago",
+                           url, e, time.monotonic() - cached["loaded_at"])
+            return cached["feed"]
+
+        digest = hashlib.sha1(resp.content).hexdigest()
+        if cached is not None and cached["digest"] == digest:
+            _count("unchanged")
+            feed = cached["feed"]
+        else:
+            _count("parsed")
+            feed = _parse(url, resp)
+        _entries[url] = {
+            "feed": feed,
+            "digest": digest,
+            "etag": resp.headers.get("ETag"),
+            "modified": resp.headers.get("Last-Modified"),
+            "loaded_at": time.monotonic(),
+        }
+        return feed
+
+
+def invalidate(url: Optional[str] = None) -> None:
+    """Drop the cached parse of *url* (all feeds when None)."""
+    with _lock:
+        if url is None:
+            _entries.clear()
+        else:
+            _entries.pop(url, None)
+
+
+# ---------------------------------------------------------------------------
+# Entry views
+# ---------------------------------------------------------------------------
+
+class FeedEntry(Mapping):
+    """Read-only dict view of one feed entry with lazily normalised text.
+
+    Keys are ``title``, ``summary``, ``link`` and *date_key* (the raw
+    ``published`` string; ``RSSClient`` calls it ``pub_date``).  ``title``
+    is normalised for TTS and ``summary`` converted to plain text (without
+    TTS smoothing, so parentheses survive for pope-comment attribution
+    detection) the first time each is read.
+    """
+
+    __slots__ = ("_entry", "_feed_url", "_date_key", "_title", "_summary")
+
+    def __init__(self, entry, feed_url: str, date_key: str = "published"):
+        self._entry = entry
+        self._feed_url = feed_url
+        self._date_key = date_key
+        self._title: Optional[str] = None
+        self._summary: Optional[str] = None
+
+    @property
+    def link(self) -> str:
+        return self._entry.get("link", "")
+
+    @property
+    def published(self) -> str:
+        return self._entry.get("published", "")
+
+    @property
+    def raw_title(self) -> str:
+        """The title as published in the feed, before TTS normalisation."""
+        return self._entry.get("title", "")
+
+    @property
+    def title(self) -> str:
+        if self._title is None:
+            self._title = normalize_for_tts(self.raw_title, feed_url=self._feed_url, flatten_lines=False)
+        return self._title
+
+    @property
+    def summary(self) -> str:
+        if self._summary is None:
+            raw = self._entry.get("summary") or self._entry.get("description") or ""
+            self._summary = html_to_plain_text(raw)
+        return self._summary
+
+    def _keys(self):
+        return ("title", "summary", "link", self._date_key)
+
+    def __getitem__(self, key: str) -> str:
+        if key == self._date_key:
+            return self.published
+        if key in ("title", "summary", "link"):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return 4
+
+    def __repr__(self) -> str:
+        return f"FeedEntry({self.link or self.raw_title!r})"
+
+
+# ---------------------------------------------------------------------------
+# Stats
+# ---------------------------------------------------------------------------
+
+def feed_cache_stats() -> Dict[str, int]:
+    """Return counters: fresh, not_modified, unchanged, parsed, stale, errors."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_feed_cache_stats() -> None:
+    with _lock:
+        for key in _stats:
+            _stats[key] = 0
@@ -57,9 +57,8 @@ def generate_for_language(lang: str, out_dir: str, speed: str) -> Dict:
     title = description = ""
     episode = None
     try:
-        from gospel.html_scraper import VaticanHTMLScraper
-        scraper = VaticanHTMLScraper(lang)
-        title, segments = scraper.fetch_segments()
+        from gospel.lookahead import liturgy_segments
+        title, segments = liturgy_segments(lang)
         episode = audio_gen.create_episode_from_segments(title, segments)
         description = title
     except Exception as scraper_err:
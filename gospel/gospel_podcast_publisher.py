@@ -8,6 +8,8 @@ from urllib.parse import urlparse
 import xml.etree.ElementTree as ET
 from xml.dom import minidom
 
+from gospel import deadline
+
 logger = logging.getLogger(__name__)
 
 class GospelPodcastPublisher:
@@ -140,7 +142,15 @@ class GospelPodcastPublisher:
             logger.warning(f"Error during episode pruning: {e}")
 
     def upload_audio(self, audio_path: str, retries: int = 3) -> Optional[str]:
+        """Upload *audio_path* and return its public URL (None after *retries* failures).
+
+        Each attempt's timeout is capped by the current deadline, keeping
+        ``deadline.UPLOAD_RESERVE_S`` for the RSS upload; raises
+        :class:`~gospel.deadline.DeadlineExceeded` when no time is left.
+        """
+        dl = deadline.current()
         for attempt in range(1, retries + 1):
+            timeout = dl.timeout(300, reserve=deadline.UPLOAD_RESERVE_S, stage="audio upload")
             try:
                 self._init_firebase()
                 bucket = self.storage.bucket()
@@ -150,7 +160,7 @@ class GospelPodcastPublisher:
                 blob.upload_from_filename(
                     audio_path,
                     content_type='audio/mpeg',
-                    timeout=300,  # 5-minute upload timeout
+                    timeout=timeout,  # at most 5 minutes
                 )
                 blob.make_public()
                 return blob.public_url
@@ -160,6 +170,63 @@ class GospelPodcastPublisher:
                     logger.error(f"Firebase upload failed after {retries} attempts.")
                     return None
 
+    def download_cached_audio(self, name: str, dest_path: str) -> bool:
+        """Download ``{storage_prefix}/audio_cache/{name}`` to *dest_path*.
+
+        Returns False when the blob does not exist or cannot be read, or
+        when the current deadline leaves no time beyond the upload reserve.
+        """
+        try:
+            timeout = deadline.current().timeout(
+                300, reserve=deadline.UPLOAD_RESERVE_S, stage="audio cache download")
+            self._init_firebase()
+            blob = self.storage.bucket().blob(f"{self.storage_prefix}/audio_cache/{name}")
+            if not blob.exists(timeout=timeout):
+                return False
+            blob.download_to_filename(dest_path, timeout=timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not download cached audio {name}: {e}")
+            return False
+
+    def upload_cached_audio(self, audio_path: str, name: str) -> bool:
+        """Store *audio_path* as ``{storage_prefix}/audio_cache/{name}`` (not public).
+
+        Best effort, and given at most half of the current deadline's time
+        left, so the episode upload that follows gets as much.
+        """
+        try:
+            timeout = deadline.current().share(2).timeout(300, stage="audio cache upload")
+            self._init_firebase()
+            blob = self.storage.bucket().blob(f"{self.storage_prefix}/audio_cache/{name}")
+            blob.upload_from_filename(audio_path, content_type='audio/mpeg', timeout=timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Could not upload cached audio {name}: {e}")
+            return False
+
+    def prune_cached_audio(self, prefix: str, keep: str) -> int:
+        """Delete ``{storage_prefix}/audio_cache/{prefix}*`` blobs other than *keep*.
+
+        Best effort; returns how many were deleted.
+        """
+        deleted = 0
+        try:
+            timeout = deadline.current().timeout(
+                60, reserve=deadline.UPLOAD_RESERVE_S, stage="audio cache prune")
+            self._init_firebase()
+            bucket = self.storage.bucket()
+            base = f"{self.storage_prefix}/audio_cache/"
+            for blob in bucket.list_blobs(prefix=base + prefix, timeout=timeout):
+                if blob.name == base + keep:
+                    continue
+                blob.delete(timeout=timeout)
+                deleted += 1
+                logger.info(f"Deleted superseded cached audio: {blob.name}")
+        except Exception as e:
+            logger.warning(f"Could not prune cached audio {prefix}*: {e}")
+        return deleted
+
     def add_episode(self, audio_url: str, title: str, description: str, duration: int = 0,
                     pub_date: str = '', guid: str = '', file_size: int = 0):
         if not pub_date:
@@ -253,7 +320,8 @@ class GospelPodcastPublisher:
             bucket = self.storage.bucket()
             blob = bucket.blob(self.rss_blob_path)
             blob.cache_control = "no-cache, no-store, must-revalidate"
-            blob.upload_from_filename(rss_local_path, content_type='application/rss+xml; charset=utf-8')
+            blob.upload_from_filename(rss_local_path, content_type='application/rss+xml; charset=utf-8',
+                                      timeout=deadline.current().timeout(60, stage="RSS upload"))
             blob.patch()
             blob.make_public()
             return True
@@ -0,0 +1,200 @@
+"""Per-host politeness limiter shared by every Vatican News client.
+
+The liturgy scraper, the saint scraper (pages, detail pages and HEAD
+probes) and both RSS clients all send their requests through
+:func:`gospel.http_client.request`, which takes a slot from the limiter of
+the request's host before touching the network:
+
+  * Concurrency: at most ``GOSPEL_HOST_MAX_CONCURRENT`` requests in flight
+    per host (default 4), whatever the number of worker threads.
+  * Rate: a token bucket of ``GOSPEL_HOST_RPS`` requests per second
+    (default 4) with bursts of up to ``GOSPEL_HOST_BURST`` (default 4).
+  * Retry-After: a ``429`` or ``503`` response carrying ``Retry-After``
+    pauses the whole host until then (capped at ``MAX_PAUSE_S``), so the
+    other threads back off too instead of each finding out on its own.
+  * Deadline: a request that would wait for its slot past the current
+    :mod:`gospel.deadline` raises ``DeadlineExceeded`` instead of waiting.
+  * Stats: time spent waiting for a slot, per host — see :func:`limiter_stats`.
+
+``GOSPEL_HOST_LIMIT=0`` disables the limiter.  Replayed fixtures
+(:mod:`gospel.http_fixtures`) never reach the network and are not limited.
+"""
+
+import contextlib
+import datetime
+import email.utils
+import math
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+from gospel import deadline
+
+LIMIT_ENABLED = os.environ.get("GOSPEL_HOST_LIMIT", "1").strip().lower() not in ("0", "false", "no")
+MAX_CONCURRENT = int(os.environ.get("GOSPEL_HOST_MAX_CONCURRENT", "4"))
+RATE_PER_S = float(os.environ.get("GOSPEL_HOST_RPS", "4"))
+BURST = int(os.environ.get("GOSPEL_HOST_BURST", "4"))
+
+# Longest pause a Retry-After header can impose on a host.
+MAX_PAUSE_S = 120.0
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` value (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class HostLimiter:
+    """Concurrency cap plus token bucket for one host."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT, rate: float = RATE_PER_S,
+                 burst: int = BURST):
+        self.max_concurrent = max(1, max_concurrent)
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._in_flight = 0
+        self.stats = {"requests": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0,
+                      "throttled": 0, "peak_in_flight": 0}
+
+    def _reserve(self) -> float:
+        """Take a token (possibly one not yet refilled); return how long to sleep."""
+        with self._lock:
+            now = time.monotonic()
+            if self.rate > 0:
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+                self._refilled = now
+                self._tokens -= 1
+                wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            else:
+                wait = 0.0
+            return max(wait, self._paused_until - now)
+
+    def _refund(self) -> None:
+        """Give back the token of a request that will not be sent."""
+        with self._lock:
+            if self.rate > 0:
+                self._tokens = min(self.burst, self._tokens + 1)
+
+    @contextlib.contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one request slot for the duration of the block.
+
+        Raises :class:`~gospel.deadline.DeadlineExceeded` when the current
+        deadline would run out before the slot is granted.
+        """
+        dl = deadline.current()
+        start = time.monotonic()
+        left = dl.remaining()
+        if not self._slots.acquire(timeout=None if left == math.inf else left):
+            raise deadline.DeadlineExceeded("a request slot")
+        try:
+            wait = self._reserve()
+            if wait > 0:
+                if wait >= dl.remaining():
+                    self._refund()
+                    raise deadline.DeadlineExceeded("a request slot (host paused or rate-limited)")
+                time.sleep(wait)
+            waited = time.monotonic() - start
+            with self._lock:
+                self._in_flight += 1
+                s = self.stats
+                s["requests"] += 1
+                if waited >= 0.001:
+                    s["waited"] += 1
+                    s["wait_seconds"] += waited
+                    s["max_wait_seconds"] = max(s["max_wait_seconds"], waited)
+                s["peak_in_flight"] = max(s["peak_in_flight"], self._in_flight)
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+        finally:
+            self._slots.release()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request to this host for *seconds* (capped at MAX_PAUSE_S)."""
+        until = time.monotonic() + min(max(0.0, seconds), MAX_PAUSE_S)
+        with self._lock:
+            self._paused_until = max(self._paused_until, until)
+            self.stats["throttled"] += 1
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def for_host(host: str) -> HostLimiter:
+    """Return the limiter of *host*, creating it on first use."""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = HostLimiter()
+        return limiter
+
+
+@contextlib.contextmanager
+def slot(host: str) -> Iterator[None]:
+    """Hold a request slot of *host* for the block (no-op when disabled)."""
+    if not LIMIT_ENABLED:
+        yield
+        return
+    with for_host(host).slot():
+        yield
+
+
+def observe(host: str, status: int, retry_after: Optional[str]) -> None:
+    """Pause *host* when a throttling response asks for it via Retry-After."""
+    if not LIMIT_ENABLED or status not in THROTTLE_STATUSES:
+        return
+    seconds = parse_retry_after(retry_after)
+    if seconds is not None:
+        for_host(host).pause(seconds)
+
+
+# ---------------------------------------------------------------------------
+# Stats
+# ---------------------------------------------------------------------------
+
+def limiter_stats() -> Dict[str, Dict[str, float]]:
+    """Return per-host totals: requests, waits, wait time (ms), throttles, peak concurrency."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    out = {}
+    for host, limiter in limiters.items():
+        with limiter._lock:
+            s = dict(limiter.stats)
+        out[host] = {
+            "requests": s["requests"],
+            "waited": s["waited"],
+            "wait_ms": round(s["wait_seconds"] * 1000, 1),
+            "avg_wait_ms": round(s["wait_seconds"] / s["requests"] * 1000, 1) if s["requests"] else 0.0,
+            "max_wait_ms": round(s["max_wait_seconds"] * 1000, 1),
+            "throttled": s["throttled"],
+            "peak_in_flight": s["peak_in_flight"],
+        }
+    return out
+
+
+def reset_limiter_stats() -> None:
+    """Forget every host's limiter, stats and pauses included."""
+    with _limiters_lock:
+        _limiters.clear()
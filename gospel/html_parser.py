@@ -0,0 +1,144 @@
+"""HTML parser backend for the Vatican News scrapers.
+
+Both scrapers build their BeautifulSoup trees through :func:`make_soup`
+instead of naming a parser, so the backend is chosen in one place:
+
+  lxml         C parser, several times faster than html.parser on full
+               pages.  Used when the ``lxml`` package is installed.
+  html.parser  Python standard library; always available, the fallback.
+
+``GOSPEL_HTML_PARSER`` forces a backend (``lxml`` or ``html.parser``);
+the default ``auto`` picks the fastest one installed.  A forced backend
+that is not installed falls back to html.parser with a warning.
+
+Partial parsing: the scrapers pass a :class:`SubtreeFilter` naming the
+subtrees they read (``section--isStatic`` blocks, ``indicazioneLiturgica``,
+saint detail links).  Navigation, footers, scripts and promos are then
+never turned into tree objects.  A scraper that finds what it needs missing
+from the partial tree re-parses the whole page.  ``GOSPEL_PARTIAL_PARSE=0``
+always builds the full tree.
+
+selectolax is not offered: the scrapers walk and edit the BeautifulSoup
+tree (``find_all``, ``decompose``, parent navigation), which selectolax
+does not provide.
+
+Backends build slightly different trees from malformed markup, so any
+backend change is gated by the fixture parity check in
+``gospel/benchmarks/html_parser_bench.py``.
+"""
+
+import contextlib
+import contextvars
+import logging
+import os
+import re
+from typing import Iterable, Iterator, List, Optional
+
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+try:
+    import lxml  # noqa: F401  (only probed; bs4 loads it by name)
+except ImportError:  # pragma: no cover - optional dependency
+    lxml = None
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("lxml", "html.parser")
+DEFAULT_BACKEND = os.environ.get("GOSPEL_HTML_PARSER", "auto").strip().lower() or "auto"
+PARTIAL_PARSE = os.environ.get("GOSPEL_PARTIAL_PARSE", "1").strip().lower() not in ("0", "false", "no")
+
+_OVERRIDE: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "gospel_html_parser_backend", default=None
+)
+_PARTIAL: contextvars.ContextVar[Optional[bool]] = contextvars.ContextVar(
+    "gospel_html_parser_partial", default=None
+)
+
+
+class SubtreeFilter(ElementFilter):
+    """Keep only the subtrees rooted at a tag with one of *classes*, or at an
+    ``<a>`` whose ``href`` matches *href*.
+
+    The decision is taken while parsing, from the raw attributes, so nothing
+    outside those subtrees (including stray top-level text) is built.
+    """
+
+    def __init__(self, classes: Iterable[str], href: Optional[str] = None):
+        super().__init__()
+        self.classes = frozenset(classes)
+        self.href = re.compile(href) if href else None
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if not attrs:
+            return False
+        cls = attrs.get("class")
+        if cls:
+            values = cls.split() if isinstance(cls, str) else cls
+            if not self.classes.isdisjoint(values):
+                return True
+        if self.href is not None and name == "a":
+            link = attrs.get("href")
+            return bool(link) and bool(self.href.search(link))
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first."""
+    return [b for b in BACKENDS if b != "lxml" or lxml is not None]
+
+
+def _resolve(name: str) -> str:
+    if name == "auto":
+        return available_backends()[0]
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name!r} (expected auto or one of {BACKENDS})")
+    if name not in available_backends():
+        logger.warning("HTML parser backend %r is not installed; using html.parser", name)
+        return "html.parser"
+    return name
+
+
+def active_backend() -> str:
+    """The backend :func:`make_soup` uses in the current context."""
+    return _resolve(_OVERRIDE.get() or DEFAULT_BACKEND)
+
+
+@contextlib.contextmanager
+def using_backend(name: str) -> Iterator[str]:
+    """Parse with backend *name* inside the block (benchmarks, parity checks)."""
+    token = _OVERRIDE.set(_resolve(name))
+    try:
+        yield _OVERRIDE.get()
+    finally:
+        _OVERRIDE.reset(token)
+
+
+def partial_enabled() -> bool:
+    override = _PARTIAL.get()
+    return PARTIAL_PARSE if override is None else override
+
+
+@contextlib.contextmanager
+def partial_parsing(enabled: bool) -> Iterator[bool]:
+    """Turn partial parsing on or off inside the block."""
+    token = _PARTIAL.set(enabled)
+    try:
+        yield enabled
+    finally:
+        _PARTIAL.reset(token)
+
+
+def make_soup(markup: str, parse_only: Optional[ElementFilter] = None) -> BeautifulSoup:
+    """Parse *markup* with the active backend.
+
+    *parse_only* (e.g. a :class:`SubtreeFilter`) restricts the tree to the
+    matching subtrees unless partial parsing is disabled; ``soup.parse_only``
+    tells the caller which kind of tree it got.
+    """
+    if parse_only is not None and not partial_enabled():
+        parse_only = None
+    return BeautifulSoup(markup, active_backend(), parse_only=parse_only)
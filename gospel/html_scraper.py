@@ -18,22 +18,33 @@ split off and emitted as a separate segment.
 """
 
 import datetime
+import hashlib
+import html as html_lib
+import logging
 import re
-from typing import Optional
+import threading
+from typing import Iterator, Optional
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString, Tag
 
+from gospel import page_cache
+from gospel.date_range import DayResult, dates_between, iter_days
+from gospel.html_parser import SubtreeFilter, make_soup
+from gospel.segments import KIND_GOSPEL, KIND_READING, Segment
 from gospel.text_normalizer import (
     _extract_pope_meta,
     _find_pope_attribution_in_lines,
+    _finish_plain_text,
     _strip_bare_verse_refs,
+    _strip_html_tags,
     _strip_section_verse_refs,
     html_to_plain_text,
     normalize_for_tts,
     POPE_COMMENT_LABELS,
 )
 
+logger = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Per-language page configuration
 # ---------------------------------------------------------------------------
@@ -99,6 +110,9 @@ _LANG_CFG: dict[str, dict] = {
 
 _BASE_URL = "https://www.vaticannews.va"
 
+# Partial parse: liturgy sections and the liturgical-day element only.
+_LITURGY_SUBTREES = SubtreeFilter({"section--isStatic", "indicazioneLiturgica"})
+
 _HTTP_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (compatible; GospelPodcastBot/1.0; "
@@ -125,12 +139,10 @@ def day_url(lang: str, date: datetime.date) -> str:
     )
 
 
-def _fetch(url: str, timeout: int = 15) -> str:
-    resp = requests.get(url, headers=_HTTP_HEADERS, timeout=timeout)
-    resp.raise_for_status()
-    # Vatican News pages are always UTF-8; force the encoding so that
-    # resp.text does not mis-decode accented characters as latin-1.
-    return resp.content.decode("utf-8", errors="replace")
+def _fetch(url: str, timeout: int = 15, date: Optional[datetime.date] = None) -> str:
+    # Pooled session with retries behind the on-disk page cache; a copy of the
+    # page for a past *date* taken once it had settled is served without a request.
+    return page_cache.fetch_text(url, headers=_HTTP_HEADERS, timeout=timeout, date=date)
 
 
 # ---------------------------------------------------------------------------
@@ -138,17 +150,32 @@ def _fetch(url: str, timeout: int = 15) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _find_h2(soup: BeautifulSoup, keyword: str) -> Optional[object]:
-    """Return the first <h2> whose text contains *keyword* (case-insensitive)."""
-    kw = keyword.strip().lower()
-    for h2 in soup.find_all("h2"):
-        if kw in h2.get_text(" ", strip=True).lower():
-            return h2
-    return None
+class _SectionIndex:
+    """Heading text → section content, from a single pass over the page's <h2>s.
+
+    The page tree is parsed once; every section lookup afterwards reads from
+    this index and the nodes it points at, never from a re-serialised copy.
+    """
 
+    def __init__(self, soup: BeautifulSoup):
+        self._headings = [
+            (h2.get_text(" ", strip=True).lower(), h2) for h2 in soup.find_all("h2")
+        ]
+
+    def find(self, keyword: str) -> Optional[list]:
+        """Content nodes of the first section whose heading contains *keyword*.
+
+        Returns ``None`` when no heading matches (case-insensitive).
+        """
+        kw = keyword.strip().lower()
+        for text, h2 in self._headings:
+            if kw in text:
+                return _section_nodes(h2)
+        return None
 
-def _collect_section_html(h2_elem) -> str:
-    """Collect raw HTML content from the section that contains *h2_elem*.
+
+def _section_nodes(h2_elem) -> list:
+    """Return the nodes holding the content of the section headed by *h2_elem*.
 
     Vatican News wraps each liturgy section as::
 
@@ -159,7 +186,7 @@ def _collect_section_html(h2_elem) -> str:
 
     Strategy:
     1. Navigate h2 → parent(section__head) → grandparent(section)
-       and return the ``section__wrapper`` div's inner HTML.
+       and return the ``section__wrapper`` div.
     2. If the wrapper div is not found, try sibling divs of the head.
     3. Fall back to plain ``h2.next_siblings`` (flat layout).
     """
@@ -171,24 +198,28 @@ def _collect_section_html(h2_elem) -> str:
             # Find section__wrapper (or any sibling div of section__head that has content)
             wrapper = section.find(class_="section__wrapper")
             if wrapper and wrapper.get_text(strip=True):
-                return str(wrapper)
+                return [wrapper]
             # Try any sibling div of head_div that is not the head itself
             for child in section.children:
                 if child is head_div:
                     continue
                 if getattr(child, "name", None) == "div" and child.get_text(strip=True):
-                    return str(child)
+                    return [child]
 
     # Strategy 2: h2 siblings at the same DOM level (flat layout)
-    parts = []
+    nodes = []
     for sib in h2_elem.next_siblings:
         if getattr(sib, "name", None) == "h2":
             break
-        parts.append(str(sib))
-    return "".join(parts)
+        nodes.append(sib)
+    return nodes
+
 
+_VERSE_REF_TAGS = ("span", "sup", "small")
+_VERSE_REF_RE = re.compile(r"^\d*[A-ZÀ-Ü][a-zà-ü]{1,6}\s+\d[\d,;:.\-a-zA-Z\s]*$")
 
-def _remove_verse_ref_inlines(soup_elem) -> None:
+
+def _remove_verse_ref_inlines(nodes: list) -> list:
     """Decompose inline elements that contain only verse references.
 
     Examples: <span>2Re 5,1-15a</span>, <span>Lc 4,24-30</span>.
@@ -198,16 +229,82 @@ def _remove_verse_ref_inlines(soup_elem) -> None:
     "Dal secondo libro dei Re 2Re 5 1 a 15" that the verse-stripping logic
     cannot fully clean.  Removing them at the DOM level is the cleanest fix.
     The book name line already provides enough context for TTS.
+
+    Works in place on the page tree; returns *nodes* minus any top-level node
+    that was removed.
     """
-    for tag in soup_elem.find_all(["span", "sup", "small"]):
-        txt = tag.get_text("", strip=True)
-        # Match: optional leading digit + abbreviated/full book name + verse numbers
-        # e.g. "2Re 5,1-15a", "Lc 4,24-30", "Mt 21,33-43", "Salmo 41"
-        if re.match(
-            r"^\d*[A-ZÀ-Ü][a-zà-ü]{1,6}\s+\d[\d,;:.\-a-zA-Z\s]*$",
-            txt,
+    kept = []
+    for node in nodes:
+        if not isinstance(node, Tag):
+            kept.append(node)
+            continue
+        candidates = node.find_all(_VERSE_REF_TAGS)
+        if node.name in _VERSE_REF_TAGS:
+            candidates.insert(0, node)
+        for tag in candidates:
+            if tag.decomposed:
+                continue
+            # Match: optional leading digit + abbreviated/full book name + verse numbers
+            # e.g. "2Re 5,1-15a", "Lc 4,24-30", "Mt 21,33-43", "Salmo 41"
+            if _VERSE_REF_RE.match(tag.get_text("", strip=True)):
+                tag.decompose()
+        if not node.decomposed:
+            kept.append(node)
+    return kept
+
+
+_NEWLINE_CLOSE_TAGS = frozenset({"p", "div", "li", "h1", "h2", "h3", "h4", "h5", "h6"})
+_LI_OPEN_RE = re.compile(r"li\b", re.IGNORECASE)
+_TAG_NAME_RE = re.compile(r"[a-zA-Z][\w:.-]*")
+
+
+def _tree_text(nodes: list) -> Optional[str]:
+    """Return what ``_strip_html_tags("".join(map(str, nodes)))`` would, from the tree.
+
+    Tags are replaced by the same newline / ``"- "`` / space the regexes
+    produce for their serialised form, and text nodes are emitted in their
+    serialised (entity-escaped) form, so ``_finish_plain_text`` gives the
+    same result as ``html_to_plain_text`` on the HTML.  Returns ``None`` when
+    a raw string (a comment or script body with a stray ``<``) could make the
+    regexes match across node boundaries; callers then fall back to the
+    serialise-and-strip path.
+    """
+    out: list[str] = []
+    stack = [(node, False) for node in reversed(nodes)]
+    top_level = set(map(id, nodes))
+    while stack:
+        node, closing = stack.pop()
+        if closing:
+            out.append("\n" if node.name in _NEWLINE_CLOSE_TAGS else " ")
+            continue
+        if isinstance(node, NavigableString):
+            # str() of a bare string is unescaped; inside a tag it is escaped.
+            if id(node) in top_level:
+                text = str(node)
+                if "<" in text:
+                    return None
+            else:
+                text = node.output_ready()
+            if "<" in text or ">" in text:
+                text = _strip_html_tags(text)
+                if "<" in text:
+                    return None
+            out.append(text)
+            continue
+        if not _TAG_NAME_RE.fullmatch(node.name) or any(
+            not _TAG_NAME_RE.fullmatch(key) for key in node.attrs
         ):
-            tag.decompose()
+            return None   # malformed markup, e.g. "<y<br>" parsed as one tag
+        if node.name == "br" and not node.attrs:
+            out.append("\n")
+        elif _LI_OPEN_RE.match(node.name):
+            out.append("- ")
+        else:
+            out.append(" ")
+        if not node.is_empty_element:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(node.contents))
+    return "".join(out)
 
 
 def _split_readings(read_plain: str, cfg: dict) -> tuple[str, str]:
@@ -269,18 +366,18 @@ def _split_readings(read_plain: str, cfg: dict) -> tuple[str, str]:
     return read_plain.strip(), ""
 
 
-def _section_plain(h2_elem) -> str:
-    """Extract plain multiline text from the section bounded by *h2_elem*.
+def _section_plain(nodes: list) -> str:
+    """Extract plain multiline text from section content *nodes*.
 
     Removes inline verse-reference tags before text extraction so the book
-    name is not contaminated with concatenated abbreviations.
+    name is not contaminated with concatenated abbreviations.  The text is
+    read straight from the parsed tree (see :func:`_tree_text`).
     """
-    html_chunk = _collect_section_html(h2_elem)
-    if not html_chunk.strip():
-        return ""
-    sec_soup = BeautifulSoup(html_chunk, "html.parser")
-    _remove_verse_ref_inlines(sec_soup)
-    return html_to_plain_text(str(sec_soup))
+    nodes = _remove_verse_ref_inlines(nodes)
+    text = _tree_text(nodes)
+    if text is None:
+        return html_to_plain_text("".join(str(n) for n in nodes))
+    return _finish_plain_text(text)
 
 
 # ---------------------------------------------------------------------------
@@ -351,33 +448,84 @@ def _pope_segment(pope_plain: str, lang: str) -> Optional[str]:
     return f"{header}\n{body_norm}" if body_norm else header
 
 
-def _extract_title(soup: BeautifulSoup, lang: str, date: datetime.date) -> str:
-    """Extract the liturgical day title from the page.
+# Text kept behind the last date occurrence before it can no longer match.
+_TITLE_WINDOW = 300
 
-    Strategy:
-    1. Look for Vatican News's ``indicazioneLiturgica`` element which contains
-       the liturgical day name (e.g. "Lunedì della terza settimana di Quaresima").
-    2. Regex over the full page text for DD/MM/YYYY followed by a description.
-    3. Fall back to a plain formatted date.
+
+def _text_after_date(soup: BeautifulSoup, date_str: str) -> Optional[str]:
+    """Search the page text for *date_str* followed by a short description.
+
+    Same regex as a search over ``soup.get_text(" ", strip=True)``, but the
+    strings are streamed: nothing is kept before the first date occurrence,
+    and only a short window after it.
     """
+    rx = re.compile(re.escape(date_str) + r"\s+([^\s].{5,80}?)(?:\s{2,}|\Z)")
+    buf = ""
+    for s in soup.stripped_strings:
+        if not buf:
+            if date_str not in s:
+                continue
+            buf = s
+        else:
+            buf = f"{buf} {s}"
+        m = rx.search(buf)
+        # A match that ends on \Z only holds at the real end of the page, and
+        # an earlier date still inside the window may yet match with more text.
+        if m and (m.end() < len(buf) or buf[m.end() - 1].isspace()):
+            earlier = buf.rfind(date_str, 0, m.start())
+            if earlier == -1 or len(buf) - earlier > _TITLE_WINDOW:
+                return m.group(1)
+        elif len(buf) > 4 * _TITLE_WINDOW:
+            cut = buf.find(date_str, len(buf) - _TITLE_WINDOW)
+            buf = buf[cut:] if cut != -1 else ""
+    m = rx.search(buf)
+    return m.group(1) if m else None
+
+
+def _title_from_page(soup: BeautifulSoup, lang: str, date: datetime.date) -> Optional[str]:
+    """Title from strategies 1 and 2 of :func:`_extract_title`, or None."""
     # Strategy 1: Vatican News specific element (consistent across all languages)
+    title = _title_from_element(soup, lang)
+    if title is not None:
+        return title
+
+    # Strategy 2: date followed by a description in the page text
+    day_desc = _text_after_date(soup, date.strftime("%d/%m/%Y"))
+    if day_desc:
+        day_desc = day_desc.strip()
+        if day_desc and len(day_desc) < 120:
+            return normalize_for_tts(day_desc, lang=lang)
+    return None
+
+
+def _title_from_element(soup: BeautifulSoup, lang: str) -> Optional[str]:
+    """Title from the ``indicazioneLiturgica`` element, or None when absent."""
     il_elem = soup.find(class_="indicazioneLiturgica")
     if il_elem:
         day_desc = il_elem.get_text(" ", strip=True).strip()
         if day_desc and len(day_desc) < 120:
             return normalize_for_tts(day_desc, lang=lang)
+    return None
 
-    # Strategy 2: regex over full page text
-    date_str = date.strftime("%d/%m/%Y")
-    full_text = soup.get_text(" ", strip=True)
-    m = re.search(
-        re.escape(date_str) + r"\s+([^\s].{5,80}?)(?:\s{2,}|\Z)",
-        full_text,
-    )
-    if m:
-        day_desc = m.group(1).strip()
-        if day_desc and len(day_desc) < 120:
-            return normalize_for_tts(day_desc, lang=lang)
+
+def _extract_title(soup: BeautifulSoup, lang: str, date: datetime.date,
+                   html: Optional[str] = None) -> str:
+    """Extract the liturgical day title from the page.
+
+    Strategy:
+    1. Look for Vatican News's ``indicazioneLiturgica`` element which contains
+       the liturgical day name (e.g. "Lunedì della terza settimana di Quaresima").
+    2. DD/MM/YYYY followed by a description in the page text.
+    3. Fall back to a plain formatted date.
+
+    When *soup* holds only part of the page and strategies 1 and 2 find
+    nothing in it, they are tried again on the full tree built from *html*.
+    """
+    title = _title_from_page(soup, lang, date)
+    if title is None and html is not None and soup.parse_only is not None:
+        title = _title_from_page(make_soup(html), lang, date)
+    if title is not None:
+        return title
 
     # Strategy 3: plain date fallback
     try:
@@ -387,6 +535,82 @@ def _extract_title(soup: BeautifulSoup, lang: str, date: datetime.date) -> str:
     return normalize_for_tts(date_fmt, lang=lang)
 
 
+# ---------------------------------------------------------------------------
+# Page-structure fingerprint
+# ---------------------------------------------------------------------------
+# Checked on the raw HTML right after the fetch, before any parsing.  Segments
+# only ever come from sections whose <h2> contains one of the configured
+# keywords, so a page with none of them would parse and normalise for nothing
+# and then raise; it is rejected at once so callers fall back to RSS.  The
+# skeleton classes are recorded per language to show layout drift.
+
+_H2_RE = re.compile(r"<h2\b[^>]*>(.*?)</h2\s*>", re.IGNORECASE | re.DOTALL)
+_INNER_TAG_RE = re.compile(r"<[^>]*>")
+_SECTION_KEYS = ("h2_reading", "h2_gospel", "h2_pope")
+_SKELETON_CLASSES = ("section--isStatic", "section__head", "section__wrapper", "indicazioneLiturgica")
+
+_fingerprint_lock = threading.Lock()
+_fingerprint_stats: dict[str, dict] = {}
+
+
+class PageStructureError(RuntimeError):
+    """The fetched page does not have the liturgy layout the scraper reads."""
+
+
+def page_fingerprint(html: str, lang: str) -> dict:
+    """Cheap structural fingerprint of a liturgy page, from the raw HTML.
+
+    Returns ``sections`` (the section keys whose keyword appears in an
+    ``<h2>``), ``skeleton`` (occurrences of each layout class), a short
+    ``signature`` combining both, and ``ok`` (at least one section found).
+    """
+    cfg = _LANG_CFG[lang]
+    headings = [
+        " ".join(html_lib.unescape(_INNER_TAG_RE.sub(" ", m.group(1))).split()).lower()
+        for m in _H2_RE.finditer(html)
+    ]
+    sections = [
+        key for key in _SECTION_KEYS
+        if any(cfg[key].strip().lower() in h for h in headings)
+    ]
+    skeleton = {cls: html.count(cls) for cls in _SKELETON_CLASSES}
+    signature = ",".join(sections) + "|" + ",".join(
+        cls for cls in _SKELETON_CLASSES if skeleton[cls]
+    )
+    return {"sections": sections, "skeleton": skeleton, "signature": signature, "ok": bool(sections)}
+
+
+def _record_fingerprint(lang: str, fp: dict) -> None:
+    with _fingerprint_lock:
+        st = _fingerprint_stats.setdefault(lang, {
+            "checks": 0, "mismatches": 0, "signature_changes": 0,
+            "signature": None, "missing": {key: 0 for key in _SECTION_KEYS},
+        })
+        st["checks"] += 1
+        if not fp["ok"]:
+            st["mismatches"] += 1
+        for key in _SECTION_KEYS:
+            if key not in fp["sections"]:
+                st["missing"][key] += 1
+        previous = st["signature"]
+        st["signature"] = fp["signature"]
+        if previous is not None and previous != fp["signature"]:
+            st["signature_changes"] += 1
+            logger.info("[%s] liturgy page structure changed: %s -> %s", lang, previous, fp["signature"])
+
+
+def fingerprint_stats() -> dict[str, dict]:
+    """Per-language fingerprint counters: checks, mismatches, signature changes,
+    the last signature and how often each section was missing."""
+    with _fingerprint_lock:
+        return {lang: {**st, "missing": dict(st["missing"])} for lang, st in _fingerprint_stats.items()}
+
+
+def reset_fingerprint_stats() -> None:
+    with _fingerprint_lock:
+        _fingerprint_stats.clear()
+
+
 # ---------------------------------------------------------------------------
 # Main scraper class
 # ---------------------------------------------------------------------------
@@ -409,6 +633,9 @@ class VaticanHTMLScraper:
             )
         self.lang = lang
         self._cfg = _LANG_CFG[lang]
+        # SHA-1 of the last page fetch_segments() fetched (the content store's source hash);
+        # per call state, so one instance must not fetch on several threads at once.
+        self.page_hash: Optional[str] = None
 
     def day_url(self, date: Optional[datetime.date] = None) -> str:
         """Return the Vatican News URL for today (or *date*)."""
@@ -416,38 +643,98 @@ class VaticanHTMLScraper:
 
     def fetch_segments(
         self, date: Optional[datetime.date] = None
-    ) -> tuple[str, list[str]]:
+    ) -> tuple[str, list[Segment]]:
         """Fetch the Vatican News page and return ``(title, segments)``.
 
-        *segments* is a list of normalised text blocks — one per liturgy
-        section (reading(s), gospel, pope comment) — ready to pass directly to
-        ``AudioGenerator.create_episode_from_segments()``.
+        *segments* is a list of :class:`~gospel.segments.Segment` — one per
+        liturgy section (reading(s), gospel, pope comment) — ready to pass
+        directly to ``AudioGenerator.create_episode_from_segments()``.
 
         Raises
         ------
         requests.HTTPError
             When the page cannot be fetched (e.g. 404 for a future date).
+        PageStructureError
+            When the fetched page has none of the expected section headings;
+            raised before any parsing.
         RuntimeError
             When the page is fetched but no liturgy content is recognised.
         """
         if date is None:
             date = datetime.date.today()
+        html = self.fetch_page(date)
+        return self.page_segments(html, date, url=self.day_url(date))
+
+    def fetch_page(self, date: datetime.date) -> str:
+        """Fetch the raw HTML of the page for *date* and set :attr:`page_hash`."""
+        html = _fetch(self.day_url(date), date=date)
+        self.page_hash = hashlib.sha1(html.encode("utf-8")).hexdigest()
+        return html
+
+    def page_segments(
+        self, html: str, date: datetime.date, url: Optional[str] = None
+    ) -> tuple[str, list[Segment]]:
+        """Check the fingerprint of a fetched page, then :meth:`parse_page` it.
+
+        Raises :class:`PageStructureError` or ``RuntimeError`` as
+        :meth:`fetch_segments` does; also used to rebuild archived pages.
+        """
+        fp = page_fingerprint(html, self.lang)
+        _record_fingerprint(self.lang, fp)
+        if not fp["ok"]:
+            raise PageStructureError(
+                f"No liturgy section heading found at {url or 'the page'} "
+                f"(skeleton: {fp['signature'] or 'none'}). The page structure may have changed."
+            )
+        return self.parse_page(html, date, url=url)
+
+    def fetch_segments_range(
+        self, start: datetime.date, end: datetime.date,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[DayResult]:
+        """Fetch every day from *start* to *end* (inclusive) concurrently.
+
+        Yields a :class:`~gospel.date_range.DayResult` per day as soon as it
+        completes (not in date order); a day that fails carries its
+        ``error`` and the others continue.  Concurrency and request spacing
+        follow :func:`gospel.date_range.iter_days`.  Each day runs on its own
+        scraper, so :attr:`page_hash` of this one is left untouched.
+        """
+        lang = self.lang
+        return iter_days(lambda d: VaticanHTMLScraper(lang).fetch_segments(d),
+                         dates_between(start, end), max_workers)
 
-        url = self.day_url(date)
-        html = _fetch(url)
-        soup = BeautifulSoup(html, "html.parser")
+    def parse_page(
+        self, html: str, date: datetime.date, url: Optional[str] = None
+    ) -> tuple[str, list[Segment]]:
+        """Build ``(title, segments)`` from the HTML of the page for *date*.
 
+        *url* is only used in error messages.  Raises ``RuntimeError`` when
+        no liturgy content is recognised.
+        """
         cfg = self._cfg
         lang = self.lang
-        segments: list[str] = []
-
-        # --- Title ---
-        title = _extract_title(soup, lang, date)
+        segments: list[Segment] = []
+
+        # Build only the liturgy subtrees.  The flat layout, where a reading
+        # or the gospel sits outside them, needs the whole page; a missing
+        # pope comment is normal and does not.
+        soup = make_soup(html, parse_only=_LITURGY_SUBTREES)
+        sections = _SectionIndex(soup)
+        found = [sections.find(cfg[key]) for key in ("h2_reading", "h2_gospel", "h2_pope")]
+        if soup.parse_only is not None and (found[0] is None or found[1] is None):
+            soup = make_soup(html)
+            sections = _SectionIndex(soup)
+            found = [sections.find(cfg[key]) for key in ("h2_reading", "h2_gospel", "h2_pope")]
+        # Every section is resolved above, before extraction edits the tree.
+        read_nodes, gospel_nodes, pope_nodes = found
+
+        # --- Title --- (builds the full tree only if the subtrees hold none)
+        title = _extract_title(soup, lang, date, html)
 
         # --- Reading section ---
-        h2_read = _find_h2(soup, cfg["h2_reading"])
-        if h2_read:
-            read_plain = _section_plain(h2_read)
+        if read_nodes is not None:
+            read_plain = _section_plain(read_nodes)
             # Extract first and optional second reading, skipping the psalm.
             # Sunday/feast structure is: Prima → Psalm → Seconda
             # Weekday structure is:      Prima → Psalm
@@ -458,37 +745,35 @@ class VaticanHTMLScraper:
                     lang,
                 )
                 if first_norm.strip():
-                    segments.append(first_norm)
+                    segments.append(Segment.from_marked(first_norm, KIND_READING))
             if seconda_raw:
                 seconda_norm = _strip_section_verse_refs(
                     normalize_for_tts(seconda_raw, lang=lang, flatten_lines=False),
                     lang,
                 )
                 if seconda_norm.strip():
-                    segments.append(seconda_norm)
+                    segments.append(Segment.from_marked(seconda_norm, KIND_READING))
 
         # --- Gospel section ---
-        h2_gospel = _find_h2(soup, cfg["h2_gospel"])
-        if h2_gospel:
-            gospel_plain = _section_plain(h2_gospel)
+        if gospel_nodes is not None:
+            gospel_plain = _section_plain(gospel_nodes)
             gospel_norm = _strip_section_verse_refs(
                 normalize_for_tts(gospel_plain, lang=lang, flatten_lines=False),
                 lang,
             )
             if gospel_norm.strip():
-                segments.append(gospel_norm)
+                segments.append(Segment.from_marked(gospel_norm, KIND_GOSPEL))
 
         # --- Pope section ---
-        h2_pope = _find_h2(soup, cfg["h2_pope"])
-        if h2_pope:
-            pope_plain = _section_plain(h2_pope)
+        if pope_nodes is not None:
+            pope_plain = _section_plain(pope_nodes)
             pope_seg = _pope_segment(pope_plain, lang)
             if pope_seg:
-                segments.append(pope_seg)
+                segments.append(Segment.from_marked(pope_seg))
 
         if not segments:
             raise RuntimeError(
-                f"No liturgy content found at {url}. "
+                f"No liturgy content found at {url or 'the page'}. "
                 "The page structure may have changed."
             )
 
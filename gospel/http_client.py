@@ -0,0 +1,293 @@
+"""Shared HTTP session for the Vatican News scrapers.
+
+Every scraper request goes through one process-wide :class:`requests.Session`
+so pages fetched in the same run reuse keep-alive connections instead of
+paying a fresh TCP + TLS handshake each time.
+
+  * Pooling: one urllib3 pool per host, at most ``GOSPEL_HTTP_POOL_SIZE``
+    connections each (default 6, as browsers do).  Callers block for a free connection
+    rather than opening extra sockets.
+  * Retries: connection errors, read errors and 500/502/503/504 responses on
+    GET/HEAD are retried up to ``GOSPEL_HTTP_RETRIES`` times (default 3) with
+    exponential backoff plus random jitter.  Each attempt takes its own
+    limiter slot and token, and a ``Retry-After`` pause of the host (see
+    below) holds back the next attempt like any other request.
+  * Deadline: in a :mod:`gospel.deadline` scope, the wait for a limiter
+    slot, each attempt's timeout (set once the slot is granted) and the
+    backoff between retries all fit in the time left; once it is spent,
+    requests fail with :class:`DeadlineTimeout` without being sent, and no
+    retry starts with less than ``MIN_ATTEMPT_S`` seconds left.  A timeout
+    that was cut down by the deadline and fires also raises
+    :class:`DeadlineTimeout`, so callers can tell the caller's budget
+    running out from the host being slow.
+  * Politeness: every request to the network holds a slot of its host's
+    limiter (concurrency cap, requests per second, Retry-After pauses) —
+    see :mod:`gospel.host_limiter`.
+  * Stats: latency and body size of every request are recorded per host —
+    see :func:`http_stats`.
+  * Fixtures: with a record/replay store active (:mod:`gospel.http_fixtures`)
+    exchanges are written to it, or answered from it with no network.
+
+Usage::
+
+    from gospel import http_client
+
+    html = http_client.fetch_text(url, headers=_HTTP_HEADERS)
+    resp = http_client.head(url, headers=_HTTP_HEADERS, timeout=10)
+"""
+
+import contextlib
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from gospel import deadline, host_limiter, http_fixtures
+
+logger = logging.getLogger(__name__)
+
+POOL_SIZE = int(os.environ.get("GOSPEL_HTTP_POOL_SIZE", "6"))
+RETRIES = int(os.environ.get("GOSPEL_HTTP_RETRIES", "3"))
+BACKOFF_FACTOR = 0.5    # 0.5 s, 1 s, 2 s ... between attempts
+BACKOFF_JITTER = 0.5    # plus up to 0.5 s of random jitter
+RETRY_STATUSES = (500, 502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+# Least time left in the deadline for a retry to be worth starting.
+MIN_ATTEMPT_S = 1.0
+
+# Number of individual request records kept for inspection.
+_RECENT_MAX = 200
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_host_stats: Dict[str, Dict[str, float]] = {}
+_recent: Deque[Dict] = deque(maxlen=_RECENT_MAX)
+
+
+class DeadlineTimeout(requests.Timeout, deadline.DeadlineExceeded):
+    """A request not sent, or cut short, because the current deadline ran out."""
+
+    def __init__(self, stage: str, message: Optional[str] = None):
+        # RequestException hands *stage* on to DeadlineExceeded (next in the MRO).
+        requests.Timeout.__init__(self, stage)
+        if message:
+            self.args = (message,)
+
+
+# ---------------------------------------------------------------------------
+# Session
+# ---------------------------------------------------------------------------
+
+def _build_session() -> requests.Session:
+    # No urllib3 retries: request() retries attempt by attempt, so that each
+    # one goes through the host limiter.
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE,
+        pool_maxsize=POOL_SIZE,
+        pool_block=True,
+        max_retries=0,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close_session() -> None:
+    """Close pooled connections (the next request opens a new session)."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# ---------------------------------------------------------------------------
+# Requests
+# ---------------------------------------------------------------------------
+
+def _record(method: str, url: str, status: int, elapsed: float, nbytes: int) -> None:
+    host = urlsplit(url).netloc
+    with _stats_lock:
+        s = _host_stats.setdefault(
+            host, {"requests": 0, "errors": 0, "bytes": 0, "seconds": 0.0, "max_seconds": 0.0}
+        )
+        s["requests"] += 1
+        s["bytes"] += nbytes
+        s["seconds"] += elapsed
+        s["max_seconds"] = max(s["max_seconds"], elapsed)
+        if status == 0 or status >= 400:
+            s["errors"] += 1
+        _recent.append({
+            "method": method, "url": url, "status": status,
+            "ms": round(elapsed * 1000, 1), "bytes": nbytes,
+        })
+    logger.debug("%s %s -> %s in %.0f ms (%d bytes)", method, url, status or "error",
+                 elapsed * 1000, nbytes)
+
+
+def _backoff(attempt: int) -> float:
+    """Seconds to wait before retry number *attempt* (1-based)."""
+    return BACKOFF_FACTOR * 2 ** (attempt - 1) + random.uniform(0, BACKOFF_JITTER)
+
+
+def _capped(method: str, url: str, kwargs: Dict) -> Dict:
+    """*kwargs* with the timeout cut down to the time left in the current deadline."""
+    dl = deadline.current()
+    if dl.expires_at is None:
+        return kwargs
+    stage = f"{method} {url}"
+    timeout = kwargs.get("timeout")
+    return dict(kwargs, timeout=dl.timeout(math.inf if timeout is None else timeout, stage=stage))
+
+
+def _send(method: str, url: str, host: str, replay: Optional[http_fixtures.FixtureStore],
+          **kwargs) -> Tuple[requests.Response, float]:
+    """One attempt: hold a limiter slot, send (or replay), record the stats.
+
+    Returns the response and its latency in seconds.
+    """
+    cut = False
+    # Latency is measured once the limiter has granted a slot.
+    with contextlib.nullcontext() if replay is not None else host_limiter.slot(host):
+        if replay is None:
+            # The slot may have waited: size the timeout from what is left now.
+            capped = _capped(method, url, kwargs)
+            cut = capped.get("timeout") != kwargs.get("timeout")
+            kwargs = capped
+        start = time.perf_counter()
+        try:
+            if replay is not None:
+                resp = replay.replay(method, url)
+            else:
+                resp = get_session().request(method, url, **kwargs)
+        except requests.RequestException as e:
+            _record(method, url, 0, time.perf_counter() - start, 0)
+            if cut and (isinstance(e, requests.Timeout) or deadline.current().expired):
+                stage = f"{method} {url}"
+                raise DeadlineTimeout(stage, f"deadline exceeded during {stage}: {e}") from e
+            raise
+        elapsed = time.perf_counter() - start
+    if replay is None:
+        host_limiter.observe(host, resp.status_code, resp.headers.get("Retry-After"))
+    _record(method, url, resp.status_code, elapsed, len(resp.content))
+    return resp, elapsed
+
+
+def _attempts(method: str, url: str, host: str, replay: Optional[http_fixtures.FixtureStore],
+              **kwargs) -> Tuple[requests.Response, float]:
+    """Send until a response is final, the retries are spent or the deadline is too close."""
+    dl = deadline.current()
+    if replay is None:
+        dl.check(f"{method} {url}")
+    # Replayed exchanges are deterministic: never retried.
+    retries = RETRIES if replay is None and method.upper() in RETRY_METHODS else 0
+    attempt = 0
+    while True:
+        error: Optional[requests.RequestException] = None
+        try:
+            resp, elapsed = _send(method, url, host, replay, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+        final = attempt >= retries or (error is None and resp.status_code not in RETRY_STATUSES)
+        delay = 0.0 if final else _backoff(attempt + 1)
+        if final or not dl.has(delay + MIN_ATTEMPT_S):
+            if error is not None:
+                raise error
+            return resp, elapsed
+        attempt += 1
+        time.sleep(delay)
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """Send *method* to *url* through the shared session and record its stats.
+
+    Keyword arguments are passed to :meth:`requests.Session.request`.
+    Network errors propagate once the retries are exhausted; the last
+    retried 5xx response is returned (callers ``raise_for_status()``).
+    """
+    fixtures = http_fixtures.active()
+    if fixtures is not None and fixtures.mode == "record":
+        kwargs["headers"] = fixtures.strip_conditional(kwargs.get("headers"))
+    replay = fixtures if fixtures is not None and fixtures.mode == "replay" else None
+    host = urlsplit(url).netloc
+    try:
+        resp, elapsed = _attempts(method, url, host, replay, **kwargs)
+    except deadline.DeadlineExceeded as e:
+        if isinstance(e, DeadlineTimeout):
+            raise
+        # A request never outlives the current deadline (gospel/deadline.py).
+        raise DeadlineTimeout(e.stage) from e
+
+    if fixtures is not None and fixtures.mode == "record":
+        fixtures.record(method, url, resp, elapsed)
+    return resp
+
+
+def get(url: str, timeout: float = 15, **kwargs) -> requests.Response:
+    return request("GET", url, timeout=timeout, **kwargs)
+
+
+def head(url: str, timeout: float = 10, allow_redirects: bool = True, **kwargs) -> requests.Response:
+    return request("HEAD", url, timeout=timeout, allow_redirects=allow_redirects, **kwargs)
+
+
+def fetch_text(url: str, timeout: float = 15, **kwargs) -> str:
+    """GET *url*, raise on HTTP errors and return the body decoded as UTF-8.
+
+    Vatican News pages are always UTF-8; decoding explicitly avoids
+    requests guessing latin-1 and mis-decoding accented characters.
+    """
+    resp = get(url, timeout=timeout, **kwargs)
+    resp.raise_for_status()
+    return resp.content.decode("utf-8", errors="replace")
+
+
+# ---------------------------------------------------------------------------
+# Stats
+# ---------------------------------------------------------------------------
+
+def http_stats() -> Dict[str, Dict[str, float]]:
+    """Return per-host totals: requests, errors, bytes, seconds, max/avg latency (ms)."""
+    with _stats_lock:
+        out = {}
+        for host, s in _host_stats.items():
+            out[host] = {
+                "requests": int(s["requests"]),
+                "errors": int(s["errors"]),
+                "bytes": int(s["bytes"]),
+                "avg_ms": round(s["seconds"] / s["requests"] * 1000, 1) if s["requests"] else 0.0,
+                "max_ms": round(s["max_seconds"] * 1000, 1),
+            }
+        return out
+
+
+def recent_requests() -> List[Dict]:
+    """Return the most recent request records (method, url, status, ms, bytes)."""
+    with _stats_lock:
+        return list(_recent)
+
+
+def reset_http_stats() -> None:
+    with _stats_lock:
+        _host_stats.clear()
+        _recent.clear()
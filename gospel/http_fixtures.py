@@ -0,0 +1,177 @@
+"""Record / replay of HTTP exchanges for offline, reproducible scraping.
+
+Every request of the scrapers and RSS clients goes through
+:func:`gospel.http_client.request`, which consults the active fixture
+store, if any:
+
+  record   the request is sent as usual and the response (status, headers,
+           body, elapsed time) is written to the store.  Conditional
+           headers are dropped first so the store holds full bodies, never
+           a ``304``.
+  replay   no request is sent; the stored response for (method, URL) is
+           returned after the injected latency.  An exchange that was
+           never recorded raises ``requests.ConnectionError``, exactly like
+           an unreachable host.
+
+Each exchange is one gzip-compressed JSON file under the store directory,
+named after the SHA-1 of method + URL, so stores can be committed and
+diffed file by file.
+
+Enable for the whole process with ``GOSPEL_HTTP_FIXTURES=record|replay`` and
+``GOSPEL_HTTP_FIXTURE_DIR``; ``GOSPEL_HTTP_REPLAY_LATENCY_MS`` sets the
+injected latency (a number of milliseconds, or ``recorded`` to replay the
+recorded timings).  Or, in code::
+
+    with http_fixtures.replaying("fixtures/", latency_ms=80):
+        title, segments = VaticanHTMLScraper("it").fetch_segments(date)
+
+Keep the page cache out of the way (``GOSPEL_PAGE_CACHE=0`` or a fresh
+``GOSPEL_PAGE_CACHE_DIR``) when recording, or cached pages are never
+requested and so never recorded.
+"""
+
+import base64
+import contextlib
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Iterator, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+MODES = ("record", "replay")
+
+# Response headers worth keeping: validators, redirects and content type.
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Location", "Retry-After")
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+class FixtureStore:
+    """A directory of recorded exchanges, used in ``record`` or ``replay`` *mode*.
+
+    *latency_ms* applies to replay: a delay in milliseconds, or
+    ``"recorded"`` for the elapsed time stored with each exchange.
+    """
+
+    def __init__(self, path: str, mode: str, latency_ms: Union[float, str] = 0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown fixture mode: {mode!r} (expected one of {MODES})")
+        self.path = path
+        self.mode = mode
+        self.latency_ms = latency_ms
+
+    def _file(self, method: str, url: str) -> str:
+        key = hashlib.sha1(f"{method.upper()} {url}".encode("utf-8")).hexdigest()
+        return os.path.join(self.path, key[:2], f"{key}.json.gz")
+
+    # -- recording -----------------------------------------------------------
+
+    def add(self, method: str, url: str, status: int, body: bytes = b"",
+            headers: Optional[Dict[str, str]] = None, elapsed: float = 0.0) -> None:
+        """Store one exchange (also used to seed a store from saved pages)."""
+        path = self._file(method, url)
+        entry = {
+            "method": method.upper(),
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in (headers or {}).items() if k in _KEPT_HEADERS},
+            "body": base64.b64encode(body).decode("ascii"),
+            "elapsed_ms": round(elapsed * 1000, 1),
+        }
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(json.dumps(entry, ensure_ascii=False).encode("utf-8"), mtime=0))
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    def record(self, method: str, url: str, resp: requests.Response, elapsed: float) -> None:
+        headers = {k: resp.headers[k] for k in _KEPT_HEADERS if k in resp.headers}
+        self.add(method, url, resp.status_code, resp.content, headers, elapsed)
+
+    @staticmethod
+    def strip_conditional(headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        if not headers:
+            return headers
+        return {k: v for k, v in headers.items() if k not in _CONDITIONAL_HEADERS}
+
+    # -- replay --------------------------------------------------------------
+
+    def replay(self, method: str, url: str) -> requests.Response:
+        """Return the recorded response for (*method*, *url*) after the injected latency."""
+        try:
+            with open(self._file(method, url), "rb") as f:
+                entry = json.loads(gzip.decompress(f.read()).decode("utf-8"))
+        except (OSError, ValueError) as e:
+            raise requests.ConnectionError(f"no recorded response for {method.upper()} {url}") from e
+
+        delay_ms = entry.get("elapsed_ms", 0) if self.latency_ms == "recorded" else float(self.latency_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        resp = requests.Response()
+        resp.status_code = entry["status"]
+        resp.reason = http.client.responses.get(entry["status"], "")
+        resp.headers = CaseInsensitiveDict(entry.get("headers", {}))
+        resp._content = base64.b64decode(entry["body"])
+        resp.url = url
+        resp.request = requests.Request(method.upper(), url).prepare()
+        return resp
+
+
+def _parse_latency(value: str) -> Union[float, str]:
+    value = value.strip().lower()
+    return "recorded" if value == "recorded" else float(value or 0)
+
+
+def _from_env() -> Optional[FixtureStore]:
+    mode = os.environ.get("GOSPEL_HTTP_FIXTURES", "").strip().lower()
+    if not mode:
+        return None
+    return FixtureStore(
+        os.environ.get("GOSPEL_HTTP_FIXTURE_DIR", "http_fixtures"),
+        mode,
+        _parse_latency(os.environ.get("GOSPEL_HTTP_REPLAY_LATENCY_MS", "0")),
+    )
+
+
+# A plain module global rather than a contextvar: the scrapers fetch detail
+# pages and date ranges on worker threads, which must see the same store.
+_active: Optional[FixtureStore] = _from_env()
+
+
+def active() -> Optional[FixtureStore]:
+    """The store in effect (None: plain network)."""
+    return _active
+
+
+@contextlib.contextmanager
+def using(store: FixtureStore) -> Iterator[FixtureStore]:
+    """Route every request made inside the block, on any thread, through *store*."""
+    global _active
+    previous, _active = _active, store
+    try:
+        yield store
+    finally:
+        _active = previous
+
+
+def recording(path: str) -> "contextlib.AbstractContextManager[FixtureStore]":
+    """Record every exchange made inside the block to *path*."""
+    return using(FixtureStore(path, "record"))
+
+
+def replaying(path: str, latency_ms: Union[float, str] = 0) -> "contextlib.AbstractContextManager[FixtureStore]":
+    """Answer every request made inside the block from *path*."""
+    return using(FixtureStore(path, "replay", latency_ms))
@@ -0,0 +1,267 @@
+"""Lookahead scraping: scrape and normalise upcoming days ahead of publishing.
+
+Vatican News often publishes liturgy pages a few days in advance.  A
+lookahead run (``POST /prefetch`` or the CLI below) scrapes the liturgy and
+Saint of the Day pages for the next N days and writes the normalised
+segments to the content store (:mod:`gospel.content_store`), so the morning
+publish starts from ready content instead of scraping and normalising on its
+critical path.
+
+:func:`liturgy_segments` and :func:`saint_segments` are the read-through
+helpers every publishing entry point uses: a day already in the store is
+returned as is, anything else is scraped now and stored for the next reader.
+A page not yet published for a future day is simply skipped and retried by
+the next run.  Each run prunes entries past the store's retention.
+
+Vatican News may still correct a page after a lookahead run scraped it, so
+an entry stored before its own day is revalidated on first use that day:
+the page is fetched again (through the page cache, so an unchanged page
+costs a ``304``) and only re-parsed and re-normalised when its hash differs
+from the stored ``source_hash``; saints go through the saint index, which
+does the same with the listing page.  Should that fetch fail, the early
+entry is used.  ``fresh=True`` (``/publish?force=1``) skips the store and
+scrapes again.
+
+Scrapes for today or earlier go through the per-(kind, lang) circuit breaker
+(:mod:`gospel.circuit_breaker`): while a language's pages keep failing they
+raise :class:`~gospel.circuit_breaker.CircuitOpen` at once, so callers go
+straight to their RSS fallback.  Future days, which may simply not be
+published yet, neither consult nor trip it.
+
+Usage::
+
+    python -m gospel.lookahead                        # next 3 days, all languages
+    python -m gospel.lookahead --days 5 --langs it,en --kinds liturgy
+"""
+
+import argparse
+import datetime
+import logging
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from gospel import circuit_breaker, content_store, saint_index
+from gospel.html_scraper import VaticanHTMLScraper
+from gospel.saint_scraper import fetch_saints
+from gospel.segments import Segment
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAYS = int(os.environ.get("GOSPEL_LOOKAHEAD_DAYS", "3"))
+
+KIND_LITURGY = "liturgy"
+KIND_SAINTS = "saints"
+KINDS = (KIND_LITURGY, KIND_SAINTS)
+SUPPORTED_LANGS = ["de", "en", "es", "fr", "it", "pt"]
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+def store(kind: str, lang: str, date: datetime.date, title: str,
+          segments: List[Segment], source_hash: str = "") -> None:
+    """Write the scraped *title* and *segments* for (*kind*, *lang*, *date*)."""
+    content_store.put(kind, lang, date, title, segments, content_store.SOURCE_HTML, source_hash)
+
+
+def _stored(kind: str, lang: str, date: datetime.date) -> Optional[content_store.Stored]:
+    stored = content_store.get(kind, lang, date)
+    if stored is None or stored.source != content_store.SOURCE_HTML:
+        return None
+    return stored
+
+
+def _early(stored: content_store.Stored, date: datetime.date) -> bool:
+    """True when *stored* was scraped before *date*, so the page may have changed since."""
+    return datetime.date.fromtimestamp(stored.fetched_at) < date
+
+
+def _use(kind: str, lang: str, date: datetime.date, stored: content_store.Stored
+         ) -> Tuple[str, List[Segment]]:
+    logger.info("content store: using %s/%s/%s scraped %.1f h ago", kind, lang, date,
+                (time.time() - stored.fetched_at) / 3600)
+    return stored.title, stored.segments
+
+
+def load(kind: str, lang: str, date: Optional[datetime.date] = None
+         ) -> Optional[Tuple[str, List[Segment]]]:
+    """Return the stored ``(title, segments)`` for *date* (default today), or None.
+
+    No revalidation: an entry scraped ahead of its day is returned as is.
+    """
+    date = date or datetime.date.today()
+    stored = _stored(kind, lang, date)
+    return None if stored is None else _use(kind, lang, date, stored)
+
+
+def prune(before: Optional[datetime.date] = None) -> int:
+    """Delete entries dated before *before* (default: the store's retention); return how many."""
+    return content_store.prune(before, list(KINDS))
+
+
+# ---------------------------------------------------------------------------
+# Publish-side helpers
+# ---------------------------------------------------------------------------
+
+def _guarded(kind: str, lang: str, date: datetime.date, fn, *args):
+    """Run the scrape ``fn(*args)`` through the breaker of (*kind*, *lang*) unless *date* is ahead."""
+    if date > datetime.date.today():
+        return fn(*args)
+    return circuit_breaker.call(kind, lang, fn, *args)
+
+
+def scrape_liturgy(lang: str, date: Optional[datetime.date] = None,
+                   known: Optional[content_store.Stored] = None) -> Tuple[str, List[Segment]]:
+    """Scrape the liturgy for *date* now and store it.
+
+    When the page still hashes to ``known.source_hash``, the *known*
+    segments are stored again instead of parsing and normalising the page.
+    """
+    date = date or datetime.date.today()
+    scraper = VaticanHTMLScraper(lang)
+
+    def scrape() -> Tuple[str, List[Segment]]:
+        html = scraper.fetch_page(date)
+        if known is not None and known.source_hash and known.source_hash == scraper.page_hash:
+            logger.info("content store: %s/%s/%s unchanged since %s", KIND_LITURGY, lang, date,
+                        datetime.date.fromtimestamp(known.fetched_at))
+            return known.title, known.segments
+        return scraper.page_segments(html, date, url=scraper.day_url(date))
+
+    title, segments = _guarded(KIND_LITURGY, lang, date, scrape)
+    store(KIND_LITURGY, lang, date, title, segments, scraper.page_hash or "")
+    return title, segments
+
+
+def scrape_saints(lang: str, date: Optional[datetime.date] = None) -> Tuple[str, List[Segment]]:
+    """Scrape the saints of *date* now and store them."""
+    date = date or datetime.date.today()
+    title, segments = _guarded(KIND_SAINTS, lang, date, fetch_saints, lang, date)
+    store(KIND_SAINTS, lang, date, title, segments, saint_index.listing_hash(lang, date) or "")
+    return title, segments
+
+
+_Scrape = Callable[[datetime.date, Optional[content_store.Stored]], Tuple[str, List[Segment]]]
+
+
+def _read_through(kind: str, lang: str, date: Optional[datetime.date], fresh: bool,
+                  scrape: _Scrape) -> Tuple[str, List[Segment]]:
+    """Stored entry unless *fresh* or scraped ahead of *date*; else ``scrape(date, stored)``."""
+    date = date or datetime.date.today()
+    stored = None if fresh else _stored(kind, lang, date)
+    if stored is not None and not _early(stored, date):
+        return _use(kind, lang, date, stored)
+    try:
+        return scrape(date, stored)
+    except Exception as e:
+        if stored is None:
+            raise
+        logger.warning("content store: cannot revalidate %s/%s/%s (%s); using the copy scraped ahead",
+                       kind, lang, date, e)
+        return _use(kind, lang, date, stored)
+
+
+def liturgy_segments(lang: str, date: Optional[datetime.date] = None,
+                     fresh: bool = False) -> Tuple[str, List[Segment]]:
+    """Stored liturgy for *date* when already scraped, else scrape (and store) it now.
+
+    An entry scraped before *date* is revalidated first; *fresh* ignores the store.
+    """
+    return _read_through(KIND_LITURGY, lang, date, fresh,
+                         lambda day, stored: scrape_liturgy(lang, day, stored))
+
+
+def saint_segments(lang: str, date: Optional[datetime.date] = None,
+                   fresh: bool = False) -> Tuple[str, List[Segment]]:
+    """Stored saints for *date* when already scraped, else scrape (and store) them now.
+
+    An entry scraped before *date* is revalidated first; *fresh* ignores the store.
+    """
+    return _read_through(KIND_SAINTS, lang, date, fresh,
+                         lambda day, stored: scrape_saints(lang, day))
+
+
+# ---------------------------------------------------------------------------
+# Lookahead run
+# ---------------------------------------------------------------------------
+
+def run(langs: Iterable[str], days: int = DEFAULT_DAYS,
+        kinds: Iterable[str] = KINDS, start: Optional[datetime.date] = None) -> Dict:
+    """Scrape *kinds* for *langs* on each of the *days* days from *start* (default today).
+
+    Returns ``{kind: {date: {"stored": [...], "missing": {lang: error}}}}``
+    plus ``pruned``, the number of expired entries deleted.
+    """
+    from gospel.prefetch import prefetch_liturgy, prefetch_saints   # imports this module
+
+    langs = list(langs)
+    start = start or datetime.date.today()
+    scrape = {KIND_LITURGY: prefetch_liturgy, KIND_SAINTS: prefetch_saints}
+    report: Dict = {}
+    for kind in kinds:
+        report[kind] = {}
+        for offset in range(max(1, days)):
+            date = start + datetime.timedelta(days=offset)
+            # Scrape every day afresh; the scrape itself writes the store.
+            results = scrape[kind](langs, date, use_lookahead=False)
+            day = {"stored": [], "missing": {}}
+            for lang, result in results.items():
+                if result.ok:
+                    day["stored"].append(lang)
+                else:
+                    day["missing"][lang] = str(result.error)
+            report[kind][date.isoformat()] = day
+    report["pruned"] = prune()
+    return report
+
+
+def parse_langs(value: str) -> List[str]:
+    if value.lower() == "all":
+        return SUPPORTED_LANGS
+    langs = [x.strip().lower() for x in value.split(",") if x.strip()]
+    invalid = [x for x in langs if x not in SUPPORTED_LANGS]
+    if invalid:
+        raise ValueError(f"Unsupported languages: {', '.join(invalid)}")
+    return langs
+
+
+def parse_kinds(value: str) -> List[str]:
+    if value.lower() == "all":
+        return list(KINDS)
+    kinds = [x.strip().lower() for x in value.split(",") if x.strip()]
+    invalid = [x for x in kinds if x not in KINDS]
+    if invalid:
+        raise ValueError(f"Unsupported kinds: {', '.join(invalid)} (expected {', '.join(KINDS)})")
+    return kinds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Scrape and normalise upcoming days ahead of publishing."
+    )
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Days to look ahead, today included")
+    parser.add_argument("--langs", default="all", help="Comma-separated language codes or 'all'")
+    parser.add_argument("--kinds", default="all", help="liturgy, saints or 'all'")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    try:
+        langs = parse_langs(args.langs)
+        kinds = parse_kinds(args.kinds)
+    except ValueError as e:
+        parser.error(str(e))
+        return
+
+    report = run(langs, args.days, kinds)
+    for kind in kinds:
+        for date, day in report[kind].items():
+            missing = ", ".join(sorted(day["missing"]))
+            print(f"  [{kind} {date}] stored: {', '.join(sorted(day['stored'])) or '-'}"
+                  + (f"; not available: {missing}" if missing else ""))
+    print(f"Store: {content_store.DB_PATH} ({report['pruned']} expired entr{'y' if report['pruned'] == 1 else 'ies'} pruned)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""On-disk HTTP cache for Vatican News pages.
+
+Sits between the scrapers' ``_fetch`` and :mod:`gospel.http_client`.  Each
+cached page stores its body together with the ``ETag`` and
+``Last-Modified`` validators.
+
+Policy
+------
+  immutable   A page for a date stops changing ``GOSPEL_PAGE_CACHE_IMMUTABLE_DAYS``
+              days after it (default 1).  A cached copy fetched (or last
+              revalidated) on or after that day is served with no request; a
+              copy taken earlier, e.g. by a lookahead run while the page was
+              still being filled in, is revalidated once more first.
+  revalidate  Any other cached page is re-requested with ``If-None-Match`` /
+              ``If-Modified-Since``; a ``304 Not Modified`` serves the cached
+              body.
+  miss        Nothing cached: plain GET, then store.
+
+The cache is capped at ``GOSPEL_PAGE_CACHE_MB`` (default 64 MB); the least
+recently used entries are evicted first.  The cache size is counted once
+and then kept as a running total, so the directory is only walked again
+when the total goes over the cap.  ``GOSPEL_PAGE_CACHE=0`` disables
+it, ``GOSPEL_PAGE_CACHE_DIR`` moves it (default: ``<tmp>/gospel_page_cache``).
+"""
+
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from gospel import http_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENABLED = os.environ.get("GOSPEL_PAGE_CACHE", "1").strip().lower() not in ("0", "false", "no")
+CACHE_DIR = os.environ.get(
+    "GOSPEL_PAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "gospel_page_cache")
+)
+MAX_BYTES = int(float(os.environ.get("GOSPEL_PAGE_CACHE_MB", "64")) * 1024 * 1024)
+IMMUTABLE_DAYS = int(os.environ.get("GOSPEL_PAGE_CACHE_IMMUTABLE_DAYS", "1"))
+
+_lock = threading.Lock()
+_stats: Dict[str, int] = {"hit": 0, "revalidated": 0, "miss": 0, "stored": 0, "evicted": 0}
+# Bytes in CACHE_DIR as counted by this process (None: not counted yet).
+_size_total: Optional[int] = None
+
+
+def is_immutable(date: Optional[datetime.date], fetched_at: Optional[float] = None) -> bool:
+    """True when the page for *date*, as fetched at *fetched_at* (default now), can no longer change."""
+    if date is None:
+        return False
+    fetched = datetime.date.today() if fetched_at is None else datetime.date.fromtimestamp(fetched_at)
+    return fetched >= date + datetime.timedelta(days=IMMUTABLE_DAYS)
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _paths(url: str) -> Tuple[str, str]:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    base = os.path.join(CACHE_DIR, key[:2], key)
+    return base + ".html", base + ".json"
+
+
+def _load(url: str) -> Optional[Tuple[Dict, bytes]]:
+    body_path, meta_path = _paths(url)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None
+    if meta.get("url") != url:
+        return None
+    return meta, body
+
+
+def _touch(url: str) -> None:
+    # Access time drives LRU eviction; atime is often disabled, so use mtime.
+    try:
+        os.utime(_paths(url)[1], None)
+    except OSError:
+        pass
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _entry_size(body_path: str, meta_path: str) -> int:
+    size = 0
+    for path in (body_path, meta_path):
+        try:
+            size += os.path.getsize(path)
+        except OSError:
+            pass
+    return size
+
+
+def _store(url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+    body_path, meta_path = _paths(url)
+    meta = {
+        "url": url,
+        "etag": etag,
+        "last_modified": last_modified,
+        "fetched_at": time.time(),
+        "size": len(body),
+    }
+    meta_bytes = json.dumps(meta).encode("utf-8")
+    replaced = _entry_size(body_path, meta_path)
+    try:
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        _write_atomic(body_path, body)
+        _write_atomic(meta_path, meta_bytes)
+    except OSError as e:
+        logger.warning("page cache: cannot store %s (%s)", url, e)
+        return
+    _count("stored")
+    _grow(len(body) + len(meta_bytes) - replaced)
+
+
+def _mark_validated(url: str, meta: Dict) -> None:
+    """Record that the cached copy of *url* was confirmed current just now (also touches it)."""
+    meta = dict(meta, fetched_at=time.time())
+    try:
+        _write_atomic(_paths(url)[1], json.dumps(meta).encode("utf-8"))
+    except OSError:
+        _touch(url)
+
+
+def _grow(delta: int) -> None:
+    """Add *delta* bytes to the running total; evict when it goes over MAX_BYTES."""
+    global _size_total
+    with _lock:
+        if _size_total is not None:
+            _size_total += delta
+        over = _size_total is None or _size_total > MAX_BYTES
+    if over:
+        _evict()
+
+
+def _evict() -> None:
+    """Delete least recently used entries until the cache fits MAX_BYTES; recount the total."""
+    global _size_total
+    entries = []
+    total = 0
+    for root, _, files in os.walk(CACHE_DIR):
+        for name in files:
+            if not name.endswith(".json"):
+                continue
+            meta_path = os.path.join(root, name)
+            body_path = meta_path[:-5] + ".html"
+            try:
+                mtime = os.path.getmtime(meta_path)
+                size = os.path.getsize(body_path) + os.path.getsize(meta_path)
+            except OSError:
+                continue
+            entries.append((mtime, size, meta_path, body_path))
+            total += size
+    if total > MAX_BYTES:
+        total = _drop_oldest(entries, total)
+    with _lock:
+        _size_total = total
+
+
+def _drop_oldest(entries: list, total: int) -> int:
+    """Delete the least recently used *entries* until *total* fits MAX_BYTES; return the new total."""
+    entries.sort()
+    for _, size, meta_path, body_path in entries:
+        if total <= MAX_BYTES:
+            break
+        for path in (meta_path, body_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+        _count("evicted")
+    return total
+
+
+def _count(name: str) -> None:
+    with _lock:
+        _stats[name] += 1
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def fetch_text(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 15,
+    date: Optional[datetime.date] = None,
+) -> str:
+    """Return the UTF-8 body of *url*, from the cache when allowed.
+
+    *date* is the day the page is about: a cached copy that can no longer
+    change (see :func:`is_immutable`) is returned without any request.
+    Otherwise a cached copy is revalidated with a conditional GET.  HTTP
+    errors raise ``requests.HTTPError`` exactly as an uncached fetch would.
+    """
+    if not CACHE_ENABLED:
+        return http_client.fetch_text(url, headers=headers, timeout=timeout)
+
+    cached = _load(url)
+    if cached is not None and is_immutable(date, cached[0].get("fetched_at", 0.0)):
+        _count("hit")
+        _touch(url)
+        return cached[1].decode("utf-8", errors="replace")
+
+    req_headers = dict(headers or {})
+    if cached is not None:
+        meta = cached[0]
+        if meta.get("etag"):
+            req_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            req_headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = http_client.get(url, headers=req_headers, timeout=timeout)
+    if cached is not None and resp.status_code == 304:
+        _count("revalidated")
+        _mark_validated(url, cached[0])
+        return cached[1].decode("utf-8", errors="replace")
+
+    resp.raise_for_status()
+    _count("miss")
+    body = resp.content
+    _store(url, body, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+    return body.decode("utf-8", errors="replace")
+
+
+def cache_stats() -> Dict[str, int]:
+    """Return counters: hit, revalidated, miss, stored, evicted."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_cache_stats() -> None:
+    with _lock:
+        for k in _stats:
+            _stats[k] = 0
@@ -0,0 +1,109 @@
+"""Concurrent multi-language scraping ahead of synthesis.
+
+``/publish-all`` and ``/publish-saint-all`` used to scrape each language just
+before synthesising it, so the network time of the whole run was the sum of
+six page fetches.  The helpers here scrape every language up front on a small
+thread pool; the publish step then receives the parsed result and goes
+straight to synthesis.
+
+Concurrency towards www.vaticannews.va is bounded twice: by ``max_workers``
+(default ``http_client.POOL_SIZE``) and by the shared session's per-host
+connection pool, which blocks instead of opening extra sockets.
+
+Usage::
+
+    scraped = prefetch_liturgy(["it", "en", "fr"])
+    result = scraped["it"]
+    if result.ok:
+        title, segments = result.value
+"""
+
+import datetime
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from gospel import deadline, http_client, lookahead
+
+logger = logging.getLogger(__name__)
+
+
+class Prefetched:
+    """Outcome of one language's scrape: ``value`` on success, else ``error``."""
+
+    __slots__ = ("lang", "value", "error", "seconds")
+
+    def __init__(self, lang: str, value: Any = None, error: Optional[BaseException] = None,
+                 seconds: float = 0.0):
+        self.lang = lang
+        self.value = value
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run(label: str, fn: Callable[[str], Any], langs: Iterable[str],
+         max_workers: Optional[int]) -> Dict[str, Prefetched]:
+    langs = list(langs)
+    if not langs:
+        return {}
+    workers = max(1, min(len(langs), max_workers or http_client.POOL_SIZE))
+
+    def task(lang: str) -> Prefetched:
+        start = time.perf_counter()
+        try:
+            value = fn(lang)
+        except Exception as e:
+            return Prefetched(lang, error=e, seconds=time.perf_counter() - start)
+        return Prefetched(lang, value=value, seconds=time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"prefetch-{label}") as pool:
+        results = {r.lang: r for r in pool.map(deadline.propagate(task), langs)}
+    wall = time.perf_counter() - start
+
+    serial = sum(r.seconds for r in results.values())
+    failed = sorted(lang for lang, r in results.items() if not r.ok)
+    logger.info(
+        "prefetch %s: %d language(s) in %.1fs (%.1fs if sequential, %d workers)%s",
+        label, len(langs), wall, serial, workers,
+        f"; failed: {', '.join(failed)}" if failed else "",
+    )
+    return results
+
+
+def prefetch_liturgy(langs: Iterable[str], date: Optional[datetime.date] = None,
+                     max_workers: Optional[int] = None,
+                     use_lookahead: bool = True) -> Dict[str, Prefetched]:
+    """Scrape the daily liturgy page of every language concurrently.
+
+    Each successful value is the ``(title, segments)`` pair returned by
+    :meth:`VaticanHTMLScraper.fetch_segments`.  With *use_lookahead*, a
+    language already in the content store is read from it; either way a
+    fresh scrape is stored.
+    """
+    if use_lookahead:
+        fn = lambda lang: lookahead.liturgy_segments(lang, date)
+    else:
+        fn = lambda lang: lookahead.scrape_liturgy(lang, date)
+    return _run("liturgy", fn, langs, max_workers)
+
+
+def prefetch_saints(langs: Iterable[str], date: Optional[datetime.date] = None,
+                    max_workers: Optional[int] = None,
+                    use_lookahead: bool = True) -> Dict[str, Prefetched]:
+    """Scrape the Saint of the Day listing (and detail pages) for every language.
+
+    Each successful value is the ``(title, segments)`` pair returned by
+    :func:`~gospel.saint_scraper.fetch_saints`; *use_lookahead* as for
+    :func:`prefetch_liturgy`.
+    """
+    if use_lookahead:
+        fn = lambda lang: lookahead.saint_segments(lang, date)
+    else:
+        fn = lambda lang: lookahead.scrape_saints(lang, date)
+    return _run("saints", fn, langs, max_workers)
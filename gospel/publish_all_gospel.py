@@ -7,7 +7,7 @@ Usage:
 For each language the script:
   1. Loads the existing published RSS from Firebase (episode history).
   2. Fetches every entry currently available in the Vatican News feed.
-  3. Skips entries whose title is already in the published history.
+  3. Skips entries whose link or title is already in the published history.
   4. Generates audio and uploads to Firebase for each new entry (oldest first).
   5. Prunes to the 6-month cap (180 episodes) and re-uploads the RSS.
 
@@ -20,6 +20,7 @@ import os
 from typing import Dict, List
 
 from gospel.audio_generator import AudioGenerator
+from gospel.feed_cache import FeedEntry
 from gospel.gospel_podcast_publisher import GospelPodcastPublisher
 from gospel.gospel_rss_parser import GospelRSSClient
 
@@ -67,12 +68,13 @@ def publish_all_for_lang(lang: str) -> None:
     print(f"  Vatican News RSS entries available: {len(all_entries)}")
 
     # --- Filter out already-published entries ---
-    new_entries: List[Dict] = []
+    new_entries: List[FeedEntry] = []
+    # Check the link first: entries are lazy views, so one already published
+    # under its link never has its title normalised.
     for entry in all_entries:
-        title_norm = _normalise_title(entry.get('title', ''))
-        link = entry.get('link', '')
-        if title_norm in existing_titles or (link and link in existing_guids):
-            print(f"  SKIP (already published): {entry.get('title', '')[:70]}")
+        link = entry.link
+        if (link and link in existing_guids) or _normalise_title(entry.title) in existing_titles:
+            print(f"  SKIP (already published): {entry.raw_title[:70]}")
         else:
             new_entries.append(entry)
 
@@ -30,8 +30,9 @@ def main():
     episode = None
     try:
         from gospel.html_scraper import VaticanHTMLScraper
+        from gospel.lookahead import liturgy_segments
         scraper = VaticanHTMLScraper(args.lang)
-        title, segments = scraper.fetch_segments()
+        title, segments = liturgy_segments(args.lang)
         episode = audio_gen.create_episode_from_segments(title, segments)
         description = title
         guid = scraper.day_url()
@@ -7,9 +7,12 @@ Usage:
     python -m gospel.publish_daily_saint --lang it,fr,es
 
 The script:
-1. Scrapes Vatican News saint-of-the-day HTML page for *lang*.
+1. Scrapes Vatican News saint-of-the-day HTML page for *lang* (or reads it
+   from the content store when already scraped).
 2. Builds one podcast segment per saint (with full hagiography if available).
-3. Synthesises TTS audio via Google Cloud TTS (Neural2 voices).
+3. Synthesises TTS audio via Google Cloud TTS (Neural2 voices); when the
+   saints' text is unchanged since an earlier year, the stored audio is
+   reused and only the dated title is synthesised (gospel/audio_reuse.py).
 4. Uploads the MP3 to Firebase Storage and regenerates the RSS feed.
 """
 
@@ -19,9 +22,10 @@ import json
 import os
 from typing import Dict, List
 
-from gospel.saint_scraper import fetch_saints
+from gospel.lookahead import saint_segments
 from gospel.gospel_podcast_publisher import GospelPodcastPublisher
 from gospel.audio_generator import AudioGenerator
+from gospel.audio_reuse import create_saint_episode
 
 LANG_CONFIG_DIR = os.path.join(os.path.dirname(__file__), "configs", "saint")
 SUPPORTED_LANGS = ["de", "en", "es", "fr", "it", "pt"]
@@ -55,7 +59,7 @@ def publish_for_language(lang: str) -> bool:
 
     # --- Scrape Vatican News saint-of-the-day page ---
     try:
-        title, segments = fetch_saints(lang)
+        title, segments = saint_segments(lang)
         print(f"  [{lang}] Scraped {len(segments)} saint(s): {title}")
     except Exception as e:
         print(f"  [{lang}] ERROR scraping saints: {e}")
@@ -65,19 +69,23 @@ def publish_for_language(lang: str) -> bool:
         print(f"  [{lang}] No segments produced — skipping.")
         return False
 
-    # --- Synthesise audio ---
+    publisher = GospelPodcastPublisher(
+        os.path.join(LANG_CONFIG_DIR, f"{lang}.json")
+    )
+    today = datetime.date.today()
+
+    # --- Synthesise audio (reusing a stored body when the text is unchanged) ---
     try:
-        episode = audio_gen.create_episode_from_segments(title, segments)
+        episode = create_saint_episode(audio_gen, title, segments, lang, today, publisher)
     except Exception as e:
         print(f"  [{lang}] ERROR generating audio: {e}")
         return False
+    if episode.get("reused"):
+        print(f"  [{lang}] Reused stored saint audio; synthesised the title only")
 
     audio_path = episode["audio_path"]
 
     # --- Publish to Firebase ---
-    publisher = GospelPodcastPublisher(
-        os.path.join(LANG_CONFIG_DIR, f"{lang}.json")
-    )
     publisher.load_existing_feed()
 
     audio_url = publisher.upload_audio(audio_path)
@@ -95,7 +103,6 @@ def publish_for_language(lang: str) -> bool:
     except OSError:
         pass
 
-    today = datetime.date.today()
     pub_date = today.strftime("%a, %d %b %Y 00:00:00 +0000")
     guid = f"saint-{lang}-{today.isoformat()}"
 
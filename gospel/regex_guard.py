@@ -0,0 +1,115 @@
+"""Worst-case latency guard for regexes that run over untrusted page text.
+
+Python's ``re`` engine cannot be interrupted: a pattern that backtracks
+super-linearly on a malformed page keeps the publish worker busy for as long
+as it runs.  Every risky call site is registered here as a
+:class:`GuardedRegex` with two implementations that return identical results:
+
+  fast    the original regex — quickest on the short, well-formed text that
+          Vatican News normally serves.
+  linear  a rewrite whose running time is linear in the input length.
+
+In guarded mode (the default) a call goes to ``linear`` when the input is
+larger than the site's ``max_input`` — the size at which ``fast`` can exceed
+the per-call budget on adversarial text.  That size cap is what bounds the
+worst case.  The per-call budget is only a tripwire: a ``fast`` call cannot
+be stopped, so it is measured once it has finished, and one that overran
+the budget switches the site to ``linear`` for the rest of the process.
+Later calls are protected; the slow call itself has already run.
+
+Sites are called from worker threads (saint, prefetch and date-range
+pools); the counters and the tripped flag are updated under a lock.
+
+Environment variables:
+  GOSPEL_REGEX_GUARD      "0" disables the guard (always run ``fast``)
+  GOSPEL_REGEX_BUDGET_MS  per-call budget for the fast path (default 50 ms)
+
+Worst cases are measured by ``python -m gospel.benchmarks.regex_worst_case``.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+GUARD_ENABLED = os.environ.get("GOSPEL_REGEX_GUARD", "1").strip().lower() not in ("0", "false", "no")
+BUDGET_S = float(os.environ.get("GOSPEL_REGEX_BUDGET_MS", "50")) / 1000.0
+
+# Registry of all guarded call sites, by name.
+SITES: Dict[str, "GuardedRegex"] = {}
+
+_lock = threading.Lock()
+
+
+class GuardedRegex:
+    """A regex call site with a linear-time fallback.
+
+    The first positional argument of every call is the untrusted text; any
+    further arguments are passed through unchanged to both implementations.
+    """
+
+    def __init__(self, name: str, fast: Callable, linear: Callable, max_input: int):
+        self.name = name
+        self.fast = fast
+        self.linear = linear
+        self.max_input = max_input
+        self.tripped = False
+        self.calls = 0
+        self.fallbacks = 0
+        self.worst_s = 0.0
+        SITES[name] = self
+
+    def __call__(self, text: str, *args):
+        if not GUARD_ENABLED:
+            return self.fast(text, *args)
+        with _lock:
+            self.calls += 1
+            fallback = self.tripped or len(text) > self.max_input
+            if fallback:
+                self.fallbacks += 1
+        if fallback:
+            return self.linear(text, *args)
+        start = time.perf_counter()
+        result = self.fast(text, *args)
+        elapsed = time.perf_counter() - start
+        with _lock:
+            if elapsed > self.worst_s:
+                self.worst_s = elapsed
+            trips = elapsed > BUDGET_S and not self.tripped
+            if trips:
+                self.tripped = True
+        if trips:
+            logger.warning(
+                "regex site %s took %.0f ms on %d chars (budget %.0f ms); "
+                "switching to the linear-time implementation",
+                self.name, elapsed * 1000, len(text), BUDGET_S * 1000,
+            )
+        return result
+
+
+def guard_stats() -> Dict[str, Dict]:
+    """Return per-site counters: calls, fallbacks, worst fast-path time, tripped."""
+    with _lock:
+        return {
+            name: {
+                "calls": site.calls,
+                "fallbacks": site.fallbacks,
+                "worst_ms": round(site.worst_s * 1000, 3),
+                "tripped": site.tripped,
+                "max_input": site.max_input,
+            }
+            for name, site in SITES.items()
+        }
+
+
+def reset_guard() -> None:
+    """Clear counters and re-arm every tripped site."""
+    with _lock:
+        for site in SITES.values():
+            site.tripped = False
+            site.calls = 0
+            site.fallbacks = 0
+            site.worst_s = 0.0
@@ -4,9 +4,14 @@ Usage:
     python -m gospel.republish_month                     # current month, all langs
     python -m gospel.republish_month --year 2026 --month 3
     python -m gospel.republish_month --langs it,en       # subset of languages
+    python -m gospel.republish_month --archive DIR       # segments from a crawled archive
 
 For each (date, language) pair the script:
-  1. Fetches liturgy segments from the Vatican News HTML page (html_scraper).
+  1. Reads liturgy segments from the archive (with --archive, see
+     gospel/archive.py) or the content store, or fetches them from the
+     Vatican News HTML page (html_scraper); the missing days of a language
+     are fetched concurrently and published as each page arrives
+     (gospel.date_range.iter_days).
   2. Generates audio via AudioGenerator.
   3. Uploads audio + updates the RSS feed on Firebase.
      If Firebase upload fails (e.g. permission error) the MP3 stays in gospel/out/
@@ -15,11 +20,15 @@ For each (date, language) pair the script:
 
 import argparse
 import datetime
+import itertools
 import json
 import os
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from gospel.audio_generator import AudioGenerator
+from gospel import lookahead
+from gospel.archive import Archive
+from gospel.date_range import DayResult, iter_days
 from gospel.gospel_podcast_publisher import GospelPodcastPublisher
 from gospel.html_scraper import VaticanHTMLScraper
 
@@ -54,19 +63,39 @@ def days_in_month(year: int, month: int) -> List[datetime.date]:
     return dates
 
 
-def publish_day(lang: str, date: datetime.date) -> str:
+def stored_day(lang: str, date: datetime.date, archive: Optional[Archive] = None) -> Optional[tuple]:
+    """``(title, segments)`` of *date* from *archive* (when given) or the content store, else None."""
+    if archive is not None:
+        try:
+            found = archive.segments(lookahead.KIND_LITURGY, lang, date)
+        except Exception as e:
+            print(f"[{date}][{lang}] archived page unusable: {e}")
+            found = None
+        if found is not None:
+            return found
+    return lookahead.load(lookahead.KIND_LITURGY, lang, date)
+
+
+def publish_day(lang: str, date: datetime.date, scraped: Optional[DayResult] = None) -> str:
     """
     Fetch, generate, and publish a single (lang, date) episode.
+    *scraped* is the day's result from the month fetch; when given, the page
+    is not fetched again.
     Returns a short status string: "OK", "SKIP:reason", or "FAIL:reason".
     """
     config = load_config(lang)
     voice_key = config.get("voice_key", f"{lang}-female")
     audio_gen = AudioGenerator(voice=voice_key, speed="normal")
 
-    # --- Fetch segments from Vatican News HTML ---
+    # --- Fetch segments from Vatican News HTML (or the content store) ---
     try:
         scraper = VaticanHTMLScraper(lang)
-        title, segments = scraper.fetch_segments(date)
+        if scraped is None:
+            title, segments = lookahead.liturgy_segments(lang, date)
+        elif scraped.ok:
+            title, segments = scraped.title, scraped.segments
+        else:
+            raise scraped.error
         guid = scraper.day_url(date)
         pub_date = date.strftime("%a, %d %b %Y 00:00:00 +0000")
     except Exception as e:
@@ -121,9 +150,12 @@ def main() -> None:
     parser.add_argument("--year",  type=int, default=datetime.date.today().year)
     parser.add_argument("--month", type=int, default=datetime.date.today().month)
     parser.add_argument("--langs", default="all", help="Comma-separated or 'all'")
+    parser.add_argument("--archive", default=None,
+                        help="Read archived days from this directory first (gospel/archive.py)")
     args = parser.parse_args()
 
     langs = parse_langs(args.langs)
+    archive = Archive(args.archive) if args.archive else None
     dates = days_in_month(args.year, args.month)
 
     if not dates:
@@ -133,14 +165,21 @@ def main() -> None:
     print(f"Republishing {args.year}-{args.month:02d}  "
           f"({len(dates)} days × {len(langs)} languages = {len(dates)*len(langs)} episodes)")
 
+    # Days already archived or in the content store are published first; the other pages
+    # of each language are fetched concurrently and published as they arrive.
     results: List[tuple] = []
-    for date in dates:
-        for lang in langs:
-            label = f"[{date}][{lang}]"
+    for lang in langs:
+        stored = {d: stored_day(lang, d, archive) for d in dates}
+        missing = [d for d, found in stored.items() if found is None]
+        ready = [DayResult(d, *found) for d, found in stored.items() if found is not None]
+        fetched = iter_days(lambda d, lang=lang: lookahead.scrape_liturgy(lang, d), missing)
+        for day in itertools.chain(ready, fetched):
+            label = f"[{day.date}][{lang}]"
             print(f"\n{label} Processing...", flush=True)
-            status = publish_day(lang, date)
-            results.append((date, lang, status))
+            status = publish_day(lang, day.date, day)
+            results.append((day.date, lang, status))
             print(f"{label} {status}", flush=True)
+    results.sort(key=lambda r: (r[0], langs.index(r[1])))
 
     # --- Summary ---
     print("\n" + "=" * 70)
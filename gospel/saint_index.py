@@ -0,0 +1,349 @@
+"""Persistent annual Saint of the Day index, keyed by MM/DD.
+
+Saint listing URLs carry no year (``/{slug}/MM/DD.html``): the calendar is
+the same every year.  Instead of re-parsing the listing, re-probing slugs
+and re-normalising every biography each day, :func:`saint_scraper.fetch_saints`
+keeps one entry per calendar day and language:
+
+  listing_hash   SHA-1 of the listing page HTML the entry was built from
+  saints         name, detail URL and SHA-1 of the raw biography text,
+                 with the normalised segment built from it
+  normalizer     :func:`~gospel.text_normalizer.normalizer_version` of the segments
+  built_at       when the entry was (re)built
+
+Freshness: the listing page is still fetched each time, through the page
+cache, so an unchanged page costs a ``304 Not Modified``.  When its hash,
+the normaliser version and the entry age (``GOSPEL_SAINT_INDEX_MAX_AGE_DAYS``,
+default 30) all match, the stored segments are returned with no parsing,
+probing or detail fetches.  Otherwise the day is rebuilt, and a biography
+whose raw text hash is unchanged reuses its stored segment instead of being
+normalised again.
+
+Files: ``{GOSPEL_SAINT_INDEX_DIR}/{lang}.json`` (default
+``<tmp>/gospel_saint_index``).  ``GOSPEL_SAINT_INDEX=0`` disables the index.
+
+Usage (bulk build / incremental refresh of all 366 days)::
+
+    python -m gospel.saint_index --langs it,en
+    python -m gospel.saint_index --langs all --days 03-17,03-19
+    python -m gospel.saint_index --langs it --stats
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from gospel.date_range import iter_days
+from gospel.segments import Segment
+from gospel.text_normalizer import normalizer_version
+
+logger = logging.getLogger(__name__)
+
+INDEX_ENABLED = os.environ.get("GOSPEL_SAINT_INDEX", "1").strip().lower() not in ("0", "false", "no")
+INDEX_DIR = os.environ.get(
+    "GOSPEL_SAINT_INDEX_DIR", os.path.join(tempfile.gettempdir(), "gospel_saint_index")
+)
+MAX_AGE_S = float(os.environ.get("GOSPEL_SAINT_INDEX_MAX_AGE_DAYS", "30")) * 24 * 3600
+SUPPORTED_LANGS = ["de", "en", "es", "fr", "it", "pt"]
+
+# Any leap year: used to iterate over all 366 calendar days.
+_CALENDAR_YEAR = 2024
+
+_lock = threading.Lock()
+_indexes: Dict[str, Dict[str, Dict]] = {}
+_dirty: set = set()
+_deferred = 0
+_stats: Dict[str, int] = {"hit": 0, "stale": 0, "miss": 0, "bio_reused": 0, "stored": 0}
+
+
+def day_key(date: datetime.date) -> str:
+    return f"{date.month:02d}-{date.day:02d}"
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+def _path(lang: str) -> str:
+    return os.path.join(INDEX_DIR, f"{lang}.json")
+
+
+def _load(lang: str) -> Dict[str, Dict]:
+    """Return the in-memory index for *lang*, reading it on first use (call under _lock)."""
+    index = _indexes.get(lang)
+    if index is None:
+        try:
+            with open(_path(lang), "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        _indexes[lang] = index
+    return index
+
+
+def _save(lang: str) -> None:
+    """Write the index of *lang* atomically (call under _lock)."""
+    path = _path(lang)
+    try:
+        os.makedirs(INDEX_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=INDEX_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(_indexes[lang], f, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("saint index: cannot write %s (%s)", path, e)
+        return
+    _dirty.discard(lang)
+
+
+def flush() -> None:
+    """Write every index changed while writes were deferred."""
+    with _lock:
+        for lang in list(_dirty):
+            _save(lang)
+
+
+class deferred_writes:
+    """Hold index writes until the block ends (bulk crawls store hundreds of days).
+
+    A plain counter rather than a contextvar: the crawl stores from worker threads.
+    """
+
+    def __enter__(self):
+        global _deferred
+        with _lock:
+            _deferred += 1
+        return self
+
+    def __exit__(self, *exc):
+        global _deferred
+        with _lock:
+            _deferred -= 1
+            last = not _deferred
+        if last:
+            flush()
+        return False
+
+
+def _count(name: str, n: int = 1) -> None:
+    with _lock:
+        _stats[name] += n
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def lookup(lang: str, date: datetime.date, listing_html: str) -> Optional[List[Segment]]:
+    """Return the stored segments for *date* when the entry is still valid.
+
+    Valid means: built from this exact listing page, with the current
+    normaliser, less than MAX_AGE_S ago.  Returns None otherwise.
+    """
+    if not INDEX_ENABLED:
+        return None
+    with _lock:
+        entry = _load(lang).get(day_key(date))
+    if entry is None:
+        _count("miss")
+        return None
+    if (entry.get("listing_hash") != text_hash(listing_html)
+            or entry.get("normalizer") != normalizer_version()
+            or time.time() - entry.get("built_at", 0) >= MAX_AGE_S):
+        _count("stale")
+        return None
+    try:
+        segments = [Segment.from_dict(s["segment"]) for s in entry["saints"]]
+    except (KeyError, TypeError, ValueError):
+        _count("stale")
+        return None
+    _count("hit")
+    return segments
+
+
+def known_segments(lang: str, date: datetime.date) -> Dict[Tuple[str, str], Segment]:
+    """Segments of the stored entry for *date*, keyed by ``(name, bio_hash)``.
+
+    Used while rebuilding a day: a biography whose raw text is unchanged
+    keeps its segment instead of being normalised again.  Empty when the
+    entry was built by another normaliser version.
+    """
+    if not INDEX_ENABLED:
+        return {}
+    with _lock:
+        entry = _load(lang).get(day_key(date))
+    if not entry or entry.get("normalizer") != normalizer_version():
+        return {}
+    known = {}
+    for s in entry.get("saints", []):
+        try:
+            known[(s["name"], s["bio_hash"])] = Segment.from_dict(s["segment"])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return known
+
+
+def listing_hash(lang: str, date: datetime.date) -> Optional[str]:
+    """SHA-1 of the listing page the stored entry for *date* was built from."""
+    if not INDEX_ENABLED:
+        return None
+    with _lock:
+        entry = _load(lang).get(day_key(date))
+    return entry.get("listing_hash") if entry else None
+
+
+def note_reused(count: int) -> None:
+    if count:
+        _count("bio_reused", count)
+
+
+def store(lang: str, date: datetime.date, listing_html: str,
+          saints: List[Dict], segments: List[Segment]) -> None:
+    """Record the day built from *listing_html*.
+
+    *saints* holds one ``{"name", "detail_url", "bio_hash"}`` dict per
+    segment, in the same order.
+    """
+    if not INDEX_ENABLED:
+        return
+    entry = {
+        "listing_hash": text_hash(listing_html),
+        "normalizer": normalizer_version(),
+        "built_at": time.time(),
+        "saints": [
+            {**saint, "segment": seg.to_dict()} for saint, seg in zip(saints, segments)
+        ],
+    }
+    with _lock:
+        _load(lang)[day_key(date)] = entry
+        _dirty.add(lang)
+        if not _deferred:
+            _save(lang)
+    _count("stored")
+
+
+def index_stats() -> Dict[str, int]:
+    """Return counters: hit, stale, miss, bio_reused, stored."""
+    with _lock:
+        return dict(_stats)
+
+
+def reset_index_stats() -> None:
+    with _lock:
+        for k in _stats:
+            _stats[k] = 0
+
+
+def coverage(lang: str) -> Dict[str, int]:
+    """Count stored, current (same normaliser, not expired) and missing days for *lang*."""
+    with _lock:
+        index = dict(_load(lang))
+    now = time.time()
+    current = sum(
+        1 for e in index.values()
+        if e.get("normalizer") == normalizer_version() and now - e.get("built_at", 0) < MAX_AGE_S
+    )
+    return {"stored": len(index), "current": current, "missing": len(calendar_days()) - len(index)}
+
+
+def calendar_days() -> List[datetime.date]:
+    """All 366 calendar days, as dates of a leap year."""
+    start = datetime.date(_CALENDAR_YEAR, 1, 1)
+    return [start + datetime.timedelta(days=i) for i in range(366)]
+
+
+# ---------------------------------------------------------------------------
+# Bulk crawl
+# ---------------------------------------------------------------------------
+
+def build(lang: str, days: Optional[List[datetime.date]] = None) -> Dict[str, List[str]]:
+    """Build or refresh the index of *lang* for *days* (default: all 366).
+
+    Unchanged days cost one conditional GET each.  Returns the day keys
+    that were ``ok`` and those that ``failed``.
+    """
+    from gospel.saint_scraper import fetch_saints
+
+    ok: List[str] = []
+    failed: List[str] = []
+    with deferred_writes():
+        for day in iter_days(lambda date: fetch_saints(lang, date), days or calendar_days()):
+            if day.ok:
+                ok.append(day_key(day.date))
+            else:
+                logger.warning("saint index: %s %s failed: %s", lang, day_key(day.date), day.error)
+                failed.append(day_key(day.date))
+    return {"ok": sorted(ok), "failed": sorted(failed)}
+
+
+def parse_langs(value: str) -> List[str]:
+    if value.lower() == "all":
+        return SUPPORTED_LANGS
+    langs = [x.strip().lower() for x in value.split(",") if x.strip()]
+    invalid = [x for x in langs if x not in SUPPORTED_LANGS]
+    if invalid:
+        raise ValueError(f"Unsupported languages: {', '.join(invalid)}")
+    return langs
+
+
+def parse_days(value: str) -> List[datetime.date]:
+    days = []
+    for item in (x.strip() for x in value.split(",") if x.strip()):
+        try:
+            month, day = (int(p) for p in item.split("-"))
+            days.append(datetime.date(_CALENDAR_YEAR, month, day))
+        except ValueError:
+            raise ValueError(f"Invalid day {item!r} (expected MM-DD)")
+    return days
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build or refresh the per-language Saint of the Day index."
+    )
+    parser.add_argument("--langs", default="all", help="Comma-separated language codes or 'all'")
+    parser.add_argument("--days", default="", help="Comma-separated MM-DD days (default: all 366)")
+    parser.add_argument("--stats", action="store_true", help="Show index coverage only")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    try:
+        langs = parse_langs(args.langs)
+        days = parse_days(args.days) if args.days else None
+    except ValueError as e:
+        parser.error(str(e))
+        return
+    if not INDEX_ENABLED:
+        parser.error("the saint index is disabled (GOSPEL_SAINT_INDEX=0)")
+
+    failed_any = False
+    for lang in langs:
+        if not args.stats:
+            start = time.perf_counter()
+            result = build(lang, days)
+            failed_any = failed_any or bool(result["failed"])
+            print(f"  [{lang}] {len(result['ok'])} day(s) indexed in "
+                  f"{time.perf_counter() - start:.1f}s"
+                  + (f"; failed: {', '.join(result['failed'])}" if result["failed"] else ""))
+        cov = coverage(lang)
+        print(f"  [{lang}] {cov['stored']} stored, {cov['current']} current, "
+              f"{cov['missing']} missing -> {_path(lang)}")
+    if not args.stats:
+        print(f"Index stats: {index_stats()}")
+    if failed_any:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,12 +27,20 @@ handles this by scanning all saint detail links on the page.
 """
 
 import datetime
+import json
+import os
 import re
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-import requests
 from bs4 import BeautifulSoup
 
+from gospel import deadline, http_client, page_cache, saint_index
+from gospel.date_range import DayResult, dates_between, iter_days
+from gospel.html_parser import SubtreeFilter, make_soup
+from gospel.segments import KIND_SAINT, Segment
 from gospel.text_normalizer import html_to_plain_text, normalize_for_tts
 
 # ---------------------------------------------------------------------------
@@ -162,9 +170,76 @@ def _format_date(date: datetime.date, lang: str) -> str:
 # ---------------------------------------------------------------------------
 
 def _fetch(url: str, timeout: int = 15) -> str:
-    resp = requests.get(url, headers=_HTTP_HEADERS, timeout=timeout)
-    resp.raise_for_status()
-    return resp.content.decode("utf-8", errors="replace")
+    # Saint URLs carry no year (/MM/DD.html is reused every year), so cached
+    # pages are always revalidated with a conditional GET, never assumed fresh.
+    return page_cache.fetch_text(url, headers=_HTTP_HEADERS, timeout=timeout)
+
+
+# Bounded parallelism for detail-page fetches and slug probes.
+_DETAIL_WORKERS = int(os.environ.get("GOSPEL_SAINT_WORKERS", "4"))
+
+
+def _parallel_map(fn: Callable, args_list: List[tuple]) -> list:
+    """Return ``[fn(*args) for args in args_list]``, run on a bounded thread pool."""
+    if len(args_list) <= 1:
+        return [fn(*args) for args in args_list]
+    workers = max(1, min(_DETAIL_WORKERS, len(args_list)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="saint-detail") as pool:
+        return list(pool.map(deadline.propagate(lambda args: fn(*args)), args_list))
+
+
+# ---------------------------------------------------------------------------
+# Negative cache for slug probes
+# ---------------------------------------------------------------------------
+# A constructed detail URL that answered 404/410 is remembered per
+# (lang, MM/DD, slug) so later runs skip the HEAD request.  Entries expire
+# after _PROBE_MISS_TTL_S in case Vatican News adds the page later.
+
+_PROBE_MISS_TTL_S = 30 * 24 * 3600
+_probe_lock = threading.Lock()
+_probe_misses: Optional[Dict[str, float]] = None
+
+
+def _probe_cache_path() -> str:
+    return os.path.join(page_cache.CACHE_DIR, "saint_probe_misses.json")
+
+
+def _probe_key(lang: str, date: datetime.date, slug: str) -> str:
+    return f"{lang}/{date.month:02d}/{date.day:02d}/{slug}"
+
+
+def _load_probe_misses() -> Dict[str, float]:
+    global _probe_misses
+    if _probe_misses is None:
+        try:
+            with open(_probe_cache_path(), "r", encoding="utf-8") as f:
+                _probe_misses = json.load(f)
+        except (OSError, ValueError):
+            _probe_misses = {}
+    return _probe_misses
+
+
+def _probe_known_missing(key: str) -> bool:
+    with _probe_lock:
+        seen = _load_probe_misses().get(key)
+    return seen is not None and time.time() - seen < _PROBE_MISS_TTL_S
+
+
+def _remember_probe_miss(key: str) -> None:
+    with _probe_lock:
+        misses = _load_probe_misses()
+        now = time.time()
+        misses[key] = now
+        for k in [k for k, t in misses.items() if now - t >= _PROBE_MISS_TTL_S]:
+            del misses[k]
+        try:
+            os.makedirs(os.path.dirname(_probe_cache_path()), exist_ok=True)
+            tmp = _probe_cache_path() + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(misses, f)
+            os.replace(tmp, _probe_cache_path())
+        except OSError:
+            pass
 
 
 # ---------------------------------------------------------------------------
@@ -192,6 +267,18 @@ def _is_saint_detail_link(href: str, lang: str) -> bool:
     return bool(re.search(pattern, href))
 
 
+# Partial parse: saint sections, plus detail links outside them (German
+# listings name some saints only in an intro paragraph).
+_SECTION_SUBTREES = SubtreeFilter({"section--isStatic"})
+
+
+def _listing_subtrees(lang: str) -> SubtreeFilter:
+    slug = _LANG_CFG[lang]["detail_slug"]
+    return SubtreeFilter(
+        {"section--isStatic"}, href=rf"/{re.escape(lang)}/{re.escape(slug)}/\d{{2}}/\d{{2}}/.+\.html"
+    )
+
+
 def _collect_wrapper_html(h2_elem) -> str:
     """Collect the section__wrapper HTML for the section that contains *h2_elem*.
 
@@ -235,7 +322,7 @@ def _extract_detail_link(wrapper_html: str, lang: str) -> Optional[str]:
          Portuguese: "Ler tudo", German: "Alles lesen")
     We prioritise these canonical read-more links; fall back to any saint URL.
     """
-    soup = BeautifulSoup(wrapper_html, "html.parser")
+    soup = make_soup(wrapper_html)
     # Priority 1: explicit read-more link (class="saintReadMore")
     rm = soup.find("a", class_="saintReadMore", href=True)
     if rm:
@@ -291,9 +378,13 @@ def _try_detail_url(
     """Construct and verify a detail page URL from the saint name slug.
 
     Returns the URL if it responds with HTTP 200, otherwise None.
-    Suppresses network errors silently.
+    Suppresses network errors silently.  A 404/410 answer is remembered in
+    the negative cache and not probed again.
     """
     slug = _name_to_slug(saint_h2_text)
+    key = _probe_key(lang, date, slug)
+    if _probe_known_missing(key):
+        return None
     cfg = _LANG_CFG.get(lang, {})
     detail_slug = cfg.get("detail_slug", cfg.get("slug", ""))
     url = (
@@ -301,9 +392,11 @@ def _try_detail_url(
         f"/{date.month:02d}/{date.day:02d}/{slug}.html"
     )
     try:
-        resp = requests.head(url, headers=_HTTP_HEADERS, timeout=10, allow_redirects=True)
+        resp = http_client.head(url, headers=_HTTP_HEADERS, timeout=10, allow_redirects=True)
         if resp.status_code == 200:
             return url
+        if resp.status_code in (404, 410):
+            _remember_probe_miss(key)
     except Exception:
         pass
     return None
@@ -327,6 +420,8 @@ def _parse_saint_sections(
     """
     saints: List[Dict] = []
     seen_detail_urls: set = set()
+    # Saints whose detail URL must be probed: (index in saints, h2 text)
+    to_probe: List[Tuple[int, str]] = []
 
     # --- Pass 1: find all h2 sections that look like saints ---
     for h2 in soup.find_all("h2"):
@@ -369,10 +464,9 @@ def _parse_saint_sections(
         # If no detail link was found via HTML inspection, try constructing the URL
         # from the saint name slug (covers languages like English whose listing
         # pages have names but no biographical text or individual page links).
+        # The HEAD probes run concurrently once all h2s have been collected.
         if not detail_url and date:
-            detail_url = _try_detail_url(lang, date, h2_text)
-            if detail_url:
-                seen_detail_urls.add(detail_url)
+            to_probe.append((len(saints), h2_text))
 
         # Include all saints that passed the _is_nav_h2 filter regardless of
         # whether we found content. fetch_saints() will apply a minimal fallback
@@ -387,6 +481,13 @@ def _parse_saint_sections(
             "detail_url": detail_url,
         })
 
+    if to_probe:
+        found = _parallel_map(_try_detail_url, [(lang, date, text) for _, text in to_probe])
+        for (idx, _), url in zip(to_probe, found):
+            if url:
+                saints[idx]["detail_url"] = url
+                seen_detail_urls.add(url)
+
     # --- Pass 2: scan whole page for saint detail links not yet found ---
     # (Handles German-style pages where some saints only appear as links)
     for a in soup.find_all("a", href=True):
@@ -411,6 +512,18 @@ def _parse_saint_sections(
     return saints
 
 
+def _parse_listing(
+    raw_html: str, lang: str, date: Optional[datetime.date] = None
+) -> List[Dict]:
+    """Parse a listing page into saints (see _parse_saint_sections)."""
+    soup = make_soup(raw_html, parse_only=_listing_subtrees(lang))
+    saints = _parse_saint_sections(soup, lang, date=date)
+    if not saints and soup.parse_only is not None:
+        # Unusual layout: look for saints in the whole page.
+        saints = _parse_saint_sections(make_soup(raw_html), lang, date=date)
+    return saints
+
+
 # ---------------------------------------------------------------------------
 # Individual saint detail page parsing
 # ---------------------------------------------------------------------------
@@ -423,12 +536,21 @@ def _fetch_detail_text(url: str, lang: str) -> str:
       - Multiple biography sub-sections (h2 + section__wrapper each)
     We concatenate all non-navigation text in document order.
     """
+    raw_html = _fetch_detail_html(url)
+    return _parse_detail_text(raw_html) if raw_html else ""
+
+
+def _fetch_detail_html(url: str) -> str:
+    """Fetch a saint's individual page; empty string when it cannot be fetched."""
     try:
-        raw_html = _fetch(url)
+        return _fetch(url)
     except Exception:
         return ""
 
-    soup = BeautifulSoup(raw_html, "html.parser")
+
+def _parse_detail_text(raw_html: str) -> str:
+    """Return the biography text of an individual saint page (see _fetch_detail_text)."""
+    soup = make_soup(raw_html, parse_only=_SECTION_SUBTREES)
     text_parts: List[str] = []
 
     # Collect from section--isStatic sections (Vatican News structured layout)
@@ -457,6 +579,8 @@ def _fetch_detail_text(url: str, lang: str) -> str:
         return "\n\n".join(text_parts)
 
     # Broad fallback: collect <p> tags from the body with meaningful content
+    if soup.parse_only is not None:
+        soup = make_soup(raw_html)
     paragraphs: List[str] = []
     for p in soup.find_all("p"):
         t = p.get_text(" ", strip=True)
@@ -474,7 +598,7 @@ def fetch_saints(
     lang: str,
     date: Optional[datetime.date] = None,
     fetch_detail: bool = True,
-) -> Tuple[str, List[str]]:
+) -> Tuple[str, List[Segment]]:
     """Fetch and build podcast segments for the saint(s) of *date* in *lang*.
 
     Parameters
@@ -491,28 +615,67 @@ def fetch_saints(
     -------
     (episode_title, segments)
         *episode_title* is a human-readable title string (not yet TTS-normalised).
-        *segments* is a list of strings ready for
+        *segments* is a list of :class:`~gospel.segments.Segment` ready for
         :class:`~gospel.audio_generator.AudioGenerator.create_episode_from_segments`.
         Each segment has the saint name on the first line followed by the
         biography text on subsequent lines.
     """
     if date is None:
         date = datetime.date.today()
+    return build_saints(lang, date, _fetch(day_url(lang, date)), fetch_detail)
+
 
+def build_saints(
+    lang: str,
+    date: datetime.date,
+    listing_html: str,
+    fetch_detail: bool = True,
+    detail_pages: Optional[Dict[str, str]] = None,
+) -> Tuple[str, List[Segment]]:
+    """Build ``(episode_title, segments)`` from the listing page of *date* (see fetch_saints).
+
+    *detail_pages* maps detail-page URLs to their HTML (empty when the page
+    could not be fetched).  When given, the saint index is not consulted,
+    pages already in it are read from it, and the others are fetched and
+    added to it: the archive crawler collects the pages this way and
+    rebuilds days offline from them.
+    """
     cfg = _LANG_CFG.get(lang)
     if not cfg:
         raise ValueError(f"Language {lang!r} not supported. Choices: {sorted(_LANG_CFG)}")
-
     url = day_url(lang, date)
-    raw_html = _fetch(url)
-    soup = BeautifulSoup(raw_html, "html.parser")
 
-    saints = _parse_saint_sections(soup, lang, date=date)
+    # Build episode title
+    date_str = _format_date(date, lang)
+    page_title = cfg["page_title"]
+    episode_title = f"{page_title} - {date_str}"
+
+    # The saint calendar is annual: an unchanged listing page answers from the index.
+    if fetch_detail and detail_pages is None:
+        indexed = saint_index.lookup(lang, date, listing_html)
+        if indexed:
+            return episode_title, indexed
+
+    saints = _parse_listing(listing_html, lang, date=date)
     if not saints:
         raise ValueError(f"No saints found for {lang} on {date} (URL: {url})")
 
-    segments: List[str] = []
+    segments: List[Segment] = []
     saint_names: List[str] = []
+    index_records: List[Dict] = []
+    known = saint_index.known_segments(lang, date) if fetch_detail else {}
+    reused_count = 0
+
+    # Fetch all detail pages concurrently; assembly below stays in page order.
+    detail_texts: Dict[str, str] = {}
+    if fetch_detail:
+        urls = list(dict.fromkeys(s["detail_url"] for s in saints if s.get("detail_url")))
+        if detail_pages is None:
+            detail_texts = dict(zip(urls, _parallel_map(_fetch_detail_text, [(u, lang) for u in urls])))
+        else:
+            todo = [u for u in urls if u not in detail_pages]
+            detail_pages.update(zip(todo, _parallel_map(_fetch_detail_html, [(u,) for u in todo])))
+            detail_texts = {u: _parse_detail_text(detail_pages[u]) if detail_pages[u] else "" for u in urls}
 
     for saint in saints:
         name_raw = saint["name"]
@@ -522,10 +685,19 @@ def fetch_saints(
         # Build biography text: prefer full detail page if available
         bio_text = ""
         if fetch_detail and detail_url:
-            bio_text = _fetch_detail_text(detail_url, lang)
+            bio_text = detail_texts.get(detail_url, "")
         if not bio_text.strip():
             bio_text = brief_raw
 
+        bio_hash = saint_index.text_hash(bio_text)
+        index_records.append({"name": name_raw, "detail_url": detail_url, "bio_hash": bio_hash})
+        reused = known.get((name_raw, bio_hash))
+        if reused is not None:
+            segments.append(reused)
+            saint_names.append(reused.header)
+            reused_count += 1
+            continue
+
         # Normalise name for TTS first (used in fallback template too)
         name_tts = normalize_for_tts(name_raw, lang=lang, flatten_lines=True)
 
@@ -540,16 +712,34 @@ def fetch_saints(
 
         # Each segment: first line = saint name (wrapped in <emphasis> by audio_generator),
         # remaining lines = biography body
-        segment = name_tts + "\n" + bio_tts
-        segments.append(segment)
+        segments.append(Segment.from_marked(name_tts + "\n" + bio_tts, KIND_SAINT))
         saint_names.append(name_tts)
 
     if not segments:
         raise ValueError(f"No saints found or parsed for {lang} on {date}")
 
-    # Build episode title
-    date_str = _format_date(date, lang)
-    page_title = cfg["page_title"]
-    episode_title = f"{page_title} - {date_str}"
+    if fetch_detail:
+        saint_index.note_reused(reused_count)
+        saint_index.store(lang, date, listing_html, index_records, segments)
 
     return episode_title, segments
+
+
+def fetch_saints_range(
+    lang: str,
+    start: datetime.date,
+    end: datetime.date,
+    fetch_detail: bool = True,
+    max_workers: Optional[int] = None,
+) -> Iterator[DayResult]:
+    """Fetch the saints of every day from *start* to *end* (inclusive) concurrently.
+
+    Yields a :class:`~gospel.date_range.DayResult` per day as it completes;
+    see :meth:`VaticanHTMLScraper.fetch_segments_range`.
+    """
+    if lang not in _LANG_CFG:
+        raise ValueError(f"Language {lang!r} not supported. Choices: {sorted(_LANG_CFG)}")
+    return iter_days(
+        lambda date: fetch_saints(lang, date, fetch_detail=fetch_detail),
+        dates_between(start, end), max_workers,
+    )
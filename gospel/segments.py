@@ -0,0 +1,223 @@
+"""Typed liturgy segments.
+
+A :class:`Segment` is one spoken section of an episode — a reading, the
+gospel, the pope's comment or a saint biography.  It carries the structure
+that the audio renderers need (header, optional sub-header, body lines, quote
+ranges and semicolon pauses) so they never have to re-split the text or
+search it for in-band markers.
+
+The marked string form produced by ``text_normalizer`` remains the
+serialisation format::
+
+    __POPE__ <header>\\n<sub-header>\\n<body line>\\n...
+
+with ``__PAUSE__``, ``__QSTART__`` and ``__QEND__`` inline.
+:meth:`Segment.from_marked` parses it once; :meth:`Segment.to_marked` writes
+it back.  Renderers accept either form via :func:`as_segment`.
+"""
+
+import re
+from typing import Iterator, Optional, Union
+
+KIND_READING = "reading"
+KIND_GOSPEL = "gospel"
+KIND_POPE = "pope"
+KIND_SAINT = "saint"
+KINDS = (KIND_READING, KIND_GOSPEL, KIND_POPE, KIND_SAINT)
+
+POPE_PREFIX = "__POPE__"
+PAUSE = "__PAUSE__"
+QSTART = "__QSTART__"
+QEND = "__QEND__"
+
+_MARKER_RE = re.compile(r"__(PAUSE|QSTART|QEND)__")
+_MARKER_TOKENS = {"PAUSE": PAUSE, "QSTART": QSTART, "QEND": QEND}
+
+
+def _is_sub_header(line: str) -> bool:
+    return bool(line) and len(line) < 60 and not re.search(r"[.!?:,]", line)
+
+
+def _parse_line(line: str) -> tuple[str, tuple[tuple[int, str], ...]]:
+    """Split one marked line into clean text and ``(offset, marker)`` pairs."""
+    if "__" not in line:
+        return line, ()
+    parts: list[str] = []
+    marks: list[tuple[int, str]] = []
+    pos = 0
+    length = 0
+    for m in _MARKER_RE.finditer(line):
+        chunk = line[pos:m.start()]
+        parts.append(chunk)
+        length += len(chunk)
+        marks.append((length, _MARKER_TOKENS[m.group(1)]))
+        pos = m.end()
+    parts.append(line[pos:])
+    return "".join(parts), tuple(marks)
+
+
+class Segment:
+    """One spoken section with its structure resolved.
+
+    *lines* holds the clean text lines (markers removed): the header, then
+    the sub-header when ``has_sub_header`` is true, then the body.  *marks*
+    holds, per line, the ``(offset, marker)`` pairs in original order.
+    """
+
+    __slots__ = ("kind", "lines", "marks", "has_sub_header")
+
+    def __init__(
+        self,
+        kind: str,
+        lines: tuple[str, ...],
+        marks: tuple[tuple[tuple[int, str], ...], ...],
+        has_sub_header: bool = False,
+    ):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown segment kind: {kind!r} (expected one of {KINDS})")
+        self.kind = kind
+        self.lines = lines
+        self.marks = marks
+        self.has_sub_header = has_sub_header
+
+    # -- parsing / serialisation ---------------------------------------------
+
+    @classmethod
+    def from_marked(cls, text: str, kind: Optional[str] = None) -> "Segment":
+        """Parse a marked segment string.
+
+        A ``__POPE__`` prefix sets the kind to ``pope``; otherwise *kind*
+        (default ``reading``) is used.  The second line is a sub-header when
+        it is short and has no sentence punctuation, e.g. "Dal libro della
+        Gènesi" under "Prima Lettura".
+        """
+        is_pope = text.startswith(POPE_PREFIX)
+        body = text[len(POPE_PREFIX):].strip() if is_pope else text.strip()
+        raw_lines = re.sub(r"[ \t]*\n[ \t]*", "\n", body).split("\n")
+
+        header = raw_lines[0].strip()
+        rest_start = 1
+        has_sub_header = False
+        if len(raw_lines) >= 2:
+            if _is_sub_header(raw_lines[1].strip()):
+                has_sub_header = True
+                rest_start = 2
+
+        marked_lines = [header]
+        if has_sub_header:
+            marked_lines.append(raw_lines[1].strip())
+        marked_lines.extend(ln.strip() for ln in raw_lines[rest_start:] if ln.strip())
+
+        parsed = [_parse_line(ln) for ln in marked_lines]
+        return cls(
+            KIND_POPE if is_pope else (kind or KIND_READING),
+            tuple(p[0] for p in parsed),
+            tuple(p[1] for p in parsed),
+            has_sub_header,
+        )
+
+    def to_marked(self) -> str:
+        """Serialise back to the marked string form."""
+        lines = [self.render_line(i, PAUSE, QSTART, QEND) for i in range(len(self.lines))]
+        if not self.has_sub_header and len(lines) > 1 and _is_sub_header(lines[1]):
+            # A blank line keeps a short first body line from parsing as a sub-header.
+            lines.insert(1, "")
+        out = "\n".join(lines)
+        return f"{POPE_PREFIX} {out}" if self.kind == KIND_POPE else out
+
+    def to_dict(self) -> dict:
+        return {"kind": self.kind, "text": self.to_marked()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Segment":
+        return cls.from_marked(data["text"], kind=data.get("kind"))
+
+    # -- structure -------------------------------------------------------------
+
+    @property
+    def header(self) -> str:
+        return self.lines[0]
+
+    @property
+    def sub_header(self) -> str:
+        return self.lines[1] if self.has_sub_header else ""
+
+    @property
+    def body_start(self) -> int:
+        """Index of the first body line in :attr:`lines`."""
+        return 2 if self.has_sub_header else 1
+
+    def body_lines(self) -> range:
+        return range(self.body_start, len(self.lines))
+
+    @property
+    def quotes(self) -> tuple[tuple[int, int, int, int], ...]:
+        """Matched quote ranges as ``(start_line, start_offset, end_line, end_offset)``.
+
+        Openers and closers pair up innermost-first; unmatched markers are
+        left out.
+        """
+        open_stack: list[tuple[int, int]] = []
+        ranges = []
+        for li, line_marks in enumerate(self.marks):
+            for off, marker in line_marks:
+                if marker == QSTART:
+                    open_stack.append((li, off))
+                elif marker == QEND and open_stack:
+                    sl, so = open_stack.pop()
+                    ranges.append((sl, so, li, off))
+        return tuple(ranges)
+
+    def line_ends_with(self, index: int, marker: str) -> bool:
+        """True when the marked form of line *index* ends with *marker*."""
+        line_marks = self.marks[index]
+        return bool(line_marks) and line_marks[-1] == (len(self.lines[index]), marker)
+
+    def line_ends_with_marker(self, index: int) -> bool:
+        line_marks = self.marks[index]
+        return bool(line_marks) and line_marks[-1][0] == len(self.lines[index])
+
+    # -- rendering -------------------------------------------------------------
+
+    def iter_line(self, index: int) -> Iterator[tuple[str, Optional[str]]]:
+        """Yield ``(text, marker)`` pieces of line *index*; the last marker is None."""
+        line = self.lines[index]
+        pos = 0
+        for off, marker in self.marks[index]:
+            yield line[pos:off], marker
+            pos = off
+        yield line[pos:], None
+
+    def render_line(self, index: int, pause: str, qstart: str, qend: str) -> str:
+        """Return line *index* with each marker replaced by the given strings."""
+        if not self.marks[index]:
+            return self.lines[index]
+        repl = {PAUSE: pause, QSTART: qstart, QEND: qend}
+        return "".join(
+            text + (repl[marker] if marker else "") for text, marker in self.iter_line(index)
+        )
+
+    # -- misc ------------------------------------------------------------------
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Segment):
+            return NotImplemented
+        return (self.kind, self.lines, self.marks, self.has_sub_header) == (
+            other.kind, other.lines, other.marks, other.has_sub_header
+        )
+
+    def __str__(self) -> str:
+        return self.to_marked()
+
+    def __repr__(self) -> str:
+        return f"Segment(kind={self.kind!r}, header={self.header!r}, lines={len(self.lines)})"
+
+
+SegmentLike = Union[Segment, str]
+
+
+def as_segment(segment: SegmentLike, kind: Optional[str] = None) -> Segment:
+    """Return *segment* as a :class:`Segment`, parsing marked strings once."""
+    if isinstance(segment, Segment):
+        return segment
+    return Segment.from_marked(segment, kind=kind)
@@ -1,6 +1,14 @@
+import contextlib
+import contextvars
+import functools
+import hashlib
 import html
+import os
 import re
-from typing import Optional
+import time
+from typing import Callable, Iterator, Optional
+
+from gospel.regex_guard import GuardedRegex
 
 LANGUAGE_BIBLE_EXPANSIONS = {
     "it": {
@@ -275,17 +283,174 @@ def decode_html_entities(value: str) -> str:
     return decoded.replace("\xa0", " ")
 
 
+# Bump when the stored segment format changes in a way the hashed sources
+# below do not show (e.g. a change in gospel/content_store.py).
+SEGMENT_SCHEMA = 1
+
+# Modules whose code shapes stored segments: this normaliser, the Segment
+# model and the scrapers that build segments from the pages.
+_VERSIONED_MODULES = ("text_normalizer.py", "segments.py", "html_scraper.py", "saint_scraper.py")
+
+
+def _source_version() -> str:
+    h = hashlib.sha1(f"schema {SEGMENT_SCHEMA}".encode("ascii"))
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in _VERSIONED_MODULES:
+        h.update(b"\0" + name.encode("ascii") + b"\0")
+        try:
+            with open(os.path.join(here, name), "rb") as f:
+                h.update(f.read())
+        except OSError:
+            pass
+    return h.hexdigest()[:12]
+
+
+_VERSION = _source_version()
+
+
+def normalizer_version() -> str:
+    """Short hash of :data:`SEGMENT_SCHEMA` and the sources of the segment-building modules.
+
+    Stored normalised text (saint index, content store, archive) records it
+    and is rebuilt when the normaliser, the scrapers or the segment model
+    change.  Computed once at import.
+    """
+    return _VERSION
+
+
+# ---------------------------------------------------------------------------
+# Stage timing (opt-in instrumentation)
+# ---------------------------------------------------------------------------
+# normalize_for_tts and build_liturgy_segments report per-stage wall time and
+# the segmentation path taken to the collector active in the current context.
+# With no collector active each stage costs a single ``is None`` check.
+
+class StageCollector:
+    """Accumulates normaliser stage timings and segmentation paths."""
+
+    __slots__ = ("seconds", "calls", "paths")
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self.paths: dict[str, int] = {}
+
+    def lap(self, stage: str, start: float) -> float:
+        """Record the time since *start* under *stage*; return the new start."""
+        now = time.perf_counter()
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + (now - start)
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+        return now
+
+    def path(self, name: str) -> None:
+        """Record which segmentation path ran: line, positional or unsplit."""
+        self.paths[name] = self.paths.get(name, 0) + 1
+
+    def summary(self) -> dict:
+        return {
+            "stages_ms": {k: round(v * 1000, 3) for k, v in self.seconds.items()},
+            "calls": dict(self.calls),
+            "paths": dict(self.paths),
+        }
+
+    def format(self) -> str:
+        """One-line rendering for logs, slowest stage first."""
+        stages = sorted(self.seconds.items(), key=lambda kv: kv[1], reverse=True)
+        parts = [f"{k}={v * 1000:.1f}ms/{self.calls[k]}" for k, v in stages]
+        paths = ",".join(f"{k}:{v}" for k, v in self.paths.items()) or "-"
+        return f"paths={paths} " + " ".join(parts)
+
+
+_STAGES: contextvars.ContextVar[Optional[StageCollector]] = contextvars.ContextVar(
+    "gospel_normalizer_stages", default=None
+)
+
+
+@contextlib.contextmanager
+def collect_stages() -> Iterator[StageCollector]:
+    """Collect stage timings for normaliser calls made inside the block.
+
+    Example::
+
+        with collect_stages() as stages:
+            segments = build_liturgy_segments(description, lang="it")
+        print(stages.format())
+    """
+    collector = StageCollector()
+    token = _STAGES.set(collector)
+    try:
+        yield collector
+    finally:
+        _STAGES.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Guarded regex sites (see gospel/regex_guard.py)
+# ---------------------------------------------------------------------------
+# Each site keeps its original regex as the fast path and pairs it with an
+# exact linear-time rewrite used for oversized or adversarial input.
+
+def _strip_tags_regex(text: str) -> str:
+    text = re.sub(r"<li\b[^>]*>", "- ", text, flags=re.IGNORECASE)
+    return re.sub(r"<[^>]+>", " ", text)
+
+
+def _strip_tags_linear(text: str) -> str:
+    # Both patterns backtrack to the end of the string from every "<" that has
+    # no closing ">" after it.  No match can end past the last ">", so only
+    # the text up to it needs scanning; the tail is copied unchanged.
+    cut = text.rfind(">") + 1
+    if not cut:
+        return text
+    return _strip_tags_regex(text[:cut]) + text[cut:]
+
+
+_html_tags_site = GuardedRegex("html_tags", _strip_tags_regex, _strip_tags_linear, max_input=2000)
+
+
+def _newline_runs_regex(text: str) -> str:
+    return re.sub(r"\s*\n\s*", "\n", text)
+
+
+# A whitespace run is collapsed from its first character, so a match may only
+# start where the previous character is not whitespace.  Without the
+# lookbehind a long run of spaces with no newline is rescanned from each of
+# its positions (quadratic).
+_NEWLINE_RUN_RE = re.compile(r"(?<!\s)\s*\n\s*")
+
+
+def _newline_runs_linear(text: str) -> str:
+    return _NEWLINE_RUN_RE.sub("\n", text)
+
+
+_newline_runs_site = GuardedRegex(
+    "newline_runs", _newline_runs_regex, _newline_runs_linear, max_input=2000
+)
+
+
 def html_to_plain_text(value: str) -> str:
     if not value:
         return ""
 
+    return _finish_plain_text(_strip_html_tags(value))
+
+
+def _strip_html_tags(value: str) -> str:
+    """Replace line-ending tags with newlines and every other tag with a space."""
     text = re.sub(r"<(br|/p|/div|/li|/h[1-6])\s*/?>", "\n", value, flags=re.IGNORECASE)
-    text = re.sub(r"<li\b[^>]*>", "- ", text, flags=re.IGNORECASE)
-    text = re.sub(r"<[^>]+>", " ", text)
+    return _html_tags_site(text)
+
+
+def _finish_plain_text(text: str) -> str:
+    """The steps of html_to_plain_text that follow tag removal.
+
+    Callers that already walked a parsed tree (``html_scraper``) emit the
+    tag-stripped text directly and finish it here.
+    """
     text = decode_html_entities(text)
 
     text = re.sub(r"(\w)-\s+(\w)", r"\1\2", text)
-    text = re.sub(r"\s*\n\s*", "\n", text)
+    text = _newline_runs_site(text)
     text = re.sub(r"[ \t]+", " ", text)
     return text.strip()
 
@@ -313,6 +478,35 @@ def normalize_punctuation_for_tts(text: str, flatten_lines: bool = True) -> str:
     return normalized.strip()
 
 
+def _paren_citation_regex(text: str) -> str:
+    return re.sub(r"\([^()]{0,120}\d[^()]{0,60}\)", " ", text)
+
+
+_PAREN_GROUP_RE = re.compile(r"\(([^()]*)\)")
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _paren_citation_linear(text: str) -> str:
+    # Same result as _paren_citation_regex without the nested bounded
+    # quantifiers: a group matches when its content is at most 181 chars and
+    # has a digit within the first 121 chars and within the last 61.
+    def _repl(m: re.Match) -> str:
+        content = m.group(1)
+        n = len(content)
+        if n > 181:
+            return m.group(0)
+        lo, hi = max(0, n - 61), min(n, 121)
+        if lo < hi and _DIGIT_RE.search(content, lo, hi):
+            return " "
+        return m.group(0)
+    return _PAREN_GROUP_RE.sub(_repl, text)
+
+
+_paren_citation_site = GuardedRegex(
+    "paren_citation", _paren_citation_regex, _paren_citation_linear, max_input=20000
+)
+
+
 def _smooth_for_tts(text: str, language: str = "it", flatten_lines: bool = True) -> str:
     """Remove punctuation patterns that produce unwanted TTS pauses.
 
@@ -378,7 +572,7 @@ def _smooth_for_tts(text: str, language: str = "it", flatten_lines: bool = True)
     # "(confronta Luca 23 34)".  Removing the whole group prevents the TTS from
     # reading out chapter/verse numbers buried inside the pope's body text.
     # Pattern: any parenthetical containing at least one digit (verse number).
-    smoothed = re.sub(r"\([^()]{0,120}\d[^()]{0,60}\)", " ", smoothed)
+    smoothed = _paren_citation_site(smoothed)
     # Remaining lone parentheses — remove (they wrap metadata the reader trips over)
     smoothed = re.sub(r"[()]", "", smoothed)
     # Space-dash-space used as em-dash in Italian liturgical text (e.g. "disse - rispose")
@@ -523,8 +717,15 @@ def normalize_for_tts(
     feed_url: Optional[str] = None,
     flatten_lines: bool = True,
 ) -> str:
+    stages = _STAGES.get()
+    t = time.perf_counter() if stages else 0.0
+
     normalized = html_to_plain_text(text)
+    if stages:
+        t = stages.lap("normalize.html_to_plain_text", t)
     normalized = normalize_punctuation_for_tts(normalized, flatten_lines=flatten_lines)
+    if stages:
+        t = stages.lap("normalize.punctuation", t)
 
     language = _detect_lang(lang, feed_url)
     if language:
@@ -532,10 +733,16 @@ def normalize_for_tts(
         # so that any dot on the abbreviation is removed before TTS sees it.
         normalized = expand_cross_refs(normalized, language)
         normalized = expand_bible_refs(normalized, language)
+        if stages:
+            t = stages.lap("normalize.abbreviations", t)
         # Convert verse refs like "5, 1-13" → "5 1 a 13" to remove pause-causing comma
         normalized = normalize_verse_refs(normalized, language)
+        if stages:
+            t = stages.lap("normalize.verse_refs", t)
         # Remove punctuation patterns that cause unwanted pauses for all languages
         normalized = _smooth_for_tts(normalized, language=language, flatten_lines=flatten_lines)
+        if stages:
+            stages.lap("normalize.smooth", t)
 
     return normalized
 
@@ -655,15 +862,43 @@ def _strip_verse_refs_from_header(line: str, language: str = "it") -> str:
       "5 1 a 13"      -- simple range
       "27 30 a 28 7"  -- cross-chapter range (4 digit groups)
     """
-    range_word = re.escape(VERSE_RANGE_WORDS.get(language, "to"))
+    return _header_refs_site(line, VERSE_RANGE_WORDS.get(language, "to"))
+
+
+def _header_refs_regex(line: str, range_word: str) -> str:
     # Strip any trailing sequence of digit groups, optionally followed by a
     # range word and a second group of digit groups.  Anchored to end-of-string.
-    line = re.sub(
+    range_word = re.escape(range_word)
+    return re.sub(
         rf'\s+\d+(?:\s+\d+)*(?:\s+{range_word}\s+\d+(?:\s+\d+)*)?\s*$',
         '',
         line, flags=re.IGNORECASE,
     ).strip()
-    return line
+
+
+@functools.lru_cache(maxsize=None)
+def _reversed_header_refs_re(range_word: str) -> re.Pattern[str]:
+    rev = re.escape(range_word[::-1])
+    return re.compile(
+        rf'\s*\d+(?:\s+\d+)*(?:\s+{rev}\s+\d+(?:\s+\d+)*)?\s+', re.IGNORECASE
+    )
+
+
+def _header_refs_linear(line: str, range_word: str) -> str:
+    # The forward pattern is retried from every whitespace run, each time
+    # scanning to the end of the line: quadratic on a long run of numbers
+    # (flat feeds pass a whole section as the "header").  Matching the
+    # mirrored pattern once at the start of the reversed line finds the same
+    # longest suffix in a single pass.
+    m = _reversed_header_refs_re(range_word).match(line[::-1])
+    if m:
+        line = line[: len(line) - m.end()]
+    return line.strip()
+
+
+_header_refs_site = GuardedRegex(
+    "header_verse_refs", _header_refs_regex, _header_refs_linear, max_input=512
+)
 
 
 def _strip_section_verse_refs(section_text: str, language: str) -> str:
@@ -800,22 +1035,30 @@ def _find_inline_pos(text: str, pattern: str) -> int:
 
     Returns the character offset of the first match, or -1 if not found.
     """
-    alts = pattern.split("|")
-    # First pass: try alternatives that have NO leading ^ (already inline-safe)
-    for alt in alts:
-        if not alt.startswith("^"):
-            m = re.search(alt, text, re.IGNORECASE)
-            if m:
-                return m.start()
-    # Second pass: strip ^ from anchored alternatives and retry
-    for alt in alts:
-        if alt.startswith("^"):
-            m = re.search(alt.lstrip("^"), text, re.IGNORECASE)
-            if m:
-                return m.start()
+    for alt in _inline_alternatives(pattern):
+        m = _compile_ci(alt).search(text)
+        if m:
+            return m.start()
     return -1
 
 
+@functools.lru_cache(maxsize=None)
+def _inline_alternatives(pattern: str) -> tuple[str, ...]:
+    """Return the ``|``-separated alternatives of *pattern* in search order:
+    unanchored ones first, then the ``^``-anchored ones with the anchor removed."""
+    alts = pattern.split("|")
+    unanchored = [alt for alt in alts if not alt.startswith("^")]
+    anchored = [alt.lstrip("^") for alt in alts if alt.startswith("^")]
+    return tuple(unanchored + anchored)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_ci(pattern: str) -> re.Pattern[str]:
+    # Compiled on first use: the naive "|" split can yield fragments that are
+    # not valid on their own, which must only fail if they are ever reached.
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def _strip_attribution_tail(text: str, meta: Optional[str], lang: str) -> str:
     """Remove the normalised pope attribution from the tail of pope-body text.
 
@@ -963,7 +1206,19 @@ def _build_segments_positional(
     return segments if segments else [flat_text]
 
 
-def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
+# Segmentation mode used when build_liturgy_segments is called without one.
+#   "normalize"  normalise the whole description, then locate the sections
+#   "structure"  locate the sections on plain text, then normalise only the
+#                sections that are spoken (the psalm is never normalised)
+SEGMENT_MODES = ("normalize", "structure")
+DEFAULT_SEGMENT_MODE = os.environ.get("GOSPEL_SEGMENT_MODE", "normalize").strip().lower()
+
+
+def build_liturgy_segments(
+    description: str,
+    lang: str = "it",
+    mode: Optional[str] = None,
+) -> list[str]:
     """Split a liturgy description into spoken segments, skipping the psalm.
 
     Sections detected per language (prima lettura, optional seconda lettura,
@@ -979,7 +1234,20 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
     2. Positional fallback: used when the feed sends a single flat paragraph
        with no line-breaks.  Patterns are de-anchored (``^`` removed) so they
        can match anywhere in the text string.
+
+    *mode* (default ``GOSPEL_SEGMENT_MODE``, else ``"normalize"``) selects
+    whether step 1 runs on the fully normalised description or, with
+    ``"structure"``, on the plain text that is already computed for the pope
+    attribution, normalising only the kept sections.  Flat feeds take the
+    positional fallback in both modes.
     """
+    mode = (mode or DEFAULT_SEGMENT_MODE).lower()
+    if mode not in SEGMENT_MODES:
+        raise ValueError(f"Unknown segmentation mode: {mode!r} (expected one of {SEGMENT_MODES})")
+
+    stages = _STAGES.get()
+    t = time.perf_counter() if stages else 0.0
+
     # --- Extract pope comment attribution BEFORE normalisation strips parentheses ---
     # We use html_to_plain_text (which removes HTML tags like </p>) but NOT
     # normalize_for_tts (which would strip the parentheses we need).
@@ -1004,15 +1272,77 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
         )
         if pre_comment_attr_line_idx is not None:
             pre_comment_content_raw = ""  # body comes after the attribution line
+    if stages:
+        t = stages.lap("segments.pope_meta", t)
+
+    patterns = LITURGY_PATTERNS.get(lang)
+
+    if mode == "structure" and patterns and plain_meta_lines:
+        def normalize_lines(block: list[str]) -> list[str]:
+            text = normalize_for_tts("\n".join(block), lang=lang, flatten_lines=False)
+            return [line.strip() for line in text.splitlines() if line.strip()]
+
+        segments = _build_segments_from_lines(
+            plain_meta_lines, lang, patterns, pre_comment_meta,
+            pre_comment_content_raw, pre_comment_attr_line_idx, normalize_lines,
+        )
+        if segments:
+            if stages:
+                stages.path("structure")
+                stages.lap("segments.structure", t)
+            return segments
+        if stages:
+            t = stages.lap("segments.find_sections", t)
 
     text = normalize_for_tts(description, lang=lang, flatten_lines=False)
+    if stages:
+        t = stages.lap("segments.normalize", t)
     lines = [line.strip() for line in text.splitlines() if line.strip()]
-    if not lines:
+    if not lines or not patterns:
+        if stages:
+            stages.path("unsplit")
         return [text]
 
-    patterns = LITURGY_PATTERNS.get(lang)
-    if not patterns:
-        return [text]
+    segments = _build_segments_from_lines(
+        lines, lang, patterns, pre_comment_meta,
+        pre_comment_content_raw, pre_comment_attr_line_idx, None,
+    )
+    if segments is not None:
+        if stages:
+            stages.path("line")
+            stages.lap("segments.line", t)
+        return segments if segments else [text]
+
+    # --- Positional fallback for flat (single-paragraph) feeds ---
+    flat_text = " ".join(lines)
+    if stages:
+        t = stages.lap("segments.find_sections", t)
+        stages.path("positional")
+        segments = _build_segments_positional(flat_text, lang, patterns, pre_comment_meta)
+        stages.lap("segments.positional", t)
+        return segments
+    return _build_segments_positional(flat_text, lang, patterns, pre_comment_meta)
+
+
+def _build_segments_from_lines(
+    lines: list[str],
+    lang: str,
+    patterns: dict,
+    pre_comment_meta: Optional[str],
+    pre_comment_content_raw: str,
+    pre_comment_attr_line_idx: Optional[int],
+    normalize_lines: Optional[Callable[[list[str]], list[str]]],
+) -> Optional[list[str]]:
+    """Line-based segmentation used by :func:`build_liturgy_segments`.
+
+    *lines* are either already normalised (``normalize_lines`` is None) or
+    plain text, in which case ``normalize_lines`` is applied to each kept
+    block just before it is assembled.  Returns None when the positional
+    fallback is needed instead.
+    """
+    if normalize_lines is None:
+        def normalize_lines(block: list[str]) -> list[str]:
+            return block
 
     def find(key: str) -> int:
         return _find_line_index(lines, patterns[key])
@@ -1022,14 +1352,12 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
     idx_salmo   = find("salmo")
     idx_vangelo = find("vangelo")
 
-    # --- Positional fallback for flat (single-paragraph) feeds ---
     # Triggered when a section is not found (idx = -1) OR when prima and
     # vangelo land on the same line — which happens with flat text because an
     # unanchored alternative (e.g. "dal\s+vangelo") matches anywhere in the
     # single-line text while the prima anchor still fires at position 0.
     if idx_vangelo == -1 or (idx_prima != -1 and idx_prima >= idx_vangelo):
-        flat_text = " ".join(lines)
-        return _build_segments_positional(flat_text, lang, patterns, pre_comment_meta)
+        return None
 
     # Some feeds (e.g. ES bare-reference format) omit the section label entirely
     # and start directly with the book+verse reference line.  When the gospel IS
@@ -1039,8 +1367,8 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
 
     has_comment = pre_comment_meta is not None and idx_vangelo != -1
 
-    # When attribution is a standalone line, locate it in the normalized lines
-    # so we know where the gospel ends and where the pope body starts.
+    # When attribution is a standalone line, locate it in the lines so we know
+    # where the gospel ends and where the pope body starts.
     # We look for the line containing the pope name after idx_vangelo.
     idx_attribution = -1
     if has_comment and pre_comment_attr_line_idx is not None:
@@ -1059,7 +1387,7 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
     else:
         prima_end = idx_vangelo
     prima_section = _strip_section_verse_refs(
-        "\n".join(lines[idx_prima:prima_end]).strip(), lang
+        "\n".join(normalize_lines(lines[idx_prima:prima_end])).strip(), lang
     )
     if prima_section:
         segments.append(prima_section)
@@ -1071,7 +1399,7 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
         else:
             seconda_end = idx_vangelo
         seconda_section = _strip_section_verse_refs(
-            "\n".join(lines[idx_seconda:seconda_end]).strip(), lang
+            "\n".join(normalize_lines(lines[idx_seconda:seconda_end])).strip(), lang
         )
         if seconda_section:
             segments.append(seconda_section)
@@ -1090,7 +1418,7 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
     else:
         vangelo_end = len(lines) - 1
 
-    vangelo_text = "\n".join(lines[idx_vangelo:vangelo_end]).strip()
+    vangelo_text = "\n".join(normalize_lines(lines[idx_vangelo:vangelo_end])).strip()
     # For Italian feeds narrow to the actual gospel text after the header line
     if lang == "it":
         vangelo_match = re.search(r"dal\s+vangelo.*", vangelo_text, re.IGNORECASE | re.DOTALL)
@@ -1112,8 +1440,7 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
         # - Otherwise use the raw content extracted by _extract_pope_meta.
         if idx_attribution != -1:
             # Body is everything after the attribution line.
-            # These lines are already normalized — just join them.
-            pope_body_lines = lines[idx_attribution + 1:]
+            pope_body_lines = normalize_lines(lines[idx_attribution + 1:])
             comment_content = " ".join(pope_body_lines).strip()
         else:
             # Normalise the raw comment content for TTS
@@ -1123,7 +1450,7 @@ def build_liturgy_segments(description: str, lang: str = "it") -> list[str]:
             comment_section = f"{comment_section}\n{comment_content}"
         segments.append(comment_section)
 
-    return segments if segments else [text]
+    return segments
 
 
 # Backward-compatible alias
@@ -5,12 +5,13 @@ import subprocess
 import tempfile
 from datetime import datetime
 from gtts import gTTS
+from gospel.segments import Segment, SegmentLike
 from gospel.text_normalizer import normalize_for_tts
 
 SUPPORTED = {"en", "it", "es", "fr", "pt", "de"}
 
 
-def _clean_for_gtts(segment: str, lang: str) -> str:
+def _clean_for_gtts(segment: SegmentLike, lang: str) -> str:
     """Normalize a liturgy segment and strip SSML markers for gTTS.
 
     gTTS cannot handle __POPE__, __PAUSE__, __QSTART__, __QEND__ — it reads
@@ -20,16 +21,24 @@ def _clean_for_gtts(segment: str, lang: str) -> str:
     - Removes __QSTART__ / __QEND__ guillemet markers
     - Preserves newlines as sentence-boundary periods so section labels get
       a natural breath before the reading body begins
+
+    A :class:`~gospel.segments.Segment` is already normalised; its lines are
+    rendered directly without another normalisation pass.
     """
-    # Normalize without flattening so newlines between label/body are kept
-    normalized = normalize_for_tts(segment, lang=lang, flatten_lines=False)
-    # Strip __POPE__ prefix
-    if normalized.startswith("__POPE__"):
-        normalized = normalized[len("__POPE__"):].strip()
-    # Replace markers
-    normalized = normalized.replace("__PAUSE__", ".")
-    normalized = normalized.replace("__QSTART__", "")
-    normalized = normalized.replace("__QEND__", "")
+    if isinstance(segment, Segment):
+        normalized = "\n".join(
+            segment.render_line(i, ".", "", "") for i in range(len(segment.lines))
+        )
+    else:
+        # Normalize without flattening so newlines between label/body are kept
+        normalized = normalize_for_tts(segment, lang=lang, flatten_lines=False)
+        # Strip __POPE__ prefix
+        if normalized.startswith("__POPE__"):
+            normalized = normalized[len("__POPE__"):].strip()
+        # Replace markers
+        normalized = normalized.replace("__PAUSE__", ".")
+        normalized = normalized.replace("__QSTART__", "")
+        normalized = normalized.replace("__QEND__", "")
     # Newlines between section label and body → period for natural gTTS pause
     normalized = re.sub(r"\s*\n\s*", ". ", normalized)
     # Clean up artefacts from marker removal
@@ -44,7 +53,7 @@ def synthesize(
     lang: str = "it",
     speed: str = "normal",
     out_dir: str = None,
-    segments: list[str] | None = None,
+    segments: list[SegmentLike] | None = None,
     pause_seconds: int = 0,
     title: str = "",
 ) -> str:
@@ -56,7 +65,7 @@ def synthesize(
     base = datetime.now().strftime("%Y%m%d_%H%M%S")
     out_path = os.path.join(out_dir, f"gospel_{lang}_{base}.mp3")
 
-    normalized_segments = [_clean_for_gtts(s, lang) for s in (segments or []) if (s or "").strip()]
+    normalized_segments = [_clean_for_gtts(s, lang) for s in (segments or []) if str(s or "").strip()]
     if not normalized_segments:
         normalized_segments = [normalize_for_tts(text, lang=lang)]
 
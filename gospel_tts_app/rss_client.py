@@ -1,30 +1,30 @@
-import feedparser
-from gospel.text_normalizer import normalize_for_tts, html_to_plain_text
+from gospel import feed_cache
 
 class RSSClient:
     def __init__(self, feed_url: str):
         self.feed_url = feed_url
 
+    def _load_feed(self):
+        """Return the parsed feed, shared with every other reader of the same URL.
+
+        Returns None when the feed cannot be fetched (see gospel/feed_cache.py).
+        """
+        return feed_cache.load(self.feed_url)
+
     def _parse_entry(self, entry):
-        title = normalize_for_tts(entry.get('title', ''), feed_url=self.feed_url, flatten_lines=False)
-        summary_raw = entry.get('summary') or entry.get('description') or ''
-        # Use html_to_plain_text (without TTS smoothing) to preserve parentheses
-        # for pope-comment attribution detection in build_liturgy_segments.
-        summary = html_to_plain_text(summary_raw)
-        # RFC 2822 pub_date from RSS, fallback to empty string
-        pub_date = entry.get('published', '')
-        link = entry.get('link', '')
-        return {"title": title, "summary": summary, "pub_date": pub_date, "link": link}
+        # RFC 2822 pub_date from RSS, empty string when missing; title and
+        # summary are normalised on first access (see FeedEntry).
+        return feed_cache.FeedEntry(entry, self.feed_url, date_key="pub_date")
 
     def fetch_latest(self):
-        feed = feedparser.parse(self.feed_url)
+        feed = self._load_feed()
         if not feed or not feed.entries:
             return None
         return self._parse_entry(feed.entries[0])
 
     def fetch_all(self):
         """Return all available entries from the RSS feed, newest first."""
-        feed = feedparser.parse(self.feed_url)
+        feed = self._load_feed()
         if not feed or not feed.entries:
             return []
         return [self._parse_entry(e) for e in feed.entries]